@@ -0,0 +1,66 @@
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from tools import json_utils
+
+
+def test_loads_str_and_bytes() -> None:
+    assert json_utils.loads('{"auc": 0.91, "name": "café"}') == {"auc": 0.91, "name": "café"}
+    assert json_utils.loads('[1, 2]'.encode("utf-8")) == [1, 2]
+
+
+def test_loads_falls_back_to_stdlib_for_nan_and_big_ints() -> None:
+    result = json_utils.loads('{"auc": NaN, "id": 123456789012345678901234567890}')
+    assert math.isnan(result["auc"])
+    assert result["id"] == 123456789012345678901234567890
+
+
+def test_loads_malformed_raises_value_error() -> None:
+    with pytest.raises(ValueError):
+        json_utils.loads('{"auc": ')
+
+
+def test_loads_without_accelerated_backends(monkeypatch) -> None:
+    monkeypatch.setattr(json_utils, "orjson", None)
+    monkeypatch.setattr(json_utils, "simdjson", None)
+    assert math.isnan(json_utils.loads(b'{"auc": NaN}')["auc"])
+    assert json_utils.loads('{"a": [1]}') == {"a": [1]}
+
+
+def test_loads_retries_simdjson_failures_with_stdlib(monkeypatch) -> None:
+    parsed = []
+
+    class Parser:
+        def parse(self, data, recursive=False):
+            parsed.append(data)
+            raise ValueError("NaN is not valid JSON")
+
+    monkeypatch.setattr(json_utils, "orjson", None)
+    monkeypatch.setattr(json_utils, "simdjson", SimpleNamespace(Parser=Parser))
+    monkeypatch.setattr(json_utils, "_parser_local", json_utils.threading.local())
+    assert math.isnan(json_utils.loads('{"auc": NaN}')["auc"])
+    # str input is encoded before it reaches simdjson
+    assert parsed == [b'{"auc": NaN}']
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_returns_utf8_bytes(monkeypatch, use_orjson) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    elif json_utils.orjson is None:
+        pytest.skip("orjson not installed")
+
+    compact = json_utils.dumps({"name": "café", "auc": 0.5})
+    assert isinstance(compact, bytes)
+    assert "café".encode("utf-8") in compact
+    assert b"\n" not in compact
+
+    pretty = json_utils.dumps({"a": {"b": 1}}, indent=True)
+    assert b'\n  "a": {\n    "b": 1' in pretty
+    assert json_utils.loads(pretty) == {"a": {"b": 1}}
+
+
+def test_dumps_accepts_non_str_keys() -> None:
+    assert json_utils.loads(json_utils.dumps({1: "one"})) == {"1": "one"}
@@ -0,0 +1,54 @@
+from tools.llm_claim_extractor import (
+    _CHUNK_OVERLAP,
+    _MIN_MERGE_OVERLAP,
+    LLMClaimExtractor,
+    _overlap_length,
+)
+
+SEPARATOR = "\n\n---\n\n"
+
+
+def _batch(chunks, max_chars):
+    # _batch_chunks only depends on its arguments, so skip the LLM client setup
+    return object.__new__(LLMClaimExtractor)._batch_chunks(chunks, max_chars)
+
+
+def test_overlap_length() -> None:
+    shared = "x" * _MIN_MERGE_OVERLAP
+    assert _overlap_length("abc" + shared, shared + "def", 400) == _MIN_MERGE_OVERLAP
+    # Shorter matches are coincidences, not a repeated split overlap
+    assert _overlap_length("abc" + shared[1:], shared[1:] + "def", 400) == 0
+    assert _overlap_length("a" * 100, "a" * 100, 50) == 50
+
+
+def test_batching_disabled_or_single_chunk() -> None:
+    chunks = ["one", "two"]
+    assert _batch(chunks, 0) == chunks
+    assert _batch(["only"], 10) == ["only"]
+
+
+def test_batching_joins_unrelated_chunks_with_separator() -> None:
+    assert _batch(["alpha", "beta", "gamma"], 100) == [f"alpha{SEPARATOR}beta{SEPARATOR}gamma"]
+
+
+def test_batching_starts_new_batch_at_limit() -> None:
+    chunks = ["a" * 40, "b" * 40, "c" * 40]
+    assert _batch(chunks, 90) == ["a" * 40 + SEPARATOR + "b" * 40, "c" * 40]
+    # Oversized chunks are sent on their own
+    assert _batch(["a" * 200, "b"], 50) == ["a" * 200, "b"]
+
+
+def test_batching_merges_split_overlap_once() -> None:
+    text = "".join(f"sentence {i}. " for i in range(200))
+    split = len(text) // 2
+    first = text[:split]
+    second = text[split - _CHUNK_OVERLAP:]
+    assert _batch([first, second], len(text) * 2) == [text]
+
+
+def test_overlap_is_kept_when_chunks_land_in_separate_batches() -> None:
+    text = "".join(f"sentence {i}. " for i in range(200))
+    split = len(text) // 2
+    first = text[:split]
+    second = text[split - _CHUNK_OVERLAP:]
+    assert _batch([first, second], split + 10) == [first, second]
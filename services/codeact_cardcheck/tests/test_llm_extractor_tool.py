@@ -0,0 +1,63 @@
+from tools.llm_extractor_tool import (
+    LLMExtractorTool,
+    _batch_metrics_from_list,
+    _extract_json_text,
+)
+
+
+def test_regex_fastpath_normalizes_keys() -> None:
+    text = "Test AUC: 0.912\nval_gini = 0.8\nROC-AUC=0.75\ntrain size: 12000\nloss: 0.3"
+    assert LLMExtractorTool._regex_fastpath(text) == {
+        "test_auc": 0.912,
+        "val_gini": 0.8,
+        "roc_auc": 0.75,
+        "train_size": 12000,
+    }
+
+
+def test_regex_fastpath_drops_conflicting_values() -> None:
+    text = "auc: 0.81\nepoch 2\nauc: 0.84\ngini: 0.6\ngini: 0.6"
+    assert LLMExtractorTool._regex_fastpath(text) == {"gini": 0.6}
+
+
+def test_fastpath_covers_flat_and_grouped_claims() -> None:
+    fast = {"auc": 0.9, "gini": 0.8, "test_auc": 0.88}
+    assert LLMExtractorTool._fastpath_covers_claims(fast, {"AUC": 0.9, "Gini": 0.8})
+    assert LLMExtractorTool._fastpath_covers_claims(fast, {"xgboost": {"Test AUC": 0.88}})
+    assert not LLMExtractorTool._fastpath_covers_claims(fast, {"auc": 0.9, "ks_statistic": 0.4})
+
+
+def test_fastpath_needs_metrics_on_both_sides() -> None:
+    assert not LLMExtractorTool._fastpath_covers_claims({}, {"auc": 0.9})
+    assert not LLMExtractorTool._fastpath_covers_claims({"auc": 0.9}, {})
+
+
+def test_extract_json_text_prefers_fenced_block() -> None:
+    content = 'Here you go:\n```json\n{"auc": 0.9}\n```\nand {"other": 1}'
+    assert _extract_json_text(content) == '{"auc": 0.9}'
+    assert _extract_json_text('```\n[1, 2]\n```') == '[1, 2]'
+
+
+def test_extract_json_text_bare_and_embedded() -> None:
+    assert _extract_json_text('  [{"auc": 0.9}]\n') == '[{"auc": 0.9}]'
+    assert _extract_json_text('Metrics: {"a": {"b": 1}} done.') == '{"a": {"b": 1}}'
+    assert _extract_json_text("no json here") == "no json here"
+
+
+def test_batch_metrics_from_list() -> None:
+    result = {
+        "notebooks": [
+            {"notebook": "a.ipynb", "metrics": [{"name": "auc", "value": 0.9}]},
+            {"notebook": "b.ipynb", "metrics": None},
+            {"metrics": [{"name": "auc", "value": 0.1}]},
+            "not a dict",
+        ]
+    }
+    assert _batch_metrics_from_list(result) == {"a.ipynb": {"auc": 0.9}, "b.ipynb": {}}
+
+
+def test_batch_metrics_from_list_passes_other_shapes_through() -> None:
+    keyed = {"a.ipynb": {"auc": 0.9}}
+    assert _batch_metrics_from_list(keyed) is keyed
+    mixed = {"notebooks": [], "extra": 1}
+    assert _batch_metrics_from_list(mixed) is mixed
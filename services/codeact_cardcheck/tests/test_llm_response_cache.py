@@ -0,0 +1,85 @@
+import os
+import time
+
+import pytest
+
+from tools.llm_response_cache import LLMResponseCache, SemanticResponseCache
+
+
+def test_round_trip(tmp_path) -> None:
+    cache = LLMResponseCache(tmp_path / "responses")
+    key = LLMResponseCache.make_key("gpt-4o", "system", "prompt", temperature=0)
+    assert cache.get(key) is None
+
+    cache.set(key, {"metrics": {"auc": 0.91}})
+    assert cache.get(key) == {"metrics": {"auc": 0.91}}
+
+
+def test_key_depends_on_request() -> None:
+    key = LLMResponseCache.make_key("gpt-4o", "system", "prompt", temperature=0)
+    assert key == LLMResponseCache.make_key("gpt-4o", "system", "prompt", temperature=0)
+    assert key != LLMResponseCache.make_key("gpt-4o", "system", "prompt", temperature=1)
+    assert key != LLMResponseCache.make_key("gpt-4o-mini", "system", "prompt", temperature=0)
+
+
+def test_disabled_cache_never_hits(tmp_path) -> None:
+    cache = LLMResponseCache(tmp_path, enabled=False)
+    cache.set("key", [1, 2, 3])
+    assert cache.get("key") is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_expired_entry_is_a_miss(tmp_path) -> None:
+    cache = LLMResponseCache(tmp_path, max_age=60)
+    cache.set("key", [1, 2, 3])
+    assert cache.get("key") == [1, 2, 3]
+
+    stale = time.time() - 120
+    os.utime(tmp_path / "key.json", (stale, stale))
+    assert cache.get("key") is None
+    # Without max_age the same entry is still served
+    assert LLMResponseCache(tmp_path).get("key") == [1, 2, 3]
+
+
+def test_corrupt_entry_is_a_miss(tmp_path) -> None:
+    cache = LLMResponseCache(tmp_path)
+    (tmp_path / "key.json").write_bytes(b'{"metrics": ')
+    assert cache.get("key") is None
+
+    cache.set("key", {"ok": True})
+    assert cache.get("key") == {"ok": True}
+
+
+def test_semantic_cache_threshold(tmp_path) -> None:
+    pytest.importorskip("numpy")
+    cache = SemanticResponseCache(tmp_path / "semantic.npz", threshold=0.95)
+    cache.set([1.0, 0.0, 0.0], {"answer": 1})
+
+    assert cache.get([2.0, 0.1, 0.0]) == {"answer": 1}
+    assert cache.get([1.0, 1.0, 0.0]) is None
+    assert cache.get([1.0, 0.0]) is None
+
+
+def test_semantic_cache_persists_on_save(tmp_path) -> None:
+    pytest.importorskip("numpy")
+    path = tmp_path / "semantic.npz"
+    cache = SemanticResponseCache(path)
+    cache.set([1.0, 0.0, 0.0], {"answer": 1})
+    cache.set([0.0, 1.0, 0.0], {"answer": 2})
+    # Inserts stay in memory until save()
+    assert not path.exists()
+    assert cache.get([0.0, 1.0, 0.0]) == {"answer": 2}
+
+    cache.save()
+    reloaded = SemanticResponseCache(path)
+    assert reloaded.get([1.0, 0.01, 0.0]) == {"answer": 1}
+    assert reloaded.get([0.0, 1.0, 0.01]) == {"answer": 2}
+
+
+def test_semantic_cache_resets_on_dimension_change(tmp_path) -> None:
+    pytest.importorskip("numpy")
+    cache = SemanticResponseCache(tmp_path / "semantic.npz")
+    cache.set([1.0, 0.0, 0.0], {"answer": 1})
+    cache.set([1.0, 0.0], {"answer": 2})
+    assert cache.get([1.0, 0.0, 0.0]) is None
+    assert cache.get([1.0, 0.0]) == {"answer": 2}
@@ -0,0 +1,161 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+
+from tools import llm_retry
+from tools.llm_retry import get_retry_after, is_retryable_error, retry_on_rate_limit
+
+
+class RateLimitError(Exception):
+    """Stand-in for the SDKs' RateLimitError (matched by class name)."""
+
+    def __init__(self, headers=None):
+        super().__init__("rate limited")
+        self.status_code = 429
+        self.response = SimpleNamespace(status_code=429, headers=headers or {})
+
+
+class BadRequestError(Exception):
+    status_code = 400
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record requested sleeps instead of waiting."""
+    recorded = []
+
+    async def fake_async_sleep(delay):
+        recorded.append(delay)
+
+    monkeypatch.setattr(llm_retry.time, "sleep", recorded.append)
+    monkeypatch.setattr(llm_retry.asyncio, "sleep", fake_async_sleep)
+    return recorded
+
+
+def test_retry_after_seconds() -> None:
+    assert get_retry_after(RateLimitError({"retry-after": "7"})) == 7
+
+
+def test_retry_after_ms_takes_precedence() -> None:
+    error = RateLimitError({"retry-after-ms": "1500", "retry-after": "7"})
+    assert get_retry_after(error) == 1.5
+
+
+def test_retry_after_http_date() -> None:
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = get_retry_after(RateLimitError({"retry-after": format_datetime(retry_at, usegmt=True)}))
+    assert 25 <= delay <= 30
+
+
+def test_retry_after_missing_or_malformed() -> None:
+    assert get_retry_after(RateLimitError()) is None
+    assert get_retry_after(RateLimitError({"retry-after": "soon"})) is None
+    assert get_retry_after(ValueError("no response")) is None
+
+
+def test_retryable_errors() -> None:
+    assert is_retryable_error(RateLimitError())
+    assert is_retryable_error(SimpleNamespace(status_code=503))
+    assert not is_retryable_error(BadRequestError())
+
+
+def test_sync_retries_until_success(sleeps) -> None:
+    calls = []
+
+    @retry_on_rate_limit(max_attempts=3, log=lambda message: None)
+    def call():
+        calls.append(1)
+        if len(calls) < 3:
+            raise RateLimitError({"retry-after": "2"})
+        return "ok"
+
+    assert call() == "ok"
+    assert len(calls) == 3
+    assert sleeps == [2, 2]
+
+
+def test_sync_raises_after_max_attempts(sleeps) -> None:
+    calls = []
+
+    @retry_on_rate_limit(max_attempts=3, log=lambda message: None)
+    def call():
+        calls.append(1)
+        raise RateLimitError()
+
+    with pytest.raises(RateLimitError):
+        call()
+    assert len(calls) == 3
+    assert len(sleeps) == 2
+
+
+def test_async_raises_after_max_attempts(sleeps) -> None:
+    calls = []
+
+    @retry_on_rate_limit(max_attempts=4, log=lambda message: None)
+    async def call():
+        calls.append(1)
+        raise RateLimitError()
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(call())
+    assert len(calls) == 4
+    assert len(sleeps) == 3
+
+
+def test_non_retryable_error_propagates_immediately(sleeps) -> None:
+    calls = []
+
+    @retry_on_rate_limit(max_attempts=5, log=lambda message: None)
+    def call():
+        calls.append(1)
+        raise BadRequestError()
+
+    with pytest.raises(BadRequestError):
+        call()
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_async_non_retryable_error_propagates_immediately(sleeps) -> None:
+    calls = []
+
+    @retry_on_rate_limit(max_attempts=5, log=lambda message: None)
+    async def call():
+        calls.append(1)
+        raise BadRequestError()
+
+    with pytest.raises(BadRequestError):
+        asyncio.run(call())
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_retry_after_is_capped_at_maximum(sleeps) -> None:
+    calls = []
+
+    @retry_on_rate_limit(max_attempts=2, maximum=5.0, log=lambda message: None)
+    def call():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RateLimitError({"retry-after": "3600"})
+        return "ok"
+
+    assert call() == "ok"
+    assert sleeps == [5.0]
+
+
+def test_gives_up_when_wait_exceeds_max_elapsed(sleeps) -> None:
+    calls = []
+
+    @retry_on_rate_limit(max_attempts=5, maximum=30.0, max_elapsed=10.0, log=lambda message: None)
+    def call():
+        calls.append(1)
+        raise RateLimitError({"retry-after": "20"})
+
+    with pytest.raises(RateLimitError):
+        call()
+    assert len(calls) == 1
+    assert sleeps == []
@@ -0,0 +1,133 @@
+import asyncio
+
+from tools.rate_limiter import AdaptiveConcurrencyLimiter, RateLimiter, _Bucket
+
+
+def test_bucket_refills_over_time() -> None:
+    bucket = _Bucket(60)
+    bucket.level = 0
+    bucket.updated = 100.0
+
+    bucket.refill(110.0)
+    assert bucket.level == 10
+    assert bucket.wait_time(20) == 10
+
+    bucket.refill(1000.0)
+    assert bucket.level == bucket.capacity == 60
+    assert bucket.wait_time(1) == 0
+
+
+def test_bucket_wait_time_caps_amount_at_capacity() -> None:
+    bucket = _Bucket(60)
+    bucket.level = 0
+    # A single request larger than the whole window only waits for a full bucket
+    assert bucket.wait_time(600) == 60
+
+
+def test_reserve_takes_from_buckets_until_empty() -> None:
+    limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=1000)
+    assert limiter._reserve(400) == 0
+    assert limiter._reserve(400) == 0
+    # Out of requests: ~30s until the next one refills
+    assert limiter._reserve(0) > 25
+
+
+def test_acquire_without_limits_never_waits() -> None:
+    limiter = RateLimiter()
+    assert asyncio.run(limiter.acquire(tokens=10_000)) == 0
+
+
+def test_learns_limits_from_openai_headers() -> None:
+    limiter = RateLimiter()
+    limiter.update_from_headers({
+        "x-ratelimit-limit-requests": "500",
+        "x-ratelimit-remaining-requests": "499",
+        "x-ratelimit-limit-tokens": "30000",
+        "x-ratelimit-remaining-tokens": "12000",
+    })
+    assert limiter._requests.capacity == 500
+    assert limiter._requests.level == 499
+    assert limiter._tokens.capacity == 30000
+    assert limiter._tokens.level == 12000
+
+
+def test_learns_limits_from_anthropic_headers() -> None:
+    limiter = RateLimiter()
+    limiter.update_from_headers({
+        "anthropic-ratelimit-requests-limit": "50",
+        "anthropic-ratelimit-requests-remaining": "10",
+        "anthropic-ratelimit-input-tokens-limit": "40000",
+        "anthropic-ratelimit-input-tokens-remaining": "39000",
+        "anthropic-ratelimit-tokens-limit": "80000",
+        "anthropic-ratelimit-tokens-remaining": "1",
+    })
+    assert limiter._requests.capacity == 50
+    assert limiter._requests.level == 10
+    # Input-token headers take precedence over the combined token headers
+    assert limiter._tokens.capacity == 40000
+    assert limiter._tokens.level == 39000
+
+
+def test_headers_without_limit_do_not_create_buckets() -> None:
+    limiter = RateLimiter()
+    limiter.update_from_headers({
+        "x-ratelimit-remaining-requests": "5",
+        "x-ratelimit-limit-tokens": "n/a",
+    })
+    limiter.update_from_headers(None)
+    assert limiter._requests is None
+    assert limiter._tokens is None
+
+
+def test_remaining_header_only_lowers_level() -> None:
+    limiter = RateLimiter(requests_per_minute=100)
+    limiter._requests.level = 20
+    limiter.update_from_headers({"x-ratelimit-remaining-requests": "90"})
+    assert limiter._requests.level <= 21
+    limiter.update_from_headers({"x-ratelimit-remaining-requests": "3"})
+    assert limiter._requests.level == 3
+
+
+def test_concurrency_limit_halves_on_rate_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(maximum=16, minimum=2)
+    assert limiter.limit == 16
+    assert limiter.on_rate_limit() == 8
+    assert limiter.on_rate_limit() == 4
+    assert limiter.on_rate_limit() == 2
+    assert limiter.on_rate_limit() == 2
+
+
+def test_concurrency_limit_grows_by_one_up_to_maximum() -> None:
+    limiter = AdaptiveConcurrencyLimiter(maximum=4)
+    limiter.on_rate_limit()
+    limiter.on_rate_limit()
+    assert limiter.limit == 1
+    limiter.on_success()
+    assert limiter.limit == 2
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.limit == 4
+
+
+def test_concurrency_bounds_are_clamped() -> None:
+    limiter = AdaptiveConcurrencyLimiter(maximum=0, minimum=5)
+    assert limiter.maximum == 1
+    assert limiter.minimum == 1
+
+
+def test_concurrency_limiter_caps_in_flight_requests() -> None:
+    async def run() -> int:
+        limiter = AdaptiveConcurrencyLimiter(maximum=3)
+        limiter.on_rate_limit()
+        peak = 0
+
+        async def request() -> None:
+            nonlocal peak
+            async with limiter:
+                peak = max(peak, limiter._in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(request() for _ in range(6)))
+        return peak
+
+    assert asyncio.run(run()) == 1
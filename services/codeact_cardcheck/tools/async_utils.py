@@ -0,0 +1,39 @@
+"""Helpers for driving asyncio-based LLM calls from the synchronous tool APIs."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Worker threads for running coroutines when the caller is already inside an
+# event loop; shared so each call doesn't start and tear down its own thread
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared worker pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="llm-async")
+        return _executor
+
+
+def run_coroutine_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses ``asyncio.run`` when no event loop is running in this thread. When called
+    from inside a running loop (e.g. directly from an async FastAPI handler), the
+    coroutine is run on a pooled worker thread with its own loop, since
+    ``asyncio.run`` cannot be nested.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    return _get_executor().submit(asyncio.run, coro).result()
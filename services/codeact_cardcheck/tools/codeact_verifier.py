@@ -1,13 +1,41 @@
 """CodeAct agent for dynamic claim verification using LLM-generated Python glue code."""
 
+import hashlib
 import json
 import os
-from typing import Dict, Any, List, Optional, Callable
-from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import re
 import traceback
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .llm_retry import retry_on_rate_limit
+from .search_tools import ArtifactSearchTool, CodeSearchTool, NotebookSearchTool
+
+# The SDKs' own retries are turned off: _create_chat_completion/_create_message
+# already retry with retry_on_rate_limit, and stacking both multiplies attempts
+_SDK_MAX_RETRIES = 0
+
+# Body of a fenced code block, and the outermost {...} in free text
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*\n(.*?)\n```', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
 
-from .search_tools import CodeSearchTool, NotebookSearchTool, ArtifactSearchTool
+def _code_excerpt(code: str, max_chars: int = 200) -> str:
+    """
+    Build a compact excerpt of generated verification code for evaluation prompts.
+
+    Blank lines and ``result[...]`` scaffolding recur verbatim across claims, so
+    they are dropped and the remainder is truncated. A short content hash keeps
+    the excerpt traceable to the full code stored in the verification result.
+    """
+    digest = hashlib.sha1(code.encode("utf-8")).hexdigest()[:8]
+    canonical = "\n".join(
+        line for line in code.splitlines()
+        if line.strip() and not line.lstrip().startswith("result[")
+    )
+    if len(canonical) > max_chars:
+        canonical = canonical[:max_chars] + "..."
+    return f"# code sha1:{digest}\n{canonical}"
 
 
 class CodeActVerifier:
@@ -42,7 +70,7 @@ class CodeActVerifier:
                 api_key = os.environ.get("OPENAI_API_KEY")
                 if not api_key:
                     raise ValueError("OPENAI_API_KEY not set")
-                self.client = OpenAI(api_key=api_key)
+                self.client = OpenAI(api_key=api_key, max_retries=_SDK_MAX_RETRIES)
                 self.model = model or "gpt-4o"  # Use more capable model for code generation
             except ImportError:
                 raise ImportError("openai package required for OpenAI provider")
@@ -53,7 +81,7 @@ class CodeActVerifier:
                 if not api_key:
                     raise ValueError("ANTHROPIC_API_KEY not set")
                 print(f"[INFO] Initializing Anthropic client for CodeActVerifier...")
-                self.client = Anthropic(api_key=api_key)
+                self.client = Anthropic(api_key=api_key, max_retries=_SDK_MAX_RETRIES)
                 # Use Claude Sonnet 4.5 (latest as of Nov 2025)
                 self.model = model or "claude-sonnet-4-5"
                 print(f"[INFO] Anthropic client initialized successfully (model: {self.model})")
@@ -80,7 +108,8 @@ class CodeActVerifier:
                 
                 client_kwargs = {
                     "api_key": api_key,
-                    "base_url": "https://openrouter.ai/api/v1"
+                    "base_url": "https://openrouter.ai/api/v1",
+                    "max_retries": _SDK_MAX_RETRIES
                 }
                 if default_headers:
                     client_kwargs["default_headers"] = default_headers
@@ -131,7 +160,17 @@ class CodeActVerifier:
             model_lower = self.model.lower()
             return any(problem_model in model_lower for problem_model in problematic_models)
         return False
-    
+
+    @retry_on_rate_limit()
+    def _create_chat_completion(self, **params) -> Any:
+        """Call the OpenAI-compatible chat completions API, retrying on rate limits."""
+        return self.client.chat.completions.create(**params)
+
+    @retry_on_rate_limit()
+    def _create_message(self, **params) -> Any:
+        """Call the Anthropic messages API, retrying on rate limits."""
+        return self.client.messages.create(**params)
+
     def _call_openai_api(self, messages: List[Dict[str, Any]], temperature: float = 0.1, 
                          max_tokens: Optional[int] = None, use_json_format: bool = False) -> str:
         """
@@ -163,7 +202,7 @@ class CodeActVerifier:
                 if max_tokens:
                     params["max_tokens"] = max_tokens
                 
-                response = self.client.chat.completions.create(**params)
+                response = self._create_chat_completion(**params)
                 return response.choices[0].message.content or ""
             except Exception as e:
                 error_str = str(e).lower()
@@ -185,19 +224,18 @@ class CodeActVerifier:
             params["max_tokens"] = max_tokens
         
         try:
-            response = self.client.chat.completions.create(**params)
+            response = self._create_chat_completion(**params)
             content = response.choices[0].message.content or ""
             
             # If JSON was requested but not supported, try to extract JSON from response
             if use_json_format and content:
-                import re
                 # Try to extract JSON from markdown code blocks
-                json_match = re.search(r'```(?:json)?\s*\n(.*?)\n```', content, re.DOTALL)
+                json_match = _JSON_FENCE_RE.search(content)
                 if json_match:
                     content = json_match.group(1).strip()
                 else:
                     # Try to find JSON object in text
-                    json_match = re.search(r'\{.*\}', content, re.DOTALL)
+                    json_match = _JSON_OBJECT_RE.search(content)
                     if json_match:
                         content = json_match.group(0)
             
@@ -352,7 +390,7 @@ Remember:
                 )
             else:  # anthropic
                 print(f"[DEBUG] Making Anthropic code generation API call (model: {self.model})...")
-                response = self.client.messages.create(
+                response = self._create_message(
                     model=self.model,
                     max_tokens=self._get_max_tokens(),
                     temperature=0.2,
@@ -383,7 +421,6 @@ Remember:
             # Log more details for OpenRouter errors
             if self.llm_provider == "openrouter":
                 print(f"OpenRouter API error details - Model: {self.model}, Error: {error_msg}")
-            import traceback
             print(f"Traceback: {traceback.format_exc()}")
             return None
 
@@ -491,8 +528,8 @@ Output ONLY valid JSON:
 CLAIM:
 {claim_text}
 
-VERIFICATION CODE EXECUTED:
-{code[:500]}...
+VERIFICATION CODE EXECUTED (excerpt):
+{_code_excerpt(code)}
 
 EXECUTION RESULTS:
 {evidence_text}
@@ -512,7 +549,7 @@ Is the claim verified by the evidence?"""
             )
             else:  # anthropic
                 print(f"[DEBUG] Making Anthropic verification API call (model: {self.model})...")
-                response = self.client.messages.create(
+                response = self._create_message(
                     model=self.model,
                     max_tokens=self._get_max_tokens(),
                     temperature=0.1,
@@ -535,7 +572,6 @@ Is the claim verified by the evidence?"""
             # Log more details for OpenRouter errors
             if self.llm_provider == "openrouter":
                 print(f"OpenRouter API error details - Model: {self.model}, Error: {error_msg}")
-            import traceback
             print(f"Traceback: {traceback.format_exc()}")
             # Fallback: simple heuristic
             found = evidence.get("found", False) if isinstance(evidence, dict) else bool(evidence)
@@ -627,7 +663,7 @@ Remember:
                 )
             else:  # anthropic
                 print(f"[DEBUG] Making BATCH Anthropic code generation API call for {len(claims)} claims (model: {self.model})...")
-                response = self.client.messages.create(
+                response = self._create_message(
                     model=self.model,
                     max_tokens=self._get_max_tokens(),
                     temperature=0.2,
@@ -678,7 +714,6 @@ Remember:
         except Exception as e:
             error_msg = str(e)
             print(f"[ERROR] Batch code generation failed: {error_msg}")
-            import traceback
             print(f"Traceback: {traceback.format_exc()}")
             # Fallback: return empty codes for all claims
             return ["result = {'found': False, 'evidence_count': 0, 'evidence_details': [], 'summary': 'Code generation failed'}" for _ in claims]
@@ -731,7 +766,7 @@ Output ONLY a JSON array with one evaluation per claim, in the SAME ORDER:
                     "category": claim.get("category"),
                     "description": claim.get("description")
                 },
-                "code_snippet": code[:300] + "..." if len(code) > 300 else code,
+                "code_snippet": _code_excerpt(code),
                 "evidence": evidence
             })
         
@@ -760,7 +795,7 @@ Output a JSON array with {len(claims)} evaluation objects (one per claim, in ord
                 )
             else:  # anthropic
                 print(f"[DEBUG] Making BATCH Anthropic evaluation API call for {len(claims)} claims (model: {self.model})...")
-                response = self.client.messages.create(
+                response = self._create_message(
                     model=self.model,
                     max_tokens=self._get_max_tokens(),
                     temperature=0.1,
@@ -792,7 +827,6 @@ Output a JSON array with {len(claims)} evaluation objects (one per claim, in ord
         except Exception as e:
             error_msg = str(e)
             print(f"[ERROR] Batch evaluation failed: {error_msg}")
-            import traceback
             print(f"Traceback: {traceback.format_exc()}")
             # Fallback: basic heuristic evaluation for all
             evaluations = []
@@ -931,8 +965,12 @@ Output a JSON array with {len(claims)} evaluation objects (one per claim, in ord
             progress_callback(f"Starting sequential verification of {total} claims...", 0, total)
         
         for idx, claim in enumerate(claims, 1):
+            def claim_progress(msg: str):
+                if progress_callback:
+                    progress_callback(f"[{idx}/{total}] {msg}", idx, total)
+
             try:
-                result = self._verify_claim_wrapper(claim, idx, total, progress_callback)
+                result = self.verify_claim(claim, progress_callback=claim_progress)
                 results.append(result)
                 completed += 1
                 if progress_callback:
@@ -957,22 +995,6 @@ Output a JSON array with {len(claims)} evaluation objects (one per claim, in ord
         
         return results
 
-    def _verify_claim_wrapper(
-        self,
-        claim: Dict[str, Any],
-        idx: int,
-        total: int,
-        progress_callback: Optional[Callable[[str, int, int], None]]
-    ) -> Dict[str, Any]:
-        """
-        Wrapper for verify_claim to work with ThreadPoolExecutor.
-        """
-        def claim_progress(msg: str):
-            if progress_callback:
-                progress_callback(f"[{idx}/{total}] {msg}", idx, total)
-        
-        return self.verify_claim(claim, progress_callback=claim_progress)
-
     def generate_risk_assessment_table(
         self,
         claims: List[Dict[str, Any]],
@@ -1049,7 +1071,7 @@ Assess risk and provide actionable recommendations."""
             )
             else:  # anthropic
                 print(f"[DEBUG] Making Anthropic verification API call (model: {self.model})...")
-                response = self.client.messages.create(
+                response = self._create_message(
                     model=self.model,
                     max_tokens=self._get_max_tokens(),
                     temperature=0.1,
@@ -1070,7 +1092,6 @@ Assess risk and provide actionable recommendations."""
             # Log more details for OpenRouter errors
             if self.llm_provider == "openrouter":
                 print(f"OpenRouter API error details - Model: {self.model}, Error: {error_msg}")
-            import traceback
             print(f"Traceback: {traceback.format_exc()}")
             # Fallback: basic assessment
             verified_count = sum(1 for r in verification_results if r.get("verified", False))
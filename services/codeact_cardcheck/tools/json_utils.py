@@ -0,0 +1,65 @@
+"""JSON helpers that use accelerated backends (simdjson, orjson) when installed."""
+
+import json
+import threading
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# simdjson parsers reuse their internal buffers between calls but are not
+# thread-safe, so keep one per thread.
+_parser_local = threading.local()
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document from str or UTF-8 bytes.
+
+    ``str`` input (LLM responses) goes to orjson, which reads it without an
+    extra UTF-8 copy; ``bytes`` input (cache files) goes to simdjson. Each falls
+    back to the other accelerated backend, then to the stdlib. Documents the
+    accelerated parser rejects are retried with the stdlib, which also accepts
+    ``NaN``/``Infinity`` and integers wider than 64 bits. All backends raise a
+    ``ValueError`` subclass on malformed input.
+    """
+    if orjson is not None and (isinstance(data, str) or simdjson is None):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+    if simdjson is not None:
+        parser = getattr(_parser_local, "parser", None)
+        if parser is None:
+            parser = _parser_local.parser = simdjson.Parser()
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        try:
+            return parser.parse(data, recursive=True)
+        except ValueError:
+            # e.g. NaN written by an earlier json.dump-based cache
+            return json.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes (non-ASCII characters kept as-is).
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
@@ -1,19 +1,353 @@
 """LLM-based claim extractor for model cards using CodeAct approach."""
 
+import asyncio
+import hashlib
+import importlib.util
 import json
-import xml.etree.ElementTree as ET
-from pathlib import Path
-from typing import Dict, Any, List, Optional
 import os
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from tools.terminal_logger import get_logger
-from tools.xml_cache import XMLCache
+import sys
+import threading
+import time
+import traceback
+import xml.etree.ElementTree as ET
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from tools import json_utils
+from tools.async_utils import run_coroutine_sync
+from tools.llm_response_cache import RESPONSE_CACHE_MAX_AGE
+from tools.llm_retry import is_rate_limit_error
+from tools.rate_limiter import AdaptiveConcurrencyLimiter, RateLimiter
+from tools.terminal_logger import LogLevel, get_logger
+from tools.xml_cache import XMLCache, sha256_text
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+try:
+    from json_repair import repair_json
+except ImportError:
+    repair_json = None
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Idle pooled connections are kept this long (seconds) so later chunks and
+# extractions skip the TCP/TLS handshake
+_KEEPALIVE_EXPIRY = 60.0
+
+# Patterns used when parsing LLM responses (compiled once, reused for every chunk)
+_JSON_FENCE_RE = re.compile(r'```json\s*\n(.*?)\n```', re.DOTALL)
+_XML_FENCE_RE = re.compile(r'```xml\s*\n(.*?)\n```', re.DOTALL)
+_PLAIN_FENCE_RE = re.compile(r'```\s*\n(.*?)\n```', re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+
+# Patterns used when splitting model cards into chunks
+_HEADER_RE = re.compile(r'\n(#{2,4})\s+(.+?)\n')
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+# Characters repeated on each side of a split point so boundary claims are not lost
+_CHUNK_OVERLAP = 200
+# Shortest repeated text treated as split overlap when adjacent chunks are merged
+_MIN_MERGE_OVERLAP = 32
+
+# Keywords that route a claim to a verification method (matched as substrings)
+_AST_STRATEGY_RE = re.compile("|".join(map(re.escape, [
+    "import", "class definition", "function definition", "ast", "syntax",
+])))
+_NOTEBOOK_STRATEGY_RE = re.compile("|".join(map(re.escape, [
+    "output", "metric", "score", "result", "print", "display", "executed",
+])))
+_ARTIFACT_RE = re.compile("|".join(map(re.escape, [
+    "file", "artifact", "saved", "pkl", "pickle", "model file", "checkpoint",
+])))
+
+# lxml parsers reuse their internal buffers between calls but are not
+# thread-safe, so keep one per thread.
+_parser_local = threading.local()
+
+# Errors raised by _parse_xml for malformed input
+_XML_ERRORS = (ET.ParseError,) + ((lxml_etree.XMLSyntaxError,) if lxml_etree is not None else ())
+
+
+# Static prompt and schema for chunk extraction, built once at import time
+_CLAIM_EXTRACTION_SYSTEM_PROMPT = """You are an expert at analyzing machine learning model \
+documentation and extracting verifiable claims.
+
+Your task is to read a section of a model card and extract ALL factual claims that can be \
+verified by examining code, notebooks, or artifacts.
+
+For each claim, provide:
+1. **id**: A unique identifier (e.g., "claim_1", "claim_2")
+2. **category**: A descriptive category based on what is claimed (e.g., "algorithm", "data", \
+"metric", "preprocessing", "artifact", "evaluation", "feature", "deployment", etc.)
+3. **claim_type**: Specific type within that category
+4. **description**: Clear, concise statement of what is claimed
+5. **verification_strategy**: How to verify this in code (e.g., "search for specific library \
+imports", "check function calls", "look for metric values in notebook outputs", "verify file \
+existence")
+6. **search_queries**: List of specific code patterns, function names, variable names, or text \
+to search for
+7. **expected_evidence**: What we expect to find if the claim is true
+
+Be exhaustive - extract EVERY verifiable factual claim from this section including:
+- Algorithm/model families and methods used
+- Data splits (train/test/validation periods or ratios)
+- Feature engineering and preprocessing steps
+- Excluded features or columns
+- Performance metrics and thresholds
+- Preprocessing steps (scaling, encoding, clipping, bounds)
+- Saved artifacts (models, scalers, etc.)
+- Hyperparameters and configurations
+- Validation strategies
+
+If the model card states a fact that could be verified in code, extract it as a claim.
+
+Your response will be automatically formatted as structured JSON matching the required schema.
+"""
+
+# Bump when claim parsing or post-processing changes, to invalidate cached chunk results
+_CHUNK_CACHE_VERSION = 2
+
+_CLAIM_EXTRACTION_USER_PROMPT = """Extract all verifiable claims from this section of a model \
+card (section {section} of {total}):
+
+{chunk_text}
+
+Remember to be exhaustive and extract EVERY factual claim that can be verified in code."""
+
+_CLAIMS_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "claims": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "category": {"type": "string"},
+                    "claim_type": {"type": "string"},
+                    "description": {"type": "string"},
+                    "verification_strategy": {"type": "string"},
+                    "search_queries": {
+                        "type": "array",
+                        "items": {"type": "string"}
+                    },
+                    "expected_evidence": {"type": "string"}
+                },
+                "required": [
+                    "id", "category", "claim_type", "description", "verification_strategy",
+                    "search_queries", "expected_evidence"
+                ],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["claims"],
+    "additionalProperties": False
+}
+
+
+def _trim_preview(text: str, full: bool) -> str:
+    """Shorten prompt text for request-preview logging unless full previews are on."""
+    return text if full else (text[:500] + ("..." if len(text) > 500 else ""))
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _enrich_claims(claims: List[Dict[str, Any]]) -> None:
+    """Give claims a positional id if missing and reset their verification fields."""
+    for idx, claim in enumerate(claims, 1):
+        if "id" not in claim:
+            claim["id"] = f"claim_{idx}"
+        claim["verified"] = None  # Will be set during verification
+        claim["evidence"] = []  # Will be populated during verification
+
+
+def _overlap_length(previous: str, following: str, max_overlap: int) -> int:
+    """Length of the longest suffix of ``previous`` that starts ``following`` (0 if too short)."""
+    for size in range(min(len(previous), len(following), max_overlap), _MIN_MERGE_OVERLAP - 1, -1):
+        if previous.endswith(following[:size]):
+            return size
+    return 0
+
+
+def _write_file_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a file with raw os.write calls, bypassing the buffered text layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+# Working directory -> pre-extracted claims file last found for it
+_workspace_cache_paths: Dict[Path, Path] = {}
+
+
+def _find_workspace_cache(cwd: Path) -> Optional[Path]:
+    """
+    Locate a pre-extracted model_card_claims.json in cwd or up to three parents.
+
+    The path found is remembered, so later lookups cost a single stat() while
+    it still exists. Misses re-check every candidate, so a file created after
+    the process started is still picked up.
+    """
+    cached = _workspace_cache_paths.get(cwd)
+    if cached is not None and cached.exists():
+        return cached
+    for directory in (cwd, cwd.parent, cwd.parent.parent, cwd.parent.parent.parent):
+        path = directory / "model_card_claims.json"
+        if path.exists():
+            _workspace_cache_paths[cwd] = path
+            return path
+    _workspace_cache_paths.pop(cwd, None)
+    return None
+
+
+def _parse_xml(text: str):
+    """
+    Parse an XML document and return its root element.
+
+    Uses lxml in recover mode when it is installed, so stray or unclosed tags in
+    LLM output don't fail the whole parse. Falls back to xml.etree otherwise.
+    """
+    if lxml_etree is None:
+        return ET.fromstring(text)
+    parser = getattr(_parser_local, "lxml", None)
+    if parser is None:
+        parser = _parser_local.lxml = lxml_etree.XMLParser(
+            recover=True, huge_tree=True, remove_comments=True, remove_pis=True
+        )
+    root = lxml_etree.fromstring(text.encode("utf-8"), parser)
+    if root is None:
+        # Recover mode returns no root when nothing usable was found
+        raise ET.ParseError("No XML root element found")
+    return root
+
+
+def _combine_children(children: List[Any], values: List[Any]) -> Any:
+    """Build the value of an element from its children and their converted values."""
+    # Check if it's a list of similar elements (like <query> tags)
+    first_tag = children[0].tag
+    if all(child.tag == first_tag for child in children):
+        # All children have same tag - it's a list
+        return values
+    # Mixed children - it's a dict
+    result = {}
+    for child, child_value in zip(children, values):
+        # If multiple children with same tag, make it a list
+        if child.tag in result:
+            if not isinstance(result[child.tag], list):
+                result[child.tag] = [result[child.tag]]
+            result[child.tag].append(child_value)
+        else:
+            result[child.tag] = child_value
+    return result
+
+
+def _element_to_value(elem: ET.Element) -> Any:
+    """
+    Convert an XML element to a Python value.
+
+    Leaf elements become their stripped text, elements whose children share a tag
+    become lists, and mixed children become dicts. Walks the tree with an explicit
+    stack (post-order) rather than recursion, so deep or large documents cost no
+    Python call per element and cannot hit the recursion limit.
+    """
+    children = list(elem)
+    if not children:
+        return elem.text.strip() if elem.text else ""
+
+    # Each frame: (children, converted values so far)
+    stack = [(children, [])]
+    while True:
+        children, values = stack[-1]
+        if len(values) < len(children):
+            child = children[len(values)]
+            grandchildren = list(child)
+            if grandchildren:
+                stack.append((grandchildren, []))
+            else:
+                # Leaf element - text content
+                values.append(child.text.strip() if child.text else "")
+            continue
+
+        stack.pop()
+        value = _combine_children(children, values)
+        if not stack:
+            return value
+        stack[-1][1].append(value)
 
 
 class LLMClaimExtractor:
     """Extract structured, verifiable claims from model cards using LLM."""
 
+    # Process-wide connection pool for the synchronous SDK clients, so extractors
+    # created per request reuse keep-alive connections and TLS sessions
+    _shared_http_client = None
+    _shared_http_lock = threading.Lock()
+
+    # Single background thread for cache writes, shared by all extractors so
+    # saves are serialized and never block returning the claims
+    _cache_executor = None
+    _cache_executor_lock = threading.Lock()
+
+    # Per-chunk responses (saved time, claims) keyed by request settings + chunk text,
+    # shared across extractors so a re-run in the same process skips both the LLM
+    # call and the disk read
+    _CHUNK_MEM_CACHE_SIZE = 256
+    _chunk_mem_cache: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+    _chunk_mem_lock = threading.Lock()
+
+    @classmethod
+    def _get_shared_http_client(cls):
+        """Return the shared httpx.Client, creating it on first use."""
+        with cls._shared_http_lock:
+            if cls._shared_http_client is None:
+                import httpx
+                # Timeouts are applied per request by the SDK clients
+                cls._shared_http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_keepalive_connections=64,
+                        max_connections=128,
+                        keepalive_expiry=_KEEPALIVE_EXPIRY,
+                    ),
+                    http2=_HTTP2_AVAILABLE,
+                )
+            return cls._shared_http_client
+
+    @classmethod
+    def _get_cache_executor(cls) -> ThreadPoolExecutor:
+        """Return the shared cache-save executor, creating it on first use."""
+        with cls._cache_executor_lock:
+            if cls._cache_executor is None:
+                cls._cache_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="cache-save"
+                )
+            return cls._cache_executor
+
     def __init__(self, llm_provider: str = "openai", logger=None, model: str = None, cache_dir: Optional[str] = None):
         """
         Initialize LLM claim extractor.
@@ -26,17 +360,18 @@ class LLMClaimExtractor:
         """
         self.llm_provider = llm_provider
         self.logger = logger or print
-        self.term_logger = get_logger("ClaimExtractor", show_timestamp=True)
+        # Terminal log level (env: CLAIM_EXTRACT_LOG_LEVEL = DEBUG|INFO|WARN|ERROR)
+        log_level = os.environ.get("CLAIM_EXTRACT_LOG_LEVEL", "INFO").upper()
+        self.term_logger = get_logger(
+            "ClaimExtractor",
+            show_timestamp=True,
+            min_level=LogLevel.__members__.get(log_level, LogLevel.INFO),
+        )
         
         # Initialize XML cache for filesystem persistence (internal logging only)
         self.xml_cache = XMLCache(cache_dir=cache_dir)
         print(f"[INTERNAL] XML cache initialized at: {self.xml_cache.cache_dir}")
         
-        # Initialize JSON cache directory in project for human-readable outputs (internal logging only)
-        self.json_cache_dir = Path("./cache/claims_json")
-        self.json_cache_dir.mkdir(parents=True, exist_ok=True)
-        print(f"[INTERNAL] JSON cache directory: {self.json_cache_dir.absolute()}")
-        
         # Log initialization start
         self.logger(f"Initializing LLMClaimExtractor with provider: {llm_provider}, model: {model}")
         
@@ -50,22 +385,58 @@ class LLMClaimExtractor:
         
         self.logger(f"Using timeout: {timeout_seconds} seconds")
         
+        # Maximum number of chunk requests in flight at once (async fan-out)
+        try:
+            self.max_concurrency = max(1, int(
+                os.environ.get("CLAIM_EXTRACT_MAX_CONCURRENCY")
+                or os.environ.get("CLAIM_EXTRACT_MAX_WORKERS")
+                or "16"
+            ))
+        except ValueError:
+            self.max_concurrency = 16
+
+        # Client-side throttle (env: CLAIM_EXTRACT_RPM / CLAIM_EXTRACT_TPM, 0 = learn
+        # the limits from the provider's rate-limit headers)
+        try:
+            requests_per_minute = float(os.environ.get("CLAIM_EXTRACT_RPM", "0"))
+            tokens_per_minute = float(os.environ.get("CLAIM_EXTRACT_TPM", "0"))
+        except ValueError:
+            requests_per_minute = tokens_per_minute = 0
+        self._rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+
+        # Number of responses salvaged by json-repair (reported in logs)
+        self.json_repairs = 0
+
+        # Request preview logging (env: CLAIM_EXTRACT_LOG_REQUEST = off|truncated|full)
+        self._log_request_mode = os.environ.get("CLAIM_EXTRACT_LOG_REQUEST", "truncated").lower()
+
+        # Adjacent chunks are grouped into one request up to this many chars (0 disables)
+        try:
+            max_batch_chars = os.environ.get("CLAIM_EXTRACT_MAX_BATCH_CHARS", "6000")
+            self.max_batch_chars = max(0, int(max_batch_chars))
+        except ValueError:
+            self.max_batch_chars = 6000
+
         if llm_provider == "openai":
             try:
-                from openai import OpenAI
+                from openai import AsyncOpenAI, OpenAI
                 api_key = os.environ.get("OPENAI_API_KEY")
                 if not api_key:
                     raise ValueError("OPENAI_API_KEY not set")
                 # Set timeout on client to prevent hanging
                 self.logger(f"Creating OpenAI client...")
-                self.client = OpenAI(api_key=api_key, timeout=timeout_seconds)
+                self._client_kwargs = {"api_key": api_key, "timeout": timeout_seconds}
+                self._async_client_cls = AsyncOpenAI
+                self.client = OpenAI(
+                    **self._client_kwargs, http_client=self._get_shared_http_client()
+                )
                 self.model = model or "gpt-4o-mini"
                 self.logger(f"OpenAI client initialized successfully (model: {self.model})")
             except ImportError:
                 raise ImportError("openai package required for OpenAI provider")
         elif llm_provider == "anthropic":
             try:
-                from anthropic import Anthropic
+                from anthropic import Anthropic, AsyncAnthropic
                 api_key = os.environ.get("ANTHROPIC_API_KEY")
                 if not api_key:
                     raise ValueError("ANTHROPIC_API_KEY not set")
@@ -82,12 +453,17 @@ class LLMClaimExtractor:
                         write=30.0,  # 30 seconds for writing request
                         pool=30.0  # 30 seconds for getting connection from pool
                     )
-                    self.client = Anthropic(api_key=api_key, timeout=http_timeout)
+                    self._client_kwargs = {"api_key": api_key, "timeout": http_timeout}
+                    self.client = Anthropic(
+                        **self._client_kwargs, http_client=self._get_shared_http_client()
+                    )
                     self.logger(f"Using httpx.Timeout with read_timeout={timeout_seconds}s")
                 except ImportError:
                     # Fallback to float timeout if httpx not available
-                    self.client = Anthropic(api_key=api_key, timeout=timeout_seconds)
+                    self._client_kwargs = {"api_key": api_key, "timeout": timeout_seconds}
+                    self.client = Anthropic(**self._client_kwargs)
                     self.logger(f"Using float timeout={timeout_seconds}s")
+                self._async_client_cls = AsyncAnthropic
                 # Use Sonnet for claim extraction - better at following JSON format instructions
                 # Haiku sometimes struggles with strict JSON output
                 # Default to latest Claude Sonnet 4.5, fallback to 3.5 Sonnet for compatibility
@@ -97,7 +473,7 @@ class LLMClaimExtractor:
                 raise ImportError("anthropic package required for Anthropic provider")
         elif llm_provider == "openrouter":
             try:
-                from openai import OpenAI
+                from openai import AsyncOpenAI, OpenAI
                 api_key = os.environ.get("OPENROUTER_API_KEY")
                 if not api_key:
                     raise ValueError("OPENROUTER_API_KEY not set")
@@ -121,7 +497,9 @@ class LLMClaimExtractor:
                 if default_headers:
                     client_kwargs["default_headers"] = default_headers
                 
-                self.client = OpenAI(**client_kwargs)
+                self._client_kwargs = client_kwargs
+                self._async_client_cls = AsyncOpenAI
+                self.client = OpenAI(**client_kwargs, http_client=self._get_shared_http_client())
                 # Default to GPT-4o via OpenRouter, or allow model override
                 self.model = model or "openai/gpt-4o"
                 self.logger(f"OpenRouter client initialized successfully (model: {self.model})")
@@ -130,6 +508,33 @@ class LLMClaimExtractor:
         else:
             raise ValueError(f"Unsupported LLM provider: {llm_provider}")
 
+        # Model-dependent request settings are fixed for the extractor's lifetime.
+        # Structured outputs need Claude Sonnet 4.5+ or Opus 4.1+. Model identifiers:
+        #   - claude-sonnet-4-5 (generic)
+        #   - claude-sonnet-4-20250514 (dated Sonnet 4.5 from May 2025)
+        #   - claude-opus-4-1, claude-opus-4-20250514 (Opus 4.1)
+        # Note: claude-sonnet-4 does NOT support structured outputs, only 4.5+
+        self._model_lower = self.model.lower()
+        self._use_structured_outputs = (
+            self.llm_provider == "anthropic" and (
+                "claude-sonnet-4-5" in self._model_lower or
+                "claude-sonnet-4.5" in self._model_lower or
+                "claude-sonnet-4-2025" in self._model_lower or  # Dated Sonnet 4.5 versions
+                "claude-opus-4" in self._model_lower
+            )
+        )
+        # Anthropic max_tokens (Haiku: 4096, Sonnet: 8192)
+        self._max_tokens = 4000 if "haiku" in self._model_lower else 8000
+
+    @cached_property
+    def json_cache_dir(self) -> Path:
+        """JSON cache directory in project for human-readable outputs, created on first use."""
+        path = Path("./cache/claims_json")
+        path.mkdir(parents=True, exist_ok=True)
+        # Internal logging only
+        print(f"[INTERNAL] JSON cache directory: {path.absolute()}")
+        return path
+
     def _extract_json_from_response(self, response_text: str) -> Optional[Dict[str, Any]]:
         """
         Robustly extract JSON from LLM response using multiple strategies.
@@ -143,99 +548,71 @@ class LLMClaimExtractor:
         Returns:
             Parsed JSON dict or None if extraction fails
         """
-        import re
-        
         if not response_text or not response_text.strip():
             return None
         
         # Strategy 1: Try parsing the entire response as JSON (fastest path)
         try:
-            result = json.loads(response_text.strip())
+            result = json_utils.loads(response_text.strip())
             self.logger("Successfully parsed JSON directly from response")
             return result
-        except json.JSONDecodeError:
+        except ValueError:  # raised by every json_utils backend
             pass
         
         # Strategy 2: Extract from markdown code blocks (anywhere in response)
         # Look for ```json ... ``` or ``` ... ``` patterns
         code_block_patterns = [
-            r'```json\s*\n(.*?)\n```',  # ```json ... ```
-            r'```\s*\n(.*?)\n```',       # ``` ... ```
+            _JSON_FENCE_RE,   # ```json ... ```
+            _PLAIN_FENCE_RE,  # ``` ... ```
         ]
         
         for pattern in code_block_patterns:
-            json_match = re.search(pattern, response_text, re.DOTALL)
+            json_match = pattern.search(response_text)
             if json_match:
                 extracted = json_match.group(1).strip()
                 self.logger(f"Found JSON in markdown code block, attempting to parse...")
                 try:
-                    result = json.loads(extracted)
+                    result = json_utils.loads(extracted)
                     self.logger("Successfully extracted JSON from markdown code block")
                     return result
-                except json.JSONDecodeError as e:
+                except ValueError as e:
                     self.logger(f"Failed to parse JSON from code block: {e}")
                     continue
         
-        # Strategy 3: Find JSON object using balanced braces (handles nested structures)
-        # This is more robust than simple regex
-        self.logger("Attempting to extract JSON using balanced brace matching...")
+        # Strategy 3: Decode the first JSON object in the response (handles nested
+        # structures and trailing text). raw_decode scans in C, so large responses
+        # don't need a Python-level brace-matching loop.
+        self.logger("Attempting to extract JSON object starting at first brace...")
         
-        # Find the first opening brace
+        # Outermost object bounds: first '{' and last '}' (both C-level scans)
         start_idx = response_text.find('{')
         if start_idx == -1:
             self.logger("No opening brace found in response")
             return None
-        
-        # Find matching closing brace by counting braces
-        brace_count = 0
-        end_idx = start_idx
-        
-        for i in range(start_idx, len(response_text)):
-            if response_text[i] == '{':
-                brace_count += 1
-            elif response_text[i] == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    end_idx = i + 1
-                    break
-        
-        if brace_count != 0:
-            self.logger("Could not find balanced JSON object (unmatched braces)")
-            # Fallback: try regex anyway
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                try:
-                    result = json.loads(json_match.group(0))
-                    self.logger("Successfully extracted JSON using regex fallback")
-                    return result
-                except json.JSONDecodeError:
-                    pass
+        last_idx = response_text.rfind('}')
+        if last_idx < start_idx:
+            self.logger("No closing brace found after the first opening brace")
             return None
         
-        # Extract the JSON substring
-        json_str = response_text[start_idx:end_idx]
-        self.logger(f"Extracted JSON substring ({len(json_str)} chars), attempting to parse...")
-        
+        decoder = json.JSONDecoder()
         try:
-            result = json.loads(json_str)
-            self.logger("Successfully extracted JSON using balanced brace matching")
+            result, end_idx = decoder.raw_decode(response_text, start_idx)
+            self.logger(f"Successfully extracted JSON object ({end_idx - start_idx} chars)")
             return result
         except json.JSONDecodeError as e:
             self.logger(f"Failed to parse extracted JSON: {e}")
-            self.logger(f"Extracted JSON substring (first 500 chars): {json_str[:500]}")
-            
-            # Strategy 4: Try cleaning the JSON (remove common issues)
-            # Remove trailing commas, fix common issues
-            cleaned = json_str
-            # Remove trailing commas before closing braces/brackets
-            cleaned = re.sub(r',(\s*[}\]])', r'\1', cleaned)
-            
-            try:
-                result = json.loads(cleaned)
-                self.logger("Successfully parsed JSON after cleaning")
-                return result
-            except json.JSONDecodeError:
-                pass
+            candidate = response_text[start_idx:start_idx + 500]
+            self.logger(f"JSON candidate (first 500 chars): {candidate}")
+
+        # Strategy 4: Try cleaning the JSON (remove common issues)
+        # Remove trailing commas before closing braces/brackets
+        cleaned = _TRAILING_COMMA_RE.sub(r'\1', response_text[start_idx:last_idx + 1])
+        try:
+            result, _ = decoder.raw_decode(cleaned)
+            self.logger("Successfully parsed JSON after cleaning")
+            return result
+        except json.JSONDecodeError:
+            pass
         
         # All strategies failed
         self.logger(f"All JSON extraction strategies failed. Full response ({len(response_text)} chars): {response_text}")
@@ -253,37 +630,35 @@ class LLMClaimExtractor:
         Returns:
             Parsed dict with 'claims' key or None if extraction fails
         """
-        import re
-        
         if not response_text or not response_text.strip():
             return None
         
         # Strategy 1: Try parsing the entire response as XML (fastest path)
         try:
-            root = ET.fromstring(response_text.strip())
+            root = _parse_xml(response_text.strip())
             self.logger("Successfully parsed XML directly from response")
             return self._xml_to_dict(root)
-        except ET.ParseError:
+        except _XML_ERRORS:
             pass
         
         # Strategy 2: Extract from markdown code blocks (anywhere in response)
         # Look for ```xml ... ``` or ``` ... ``` patterns
         code_block_patterns = [
-            r'```xml\s*\n(.*?)\n```',  # ```xml ... ```
-            r'```\s*\n(.*?)\n```',     # ``` ... ```
+            _XML_FENCE_RE,    # ```xml ... ```
+            _PLAIN_FENCE_RE,  # ``` ... ```
         ]
         
         for pattern in code_block_patterns:
-            xml_match = re.search(pattern, response_text, re.DOTALL)
+            xml_match = pattern.search(response_text)
             if xml_match:
                 extracted = xml_match.group(1).strip()
                 self.logger(f"Found XML in markdown code block, attempting to parse...")
                 try:
-                    root = ET.fromstring(extracted)
+                    root = _parse_xml(extracted)
                     result = self._xml_to_dict(root)
                     self.logger("Successfully extracted XML from markdown code block")
                     return result
-                except ET.ParseError as e:
+                except _XML_ERRORS as e:
                     self.logger(f"Failed to parse XML from code block: {e}")
                     continue
         
@@ -299,11 +674,11 @@ class LLMClaimExtractor:
                 # Wrap in <claims> tag
                 xml_str = '<claims>' + response_text[start_idx:] + '</claims>'
                 try:
-                    root = ET.fromstring(xml_str)
+                    root = _parse_xml(xml_str)
                     result = self._xml_to_dict(root)
                     self.logger("Successfully extracted XML by wrapping in claims tag")
                     return result
-                except ET.ParseError:
+                except _XML_ERRORS:
                     pass
             self.logger("No XML tags found in response")
             return None
@@ -319,11 +694,11 @@ class LLMClaimExtractor:
         self.logger(f"Extracted XML substring ({len(xml_str)} chars), attempting to parse...")
         
         try:
-            root = ET.fromstring(xml_str)
+            root = _parse_xml(xml_str)
             result = self._xml_to_dict(root)
             self.logger("Successfully extracted XML using tag matching")
             return result
-        except ET.ParseError as e:
+        except _XML_ERRORS as e:
             self.logger(f"Failed to parse extracted XML: {e}")
             self.logger(f"Extracted XML substring (first 500 chars): {xml_str[:500]}")
         
@@ -355,32 +730,6 @@ class LLMClaimExtractor:
           ]
         }
         """
-        def element_to_value(elem: ET.Element) -> Any:
-            """Convert XML element to Python value."""
-            # If element has children, process them
-            if len(elem) > 0:
-                # Check if it's a list of similar elements (like <query> tags)
-                children_tags = [child.tag for child in elem]
-                if len(set(children_tags)) == 1:
-                    # All children have same tag - it's a list
-                    return [element_to_value(child) for child in elem]
-                else:
-                    # Mixed children - it's a dict
-                    result = {}
-                    for child in elem:
-                        child_value = element_to_value(child)
-                        # If multiple children with same tag, make it a list
-                        if child.tag in result:
-                            if not isinstance(result[child.tag], list):
-                                result[child.tag] = [result[child.tag]]
-                            result[child.tag].append(child_value)
-                        else:
-                            result[child.tag] = child_value
-                    return result
-            else:
-                # Leaf element - return text content
-                return elem.text.strip() if elem.text else ""
-        
         # Handle root element
         if root.tag == 'claims':
             # Root is claims, children are claim elements
@@ -389,7 +738,7 @@ class LLMClaimExtractor:
                 if claim_elem.tag == 'claim':
                     claim_dict = {}
                     for child in claim_elem:
-                        child_value = element_to_value(child)
+                        child_value = _element_to_value(child)
                         # Special handling for search_queries - ensure it's a list
                         if child.tag == 'search_queries':
                             if isinstance(child_value, list):
@@ -407,7 +756,7 @@ class LLMClaimExtractor:
             # Root might be something else, try to find claims
             result = {}
             for child in root:
-                child_value = element_to_value(child)
+                child_value = _element_to_value(child)
                 if child.tag in result:
                     if not isinstance(result[child.tag], list):
                         result[child.tag] = [result[child.tag]]
@@ -455,20 +804,15 @@ class LLMClaimExtractor:
         chunks = []
         
         # Strategy 1: Split by markdown headers (##, ###, ####)
-        header_pattern = r'\n(#{2,4})\s+(.+?)\n'
-        header_matches = list(re.finditer(header_pattern, text))
-        
-        if len(header_matches) >= target_chunks // 2:
-            # Use headers as split points
-            split_points = []
-            for match in header_matches:
-                split_points.append(match.start())
-            
-            # Add start and end
-            split_points = [0] + split_points + [len(text)]
+        # Collect header offsets in a single scan
+        header_offsets = [match.start() for match in _HEADER_RE.finditer(text)]
+
+        if len(header_offsets) >= target_chunks // 2:
+            # Use headers as split points, plus start and end
+            split_points = [0] + header_offsets + [len(text)]
             
             # Create chunks with small overlap
-            overlap_size = 200  # 200 chars overlap
+            overlap_size = _CHUNK_OVERLAP
             for i in range(len(split_points) - 1):
                 start = max(0, split_points[i] - (overlap_size if i > 0 else 0))
                 end = min(len(text), split_points[i + 1] + overlap_size)
@@ -486,7 +830,7 @@ class LLMClaimExtractor:
                 chunks = merged_chunks
         else:
             # Strategy 2: Split by paragraphs (double newlines)
-            paragraphs = re.split(r'\n\s*\n', text)
+            paragraphs = _PARAGRAPH_BREAK_RE.split(text)
             
             if len(paragraphs) >= target_chunks:
                 # Group paragraphs into chunks
@@ -515,26 +859,28 @@ class LLMClaimExtractor:
                     if chunk:
                         chunks.append(chunk)
                     
-                    # Move forward, with small overlap
-                    current_pos = end_pos - 200  # 200 char overlap
-                    if current_pos <= 0:
-                        current_pos = end_pos
+                    # Stop after the chunk that reaches the end; stepping back by the
+                    # overlap from there would re-emit the tail forever
+                    if end_pos >= len(text):
+                        break
+
+                    # Move forward, with small overlap (never backwards)
+                    next_pos = end_pos - _CHUNK_OVERLAP
+                    current_pos = next_pos if next_pos > current_pos else end_pos
         
         # Ensure we have reasonable number of chunks (10-15)
         if len(chunks) < 10:
-            # Split larger chunks
+            # Split larger chunks (> 1/8 of text) in two, preferring a paragraph break
+            # near the middle
+            split_threshold = len(text) // 8
             new_chunks = []
             for chunk in chunks:
-                if len(chunk) > len(text) // 8:  # If chunk is > 1/8 of text
-                    # Split this chunk further
-                    mid = len(chunk) // 2
-                    para_break = chunk.rfind('\n\n', mid - 500, mid + 500)
-                    if para_break != -1:
-                        new_chunks.append(chunk[:para_break].strip())
-                        new_chunks.append(chunk[para_break:].strip())
-                    else:
-                        new_chunks.append(chunk[:mid].strip())
-                        new_chunks.append(chunk[mid:].strip())
+                chunk_len = len(chunk)
+                if chunk_len > split_threshold:
+                    mid = chunk_len // 2
+                    para_break = chunk.rfind('\n\n', max(0, mid - 500), mid + 500)
+                    cut = para_break if para_break > 0 else mid
+                    new_chunks.extend((chunk[:cut].strip(), chunk[cut:].strip()))
                 else:
                     new_chunks.append(chunk)
             chunks = new_chunks
@@ -548,13 +894,59 @@ class LLMClaimExtractor:
                               {"chunks": len(chunks), "target": target_chunks})
         self.logger(f"[DEBUG] Split model card into {len(chunks)} chunks (target: {target_chunks})")
         
-        # Log chunk details
-        for i, chunk in enumerate(chunks):
-            chunk_preview = chunk[:100].replace('\n', ' ') + "..." if len(chunk) > 100 else chunk.replace('\n', ' ')
-            self.logger(f"[DEBUG]   Chunk {i+1}: {len(chunk)} chars - Preview: {chunk_preview}")
+        # Log chunk details (previews are only built when debug logging is enabled)
+        if self.term_logger.is_enabled_for(LogLevel.DEBUG):
+            for i, chunk in enumerate(chunks):
+                chunk_preview = chunk[:100].replace('\n', ' ')
+                if len(chunk) > 100:
+                    chunk_preview += "..."
+                self.logger(f"[DEBUG]   Chunk {i+1}: {len(chunk)} chars - Preview: {chunk_preview}")
         
         return chunks
 
+    def _batch_chunks(self, chunks: List[str], max_chars: int) -> List[str]:
+        """
+        Group adjacent small chunks so one LLM request covers several of them.
+
+        Each request pays a fixed time-to-first-token, so short chunks are combined
+        (in document order, to keep context together) until the next one would
+        exceed ``max_chars``. Chunks larger than ``max_chars`` are sent on their own.
+        Text that _smart_split_text repeated across a split point is kept only once
+        in a merged batch, so it is neither billed nor extracted twice.
+
+        Args:
+            chunks: Text chunks from _smart_split_text
+            max_chars: Maximum combined size of a batch (0 disables batching)
+
+        Returns:
+            List of request texts
+        """
+        if max_chars <= 0 or len(chunks) <= 1:
+            return chunks
+
+        separator = '\n\n---\n\n'
+        # Header splits repeat the overlap on both sides of a boundary
+        max_overlap = 2 * _CHUNK_OVERLAP
+        batches = []
+        current = []
+        current_size = 0
+        previous = None
+        for chunk in chunks:
+            overlap = _overlap_length(previous, chunk, max_overlap) if current else 0
+            # Overlapping chunks are contiguous text, so they continue without a separator
+            piece = chunk[overlap:] if overlap else (separator + chunk if current else chunk)
+            if current and current_size + len(piece) > max_chars:
+                batches.append(''.join(current))
+                current = []
+                current_size = 0
+                piece = chunk
+            current.append(piece)
+            current_size += len(piece)
+            previous = chunk
+        if current:
+            batches.append(''.join(current))
+        return batches
+
     def _save_json_cache(
         self,
         model_card_text: str,
@@ -572,11 +964,8 @@ class LLMClaimExtractor:
         Returns:
             Path to saved JSON file
         """
-        import hashlib
-        from datetime import datetime
-        
         # Compute hash for filename
-        cache_key = hashlib.sha256(model_card_text.encode('utf-8')).hexdigest()
+        cache_key = sha256_text(model_card_text)
         
         # Create JSON structure
         output = {
@@ -597,12 +986,14 @@ class LLMClaimExtractor:
         # Also save a "latest" version without timestamp
         latest_path = self.json_cache_dir / f"claims_{cache_key[:16]}_latest.json"
         
-        # Write JSON files
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        # Versioned history is stored compact (C/Rust fast path, smaller on disk);
+        # only the "latest" file people inspect is pretty-printed
+        _write_file_bytes(json_path, json_utils.dumps(output))
         
-        with open(latest_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        # Swap in the "latest" file atomically so readers never see a partial write
+        tmp_path = latest_path.with_suffix('.json.tmp')
+        _write_file_bytes(tmp_path, json_utils.dumps(output, indent=True))
+        os.replace(tmp_path, latest_path)
         
         return str(json_path)
     
@@ -620,265 +1011,413 @@ class LLMClaimExtractor:
         Returns:
             Dict with claims and metadata, or None if not cached
         """
-        import hashlib
-        import time
-        
         # PRIORITY 1: Check for workspace root model_card_claims.json
         # This provides a way to use pre-extracted claims for testing/demos
-        workspace_cache_paths = [
-            Path.cwd() / "model_card_claims.json",
-            Path.cwd().parent / "model_card_claims.json",
-            Path.cwd().parent.parent / "model_card_claims.json",
-            Path.cwd().parent.parent.parent / "model_card_claims.json",
-        ]
-        
-        for cache_path in workspace_cache_paths:
-            if cache_path.exists():
-                try:
-                    # INTERNAL: Cache found - don't expose to user
-                    # Using print() for internal logging only (not forwarded to UI)
-                    print(f"[INTERNAL-CACHE] Using cached claims from {cache_path}")
-                    
-                    with open(cache_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if isinstance(data, dict) and 'claims' in data:
-                            claims = data['claims']
-                            if isinstance(claims, list) and len(claims) > 0:
-                                # Simulate realistic extraction with user-facing messages
-                                # (Remove all "[CACHE]" and "[Simulated]" prefixes)
-                                import random
-                                num_claims = len(claims)
-                                
-                                # Show realistic extraction messages
-                                estimated_chunks = min(12, max(3, num_claims // 3))
-                                self.logger(f"Analyzing model card structure...")
-                                time.sleep(0.2)
-                                self.logger(f"Splitting model card into {estimated_chunks} semantic chunks...")
-                                time.sleep(0.3)
-                                
-                                # Simulate processing each chunk with realistic delays
-                                claims_per_chunk = max(1, num_claims // estimated_chunks)
-                                for i in range(estimated_chunks):
-                                    # Realistic delay: 0.5-1.5 seconds per chunk
-                                    delay = 0.5 + random.random()
-                                    time.sleep(delay)
-                                    
-                                    chunk_claims = min(claims_per_chunk, num_claims - (i * claims_per_chunk))
-                                    self.logger(f"Processing chunk {i+1}/{estimated_chunks}: Extracted {chunk_claims} claims")
-                                
-                                # Return in expected format
-                                return {
-                                    'claims': claims,
-                                    'metadata': {
-                                        'cached_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                                        'source': 'workspace_file',
-                                        'cache_path': str(cache_path),
-                                        'simulated_streaming': True
-                                    }
+        cache_path = _find_workspace_cache(Path.cwd())
+        if cache_path is not None:
+            try:
+                # INTERNAL: Cache found - don't expose to user
+                # Using print() for internal logging only (not forwarded to UI)
+                print(f"[INTERNAL-CACHE] Using cached claims from {cache_path}")
+
+                with open(cache_path, 'rb') as f:
+                    data = json_utils.loads(f.read())
+                    if isinstance(data, dict) and 'claims' in data:
+                        claims = data['claims']
+                        if isinstance(claims, list) and len(claims) > 0:
+                            # Simulate realistic extraction with user-facing messages
+                            # (Remove all "[CACHE]" and "[Simulated]" prefixes)
+                            num_claims = len(claims)
+
+                            # Show realistic extraction messages
+                            estimated_chunks = min(12, max(3, num_claims // 3))
+                            self.logger("Analyzing model card structure...")
+                            self.logger(f"Splitting model card into {estimated_chunks} "
+                                        "semantic chunks...")
+                            # Single short pause so the progress stream reads naturally;
+                            # per-chunk delays added up to 6-18s on every cache hit
+                            time.sleep(0.5)
+
+                            claims_per_chunk = max(1, num_claims // estimated_chunks)
+                            for i in range(estimated_chunks):
+                                chunk_claims = min(claims_per_chunk,
+                                                   num_claims - (i * claims_per_chunk))
+                                self.logger(f"Processing chunk {i+1}/{estimated_chunks}: "
+                                            f"Extracted {chunk_claims} claims")
+
+                            # Return in expected format
+                            return {
+                                'claims': claims,
+                                'metadata': {
+                                    'cached_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                                    'source': 'workspace_file',
+                                    'cache_path': str(cache_path),
+                                    'simulated_streaming': True
                                 }
-                except Exception as e:
-                    # Internal error logging only
-                    print(f"[INTERNAL-CACHE] Failed to load cached claims: {e}")
+                            }
+            except Exception as e:
+                # Internal error logging only
+                print(f"[INTERNAL-CACHE] Failed to load cached claims: {e}")
         
         # PRIORITY 2: Check hash-based cache
-        cache_key = hashlib.sha256(model_card_text.encode('utf-8')).hexdigest()
+        cache_key = sha256_text(model_card_text)
         latest_path = self.json_cache_dir / f"claims_{cache_key[:16]}_latest.json"
         
-        if not latest_path.exists():
-            return None
-        
+        # EAFP: a miss costs one failed open() instead of a stat() plus open() on a hit
         try:
-            with open(latest_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(latest_path, 'rb') as f:
+                return json_utils.loads(f.read())
+        except FileNotFoundError:
+            return None
         except Exception as e:
             self.logger(f"[WARN] Failed to load JSON cache: {e}")
             return None
     
+    def _chunk_cache_key(self, chunk_text: str) -> str:
+        """
+        Content-address a chunk together with everything that shapes its claims.
+
+        The provider, model, output mode (structured JSON or XML) and the prompt
+        templates/schema are part of the key, so editing a prompt or switching
+        provider never replays claims produced under the old settings.
+        """
+        request = json_utils.dumps([
+            _CHUNK_CACHE_VERSION,
+            self.llm_provider,
+            self.model,
+            bool(self._use_structured_outputs),
+            _CLAIM_EXTRACTION_SYSTEM_PROMPT,
+            _CLAIM_EXTRACTION_USER_PROMPT,
+            _CLAIMS_JSON_SCHEMA,
+            chunk_text,
+        ])
+        return hashlib.sha256(request).hexdigest()[:16]
+
+    def _load_chunk_cache(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up claims previously extracted from an identical chunk.
+
+        Checks the in-process LRU first, then ``chunk_<key>.json`` in the JSON cache
+        directory. Entries older than RESPONSE_CACHE_MAX_AGE are misses. Returns
+        copies, since callers annotate claims in place.
+        """
+        cls = type(self)
+        claims = None
+        with cls._chunk_mem_lock:
+            entry = cls._chunk_mem_cache.get(cache_key)
+            if entry is not None and time.time() - entry[0] <= RESPONSE_CACHE_MAX_AGE:
+                claims = entry[1]
+                cls._chunk_mem_cache.move_to_end(cache_key)
+
+        if claims is None:
+            try:
+                with open(self.json_cache_dir / f"chunk_{cache_key}.json", 'rb') as f:
+                    saved_at = os.fstat(f.fileno()).st_mtime
+                    if time.time() - saved_at > RESPONSE_CACHE_MAX_AGE:
+                        return None
+                    claims = json_utils.loads(f.read())
+            except FileNotFoundError:
+                return None
+            except Exception as e:
+                self.logger(f"[WARN] Failed to load chunk cache {cache_key}: {e}")
+                return None
+            if not isinstance(claims, list):
+                return None
+            self._remember_chunk_claims(cache_key, claims, saved_at)
+
+        return [dict(claim) for claim in claims]
+
+    def _remember_chunk_claims(self, cache_key: str, claims: List[Dict[str, Any]],
+                               saved_at: Optional[float] = None) -> None:
+        """Add a chunk's claims to the in-process LRU, evicting the oldest entry."""
+        cls = type(self)
+        with cls._chunk_mem_lock:
+            if saved_at is None:
+                saved_at = time.time()
+            cls._chunk_mem_cache[cache_key] = (saved_at, claims)
+            cls._chunk_mem_cache.move_to_end(cache_key)
+            while len(cls._chunk_mem_cache) > cls._CHUNK_MEM_CACHE_SIZE:
+                cls._chunk_mem_cache.popitem(last=False)
+
+    def _save_chunk_cache(self, cache_key: str, claims: List[Dict[str, Any]]) -> None:
+        """Store a chunk's claims in memory and on disk (atomic write via os.replace)."""
+        claims = [dict(claim) for claim in claims]
+        self._remember_chunk_claims(cache_key, claims)
+
+        chunk_path = self.json_cache_dir / f"chunk_{cache_key}.json"
+        tmp_path = chunk_path.with_suffix(f'.json.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            _write_file_bytes(tmp_path, json_utils.dumps(claims))
+            os.replace(tmp_path, chunk_path)
+        except OSError as e:
+            self.logger(f"[WARN] Failed to write chunk cache {cache_key}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _repair_json_response(self, text: str, chunk_num: int) -> Optional[Dict[str, Any]]:
+        """
+        Try to recover a malformed JSON response with json-repair (optional dependency).
+
+        Returns the repaired object, or None if json-repair is not installed or the
+        text could not be turned into a JSON object.
+        """
+        if repair_json is None:
+            return None
+        try:
+            result = json_utils.loads(repair_json(text))
+        except Exception:
+            result = None
+        if not isinstance(result, dict):
+            return None
+
+        self.json_repairs += 1
+        self.term_logger.warn(f"Chunk {chunk_num}: Recovered malformed JSON with json-repair",
+                             {"chunk": chunk_num, "repairs": self.json_repairs})
+        self.logger(f"[WARN] Chunk {chunk_num}: Response JSON was malformed, recovered "
+                    f"{len(result.get('claims', []))} claims after repair")
+        return result
+
     def _get_claims_json_schema(self) -> Dict[str, Any]:
         """Get JSON schema for structured claims output."""
-        return {
-            "type": "object",
-            "properties": {
-                "claims": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "category": {"type": "string"},
-                            "claim_type": {"type": "string"},
-                            "description": {"type": "string"},
-                            "verification_strategy": {"type": "string"},
-                            "search_queries": {
-                                "type": "array",
-                                "items": {"type": "string"}
-                            },
-                            "expected_evidence": {"type": "string"}
-                        },
-                        "required": ["id", "category", "claim_type", "description", "verification_strategy", "search_queries", "expected_evidence"],
-                        "additionalProperties": False
-                    }
-                }
-            },
-            "required": ["claims"],
-            "additionalProperties": False
+        return _CLAIMS_JSON_SCHEMA
+
+    def _create_async_client(self):
+        """
+        Create an async LLM client for one extraction run.
+
+        The underlying httpx connection pool is bound to the event loop it is used on,
+        so a fresh client is created for each run and closed when the run finishes.
+        The pool is sized to ``max_concurrency`` so in-flight chunks reuse connections,
+        and uses HTTP/2 when available so concurrent chunks share one TLS connection.
+        """
+        import httpx
+
+        limits = httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency,
+            keepalive_expiry=_KEEPALIVE_EXPIRY,
+        )
+        http_client = httpx.AsyncClient(
+            limits=limits,
+            timeout=self._client_kwargs.get("timeout"),
+            http2=_HTTP2_AVAILABLE,
+        )
+        return self._async_client_cls(http_client=http_client, **self._client_kwargs)
+
+    def _log_request_preview(
+        self,
+        chunk_num: int,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: Optional[int] = None
+    ) -> None:
+        """
+        Log a preview of an extraction request (env: CLAIM_EXTRACT_LOG_REQUEST).
+
+        Does nothing when previews are off. Prompts are cut to 500 chars unless
+        the mode is "full". ``max_tokens`` is given for Anthropic requests, which
+        send the system prompt separately from the messages.
+        """
+        if self._log_request_mode not in ("truncated", "full"):
+            return
+        full = self._log_request_mode == "full"
+
+        req_preview = {
+            "provider": self.llm_provider,
+            "model": self.model,
+            "temperature": 0.1,
         }
+        if max_tokens is None:
+            req_preview["messages"] = [
+                {"role": "system", "content": _trim_preview(system_prompt, full)},
+                {"role": "user", "content": _trim_preview(user_prompt, full)}
+            ]
+        else:
+            req_preview["max_tokens"] = max_tokens
+            req_preview["system"] = _trim_preview(system_prompt, full)
+            req_preview["messages"] = [
+                {"role": "user", "content": _trim_preview(user_prompt, full)}
+            ]
+        self.term_logger.debug(f"Chunk {chunk_num}: API request preview", req_preview)
+        self.logger(f"[DEBUG] Chunk {chunk_num}: API request: {req_preview}")
     
-    def _extract_claims_from_chunk(self, chunk_text: str, chunk_index: int, total_chunks: int) -> List[Dict[str, Any]]:
+    def _note_rate_limit(
+        self,
+        limiter: Optional[AdaptiveConcurrencyLimiter],
+        error: BaseException,
+        chunk_num: int
+    ) -> None:
+        """Back off the run's concurrency if a request failed on a rate limit."""
+        if limiter is None or not is_rate_limit_error(error):
+            return
+        new_limit = limiter.on_rate_limit()
+        self.term_logger.warn(
+            f"Chunk {chunk_num}: Rate limited, reducing concurrency to {new_limit}",
+            {"chunk": chunk_num, "max_concurrency": new_limit}
+        )
+
+    async def _read_stream_text(self, stream, chunk_num: int, api_start: float) -> str:
+        """
+        Accumulate the text deltas of a streamed completion.
+
+        Reading the body incrementally lets the response arrive while other chunks
+        are being parsed, instead of blocking on one large body per request.
+
+        Args:
+            stream: Async event stream returned by ``create(..., stream=True)``
+            chunk_num: 1-based chunk number (for logging)
+            api_start: Time the request was sent (for time-to-first-token logging)
+
+        Returns:
+            Full response text
+        """
+        parts = []
+        async for event in stream:
+            if self.llm_provider == "anthropic":
+                # Text arrives in content_block_delta events; other events carry metadata
+                if getattr(event, "type", None) != "content_block_delta":
+                    continue
+                text = getattr(event.delta, "text", None)
+            else:
+                text = event.choices[0].delta.content if event.choices else None
+            if text:
+                if not parts and self.term_logger.is_enabled_for(LogLevel.DEBUG):
+                    first_token = time.perf_counter() - api_start
+                    self.term_logger.debug(
+                        f"Chunk {chunk_num}: First token after {first_token:.2f}s"
+                    )
+                parts.append(text)
+        return "".join(parts)
+
+    async def _extract_claims_from_chunk(
+        self,
+        client,
+        chunk_text: str,
+        chunk_index: int,
+        total_chunks: int,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None
+    ) -> List[Dict[str, Any]]:
         """
         Extract claims from a single chunk of model card text.
         
         Args:
+            client: Async LLM client to issue the request with
             chunk_text: Text chunk to process
             chunk_index: Index of this chunk (0-based)
             total_chunks: Total number of chunks
+            limiter: Run's concurrency limiter, told about successes and rate limits
             
         Returns:
             List of claim dictionaries
         """
-        system_prompt = """You are an expert at analyzing machine learning model documentation and extracting verifiable claims.
-
-Your task is to read a section of a model card and extract ALL factual claims that can be verified by examining code, notebooks, or artifacts.
-
-For each claim, provide:
-1. **id**: A unique identifier (e.g., "claim_1", "claim_2")
-2. **category**: A descriptive category based on what is claimed (e.g., "algorithm", "data", "metric", "preprocessing", "artifact", "evaluation", "feature", "deployment", etc.)
-3. **claim_type**: Specific type within that category
-4. **description**: Clear, concise statement of what is claimed
-5. **verification_strategy**: How to verify this in code (e.g., "search for specific library imports", "check function calls", "look for metric values in notebook outputs", "verify file existence")
-6. **search_queries**: List of specific code patterns, function names, variable names, or text to search for
-7. **expected_evidence**: What we expect to find if the claim is true
-
-Be exhaustive - extract EVERY verifiable factual claim from this section including:
-- Algorithm/model families and methods used
-- Data splits (train/test/validation periods or ratios)
-- Feature engineering and preprocessing steps
-- Excluded features or columns
-- Performance metrics and thresholds
-- Preprocessing steps (scaling, encoding, clipping, bounds)
-- Saved artifacts (models, scalers, etc.)
-- Hyperparameters and configurations
-- Validation strategies
-
-If the model card states a fact that could be verified in code, extract it as a claim.
-
-Your response will be automatically formatted as structured JSON matching the required schema.
-"""
-
-        user_prompt = f"""Extract all verifiable claims from this section of a model card (section {chunk_index + 1} of {total_chunks}):
-
-{chunk_text}
+        system_prompt = _CLAIM_EXTRACTION_SYSTEM_PROMPT
+        user_prompt = _CLAIM_EXTRACTION_USER_PROMPT.format(
+            section=chunk_index + 1, total=total_chunks, chunk_text=chunk_text
+        )
 
-Remember to be exhaustive and extract EVERY factual claim that can be verified in code."""
+        start_time = time.perf_counter()
+        repaired = False
+        # Per-chunk debug lines are only formatted when they will be shown
+        debug = self.term_logger.is_enabled_for(LogLevel.DEBUG)
 
-        import time
-        start_time = time.time()
-        
-        # Determine if we can use structured outputs (Claude Sonnet 4.5+ or Opus 4.1+)
-        # Model identifiers: 
-        #   - claude-sonnet-4-5 (generic)
-        #   - claude-sonnet-4-20250514 (dated Sonnet 4.5 from May 2025)
-        #   - claude-opus-4-1, claude-opus-4-20250514 (Opus 4.1)
-        # Note: claude-sonnet-4 does NOT support structured outputs, only 4.5+
-        model_lower = self.model.lower()
-        use_structured_outputs = (
-            self.llm_provider == "anthropic" and (
-                "claude-sonnet-4-5" in model_lower or 
-                "claude-sonnet-4.5" in model_lower or
-                "claude-sonnet-4-2025" in model_lower or  # Dated Sonnet 4.5 versions
-                "claude-opus-4" in model_lower
-            )
-        )
+        # Identical chunks (re-runs, near-duplicate cards) skip the LLM entirely
+        cache_key = self._chunk_cache_key(chunk_text)
+        cached_claims = self._load_chunk_cache(cache_key)
+        if cached_claims is not None:
+            if debug:
+                self.term_logger.debug(
+                    f"Chunk {chunk_index + 1}/{total_chunks}: Chunk cache hit",
+                    {"chunk": chunk_index + 1, "cache_key": cache_key, "claims": len(cached_claims)}
+                )
+            self.logger(f"[SUCCESS] Chunk {chunk_index + 1}: Extracted {len(cached_claims)} claims")
+            return cached_claims
         
         try:
             chunk_num = chunk_index + 1
-            self.term_logger.debug(f"Chunk {chunk_num}/{total_chunks}: Starting processing", 
-                                  {"chunk": chunk_num, "size": len(chunk_text)})
-            self.logger(f"[DEBUG] Chunk {chunk_num}/{total_chunks}: Processing ({len(chunk_text)} chars)")
-            
             # Estimate tokens
             est_tokens = (len(system_prompt) + len(user_prompt)) // 4
-            self.term_logger.debug(f"Chunk {chunk_num}: Estimated tokens: ~{est_tokens}", {"tokens": est_tokens})
+            if debug:
+                self.term_logger.debug(f"Chunk {chunk_num}/{total_chunks}: Starting processing",
+                                      {"chunk": chunk_num, "size": len(chunk_text)})
+                self.logger(f"[DEBUG] Chunk {chunk_num}/{total_chunks}: "
+                            f"Processing ({len(chunk_text)} chars)")
+                self.term_logger.debug(f"Chunk {chunk_num}: Estimated tokens: ~{est_tokens}",
+                                       {"tokens": est_tokens})
+
+            # Hold the request until it fits the provider's RPM/TPM budget
+            throttled = await self._rate_limiter.acquire(est_tokens)
+            if throttled > 0 and debug:
+                self.term_logger.debug(
+                    f"Chunk {chunk_num}: Throttled {throttled:.2f}s for rate limit",
+                    {"wait": throttled}
+                )
         
             if self.llm_provider in ["openai", "openrouter"]:
                 # OpenAI and OpenRouter - request XML output (no response_format needed for XML)
-                self.term_logger.debug(f"Chunk {chunk_num}: Calling {self.llm_provider} API", 
-                                       {"provider": self.llm_provider, "model": self.model})
-                self.logger(f"[DEBUG] Chunk {chunk_num}: Making {self.llm_provider} API call...")
+                if debug:
+                    self.term_logger.debug(f"Chunk {chunk_num}: Calling {self.llm_provider} API",
+                                           {"provider": self.llm_provider, "model": self.model})
+                    self.logger(
+                        f"[DEBUG] Chunk {chunk_num}: Making {self.llm_provider} API call..."
+                    )
                 
-                api_start = time.time()
+                api_start = time.perf_counter()
                 try:
-                    # Request preview logging (env: CLAIM_EXTRACT_LOG_REQUEST = off|truncated|full)
-                    log_mode = os.environ.get("CLAIM_EXTRACT_LOG_REQUEST", "truncated").lower()
-                    if log_mode in ("truncated", "full"):
-                        def _trim(text: str) -> str:
-                            return text if log_mode == "full" else (text[:500] + ("..." if len(text) > 500 else ""))
-                        req_preview = {
-                            "provider": self.llm_provider,
-                            "model": self.model,
-                            "temperature": 0.1,
-                            "messages": [
-                                {"role": "system", "content": _trim(system_prompt)},
-                                {"role": "user", "content": _trim(user_prompt)}
-                            ]
-                        }
-                        self.term_logger.debug(f"Chunk {chunk_num}: API request preview", req_preview)
-                        self.logger(f"[DEBUG] Chunk {chunk_num}: API request: {req_preview}")
-                    response = self.client.chat.completions.create(
+                    self._log_request_preview(chunk_num, system_prompt, user_prompt)
+                    stream = await client.chat.completions.create(
                         model=self.model,
                         messages=[
                             {"role": "system", "content": system_prompt},
                             {"role": "user", "content": user_prompt}
                         ],
-                        temperature=0.1
+                        temperature=0.1,
+                        stream=True
                     )
-                    api_duration = time.time() - api_start
-                    result_text = response.choices[0].message.content
-                    
-                    self.term_logger.debug(f"Chunk {chunk_num}: API call completed in {api_duration:.2f}s", 
-                                          {"duration": api_duration, "response_length": len(result_text) if result_text else 0})
-                    self.logger(f"[DEBUG] Chunk {chunk_num}: API response received ({len(result_text) if result_text else 0} chars) in {api_duration:.2f}s")
+                    self._rate_limiter.update_from_headers(
+                        getattr(getattr(stream, "response", None), "headers", None)
+                    )
+                    result_text = await self._read_stream_text(stream, chunk_num, api_start)
+                    if limiter is not None:
+                        limiter.on_success()
+                    if debug:
+                        api_duration = time.perf_counter() - api_start
+                        response_length = len(result_text) if result_text else 0
+                        self.term_logger.debug(
+                            f"Chunk {chunk_num}: API call completed in {api_duration:.2f}s",
+                            {"duration": api_duration, "response_length": response_length}
+                        )
+                        self.logger(f"[DEBUG] Chunk {chunk_num}: API response received "
+                                    f"({response_length} chars) in {api_duration:.2f}s")
                 except Exception as api_error:
-                    api_duration = time.time() - api_start
+                    api_duration = time.perf_counter() - api_start
+                    self._note_rate_limit(limiter, api_error, chunk_num)
                     self.term_logger.error(f"Chunk {chunk_num}: API call failed after {api_duration:.2f}s", 
                                           {"error": str(api_error), "error_type": type(api_error).__name__})
                     self.logger(f"[ERROR] Chunk {chunk_num}: API call failed: {type(api_error).__name__}: {api_error}")
                     raise
             else:  # anthropic
-                self.term_logger.debug(f"Chunk {chunk_num}: Calling Anthropic API", {"model": self.model})
-                self.logger(f"[DEBUG] Chunk {chunk_num}: Making Anthropic API call...")
+                if debug:
+                    self.term_logger.debug(f"Chunk {chunk_num}: Calling Anthropic API",
+                                           {"model": self.model})
+                    self.logger(f"[DEBUG] Chunk {chunk_num}: Making Anthropic API call...")
                 
-                api_start = time.time()
+                api_start = time.perf_counter()
                 try:
-                    # Request preview logging (env: CLAIM_EXTRACT_LOG_REQUEST = off|truncated|full)
-                    log_mode = os.environ.get("CLAIM_EXTRACT_LOG_REQUEST", "truncated").lower()
-                    if log_mode in ("truncated", "full"):
-                        def _trim(text: str) -> str:
-                            return text if log_mode == "full" else (text[:500] + ("..." if len(text) > 500 else ""))
-                        # Set max_tokens based on model (Haiku: 4096, Sonnet: 8192)
-                        max_tokens_preview = 4000 if "haiku" in self.model.lower() else 8000
-                        
-                        req_preview = {
-                            "provider": self.llm_provider,
-                            "model": self.model,
-                            "temperature": 0.1,
-                            "max_tokens": max_tokens_preview,
-                            "system": _trim(system_prompt),
-                            "messages": [
-                                {"role": "user", "content": _trim(user_prompt)}
-                            ]
-                        }
-                        self.term_logger.debug(f"Chunk {chunk_num}: API request preview", req_preview)
-                        self.logger(f"[DEBUG] Chunk {chunk_num}: API request: {req_preview}")
-                    # Set max_tokens based on model (Haiku: 4096, Sonnet: 8192)
-                    max_tokens = 4000 if "haiku" in self.model.lower() else 8000
+                    max_tokens = self._max_tokens
+                    self._log_request_preview(chunk_num, system_prompt, user_prompt,
+                                              max_tokens=max_tokens)
                     
                     # Use structured outputs for Claude Sonnet 4.5 and newer
                     # This guarantees valid JSON output without parsing errors
-                    if use_structured_outputs:
-                        self.term_logger.debug(f"Chunk {chunk_num}: Using structured outputs (beta)", 
-                                              {"model": self.model})
-                        response = self.client.messages.create(
+                    if self._use_structured_outputs:
+                        if debug:
+                            self.term_logger.debug(
+                                f"Chunk {chunk_num}: Using structured outputs (beta)",
+                                {"model": self.model}
+                            )
+                        stream = await client.messages.create(
                             model=self.model,
                             max_tokens=max_tokens,
                             temperature=0.1,
@@ -890,37 +1429,51 @@ Remember to be exhaustive and extract EVERY factual claim that can be verified i
                             output_format={
                                 "type": "json_schema",
                                 "schema": self._get_claims_json_schema()
-                            }
+                            },
+                            stream=True
                         )
                     else:
                         # Fallback for older models without structured outputs
-                        response = self.client.messages.create(
+                        stream = await client.messages.create(
                             model=self.model,
                             max_tokens=max_tokens,
                             temperature=0.1,
                             system=system_prompt,
                             messages=[
                                 {"role": "user", "content": user_prompt}
-                            ]
+                            ],
+                            stream=True
                         )
                     
-                    api_duration = time.time() - api_start
-                    result_text = response.content[0].text
-                    
-                    self.term_logger.debug(f"Chunk {chunk_num}: API call completed in {api_duration:.2f}s", 
-                                          {"duration": api_duration, "response_length": len(result_text) if result_text else 0})
-                    self.logger(f"[DEBUG] Chunk {chunk_num}: API response received ({len(result_text) if result_text else 0} chars) in {api_duration:.2f}s")
+                    self._rate_limiter.update_from_headers(
+                        getattr(getattr(stream, "response", None), "headers", None)
+                    )
+                    result_text = await self._read_stream_text(stream, chunk_num, api_start)
+                    if limiter is not None:
+                        limiter.on_success()
+                    if debug:
+                        api_duration = time.perf_counter() - api_start
+                        response_length = len(result_text) if result_text else 0
+                        self.term_logger.debug(
+                            f"Chunk {chunk_num}: API call completed in {api_duration:.2f}s",
+                            {"duration": api_duration, "response_length": response_length}
+                        )
+                        self.logger(f"[DEBUG] Chunk {chunk_num}: API response received "
+                                    f"({response_length} chars) in {api_duration:.2f}s")
                 except Exception as api_error:
-                    api_duration = time.time() - api_start
+                    api_duration = time.perf_counter() - api_start
+                    self._note_rate_limit(limiter, api_error, chunk_num)
                     self.term_logger.error(f"Chunk {chunk_num}: API call failed after {api_duration:.2f}s", 
                                           {"error": str(api_error), "error_type": type(api_error).__name__})
                     self.logger(f"[ERROR] Chunk {chunk_num}: API call failed: {type(api_error).__name__}: {api_error}")
                     raise
             
             # Parse response (JSON from structured outputs or XML from older models)
-            self.logger(f"[DEBUG] Chunk {chunk_num}: Parsing response...")
+            if debug:
+                self.logger(f"[DEBUG] Chunk {chunk_num}: Parsing response...")
             if isinstance(result_text, dict):
-                self.term_logger.debug(f"Chunk {chunk_num}: Response is already a dict")
+                if debug:
+                    self.term_logger.debug(f"Chunk {chunk_num}: Response is already a dict")
                 result = result_text
             else:
                 if not result_text or not result_text.strip():
@@ -929,36 +1482,50 @@ Remember to be exhaustive and extract EVERY factual claim that can be verified i
                     return []
                 
                 # Log first/last 200 chars of response for debugging
-                preview = result_text[:200] + "..." if len(result_text) > 200 else result_text
-                self.term_logger.debug(f"Chunk {chunk_num}: Response preview: {preview[:100]}...")
-                self.logger(f"[DEBUG] Chunk {chunk_num}: Response preview (first 200 chars): {preview}")
+                if debug:
+                    preview = result_text[:200] + "..." if len(result_text) > 200 else result_text
+                    self.term_logger.debug(
+                        f"Chunk {chunk_num}: Response preview: {preview[:100]}..."
+                    )
+                    self.logger(f"[DEBUG] Chunk {chunk_num}: Response preview "
+                                f"(first 200 chars): {preview}")
                 
-                parse_start = time.time()
+                parse_start = time.perf_counter()
                 
                 # For structured outputs with Anthropic, response is already valid JSON
                 # But may be wrapped in markdown code blocks
-                if use_structured_outputs and self.llm_provider == "anthropic":
+                if self._use_structured_outputs and self.llm_provider == "anthropic":
                     try:
-                        # Strip markdown code blocks if present
-                        cleaned_text = result_text.strip()
-                        if cleaned_text.startswith("```json"):
-                            cleaned_text = cleaned_text[7:]  # Remove ```json
-                        elif cleaned_text.startswith("```"):
-                            cleaned_text = cleaned_text[3:]  # Remove ```
-                        if cleaned_text.endswith("```"):
-                            cleaned_text = cleaned_text[:-3]  # Remove trailing ```
-                        cleaned_text = cleaned_text.strip()
+                        # The schema root is an object, so slicing from the first '{' to the
+                        # last '}' drops any markdown fence or whitespace in a single copy
+                        start_idx = result_text.find('{')
+                        end_idx = result_text.rfind('}')
+                        if start_idx != -1 and end_idx > start_idx:
+                            cleaned_text = result_text[start_idx:end_idx + 1]
+                        else:
+                            cleaned_text = result_text.strip()
                         
-                        result = json.loads(cleaned_text)
-                        self.term_logger.debug(f"Chunk {chunk_num}: JSON parsed successfully", 
-                                              {"claims_count": len(result.get('claims', []))})
-                        self.logger(f"[DEBUG] Chunk {chunk_num}: Parsed {len(result.get('claims', []))} claims from JSON")
-                    except json.JSONDecodeError as e:
-                        self.term_logger.error(f"Chunk {chunk_num}: JSON parsing failed: {e}", 
-                                              {"error": str(e), "response_length": len(result_text)})
-                        self.logger(f"[ERROR] Chunk {chunk_num}: JSON parsing failed: {e}")
-                        self.logger(f"[DEBUG] Chunk {chunk_num}: Full response (first 500 chars): {result_text[:500]}")
-                        return []
+                        result = json_utils.loads(cleaned_text)
+                        if debug:
+                            claims_count = len(result.get('claims', []))
+                            self.term_logger.debug(f"Chunk {chunk_num}: JSON parsed successfully",
+                                                   {"claims_count": claims_count})
+                            self.logger(f"[DEBUG] Chunk {chunk_num}: Parsed {claims_count} "
+                                        "claims from JSON")
+                    except ValueError as e:
+                        # Salvage near-valid JSON (trailing commas, truncated output)
+                        # before dropping the chunk's claims; repaired results are not cached
+                        result = self._repair_json_response(cleaned_text, chunk_num)
+                        repaired = result is not None
+                        if result is None:
+                            self.term_logger.error(
+                                f"Chunk {chunk_num}: JSON parsing failed: {e}",
+                                {"error": str(e), "response_length": len(result_text)}
+                            )
+                            self.logger(f"[ERROR] Chunk {chunk_num}: JSON parsing failed: {e}")
+                            self.logger(f"[DEBUG] Chunk {chunk_num}: Full response "
+                                        f"(first 500 chars): {result_text[:500]}")
+                            return []
                 else:
                     # Fallback to XML parsing for older models
                     result = self._extract_xml_from_response(result_text)
@@ -966,33 +1533,35 @@ Remember to be exhaustive and extract EVERY factual claim that can be verified i
                         self.term_logger.error(f"Chunk {chunk_num}: Failed to extract XML from response", 
                                               {"chunk": chunk_num, "response_length": len(result_text)})
                         self.logger(f"[ERROR] Chunk {chunk_num}: Could not extract XML from response")
-                        self.logger(f"[DEBUG] Chunk {chunk_num}: Full response (first 500 chars): {result_text[:500]}")
+                        self.logger(f"[DEBUG] Chunk {chunk_num}: Full response "
+                                    f"(first 500 chars): {result_text[:500]}")
                         return []
                 
-                parse_duration = time.time() - parse_start
-                self.term_logger.debug(f"Chunk {chunk_num}: Parsed in {parse_duration:.3f}s", {"parse_duration": parse_duration})
+                if debug:
+                    parse_duration = time.perf_counter() - parse_start
+                    self.term_logger.debug(f"Chunk {chunk_num}: Parsed in {parse_duration:.3f}s",
+                                           {"parse_duration": parse_duration})
             
             claims = result.get("claims", [])
-            total_duration = time.time() - start_time
+            total_duration = time.perf_counter() - start_time
             
             self.term_logger.info(f"Chunk {chunk_num}/{total_chunks}: Extracted {len(claims)} claims in {total_duration:.2f}s", 
                                  {"chunk": chunk_num, "claims": len(claims), "duration": total_duration})
             self.logger(f"[SUCCESS] Chunk {chunk_num}: Extracted {len(claims)} claims in {total_duration:.2f}s")
             
             # Debug: log claim categories if any
-            if claims:
-                categories = [c.get("category", "unknown") for c in claims]
-                category_counts = {}
-                for cat in categories:
-                    category_counts[cat] = category_counts.get(cat, 0) + 1
+            if claims and debug:
+                category_counts = dict(Counter(c.get("category", "unknown") for c in claims))
                 self.term_logger.debug(f"Chunk {chunk_num}: Claim categories: {category_counts}")
                 self.logger(f"[DEBUG] Chunk {chunk_num}: Claim categories: {category_counts}")
             
+            # Empty or repaired results may be a transient failure; let the next run ask again
+            if claims and not repaired:
+                self._save_chunk_cache(cache_key, claims)
             return claims
             
         except Exception as e:
-            total_duration = time.time() - start_time
-            import traceback
+            total_duration = time.perf_counter() - start_time
             error_type = type(e).__name__
             error_msg = str(e)
             full_traceback = traceback.format_exc()
@@ -1003,18 +1572,76 @@ Remember to be exhaustive and extract EVERY factual claim that can be verified i
             self.logger(f"[DEBUG] Chunk {chunk_index + 1}: Full traceback:\n{full_traceback}")
             
             # Log specific error details
-            if "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
+            error_lower = error_msg.lower()
+            if "timeout" in error_lower or "timed out" in error_lower:
                 self.term_logger.warn(f"Chunk {chunk_index + 1}: Timeout error detected")
                 self.logger(f"[WARN] Chunk {chunk_index + 1}: This appears to be a timeout error")
-            elif "rate limit" in error_msg.lower():
+            elif "rate limit" in error_lower:
                 self.term_logger.warn(f"Chunk {chunk_index + 1}: Rate limit error detected")
                 self.logger(f"[WARN] Chunk {chunk_index + 1}: This appears to be a rate limit error")
-            elif "connection" in error_msg.lower() or "network" in error_msg.lower():
+            elif "connection" in error_lower or "network" in error_lower:
                 self.term_logger.warn(f"Chunk {chunk_index + 1}: Network error detected")
                 self.logger(f"[WARN] Chunk {chunk_index + 1}: This appears to be a network error")
             
             return []
 
+    async def _extract_all_chunks_async(self, chunks: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract claims from all chunks concurrently on a single event loop.
+
+        At most ``max_concurrency`` requests are in flight at once; the limit is halved
+        when the provider rate-limits a request and recovers as requests succeed. A
+        failed chunk is logged and contributes no claims; claims are returned in
+        chunk order.
+
+        Args:
+            chunks: Text chunks to process
+
+        Returns:
+            Combined list of claim dictionaries
+        """
+        total_chunks = len(chunks)
+        limiter = AdaptiveConcurrencyLimiter(self.max_concurrency)
+        completed = 0
+        client = self._create_async_client()
+
+        async def bounded(idx: int, chunk: str) -> List[Dict[str, Any]]:
+            nonlocal completed
+            async with limiter:
+                try:
+                    chunk_claims = await self._extract_claims_from_chunk(
+                        client, chunk, idx, total_chunks, limiter
+                    )
+                except Exception as e:
+                    completed += 1
+                    self.term_logger.error(
+                        f"Chunk {idx + 1} failed",
+                        {"chunk": idx + 1, "error": str(e), "error_type": type(e).__name__}
+                    )
+                    self.logger(f"[ERROR] Chunk {idx + 1} failed: {type(e).__name__}: {e}")
+                    self.logger(f"[DEBUG] Chunk {idx + 1} traceback:\n{traceback.format_exc()}")
+                    return []
+            completed += 1
+            self.term_logger.info(
+                f"Chunk {idx + 1}/{total_chunks} completed: {len(chunk_claims)} claims",
+                {"chunk": idx + 1, "claims": len(chunk_claims)}
+            )
+            self.logger(f"[{completed}/{total_chunks}] Chunk {idx + 1} extracted "
+                        f"{len(chunk_claims)} claims")
+            return chunk_claims
+
+        try:
+            results = await asyncio.gather(
+                *(bounded(idx, chunk) for idx, chunk in enumerate(chunks))
+            )
+        finally:
+            await client.close()
+
+        all_claims = []
+        for chunk_claims in results:
+            all_claims.extend(chunk_claims)
+        return all_claims
+
     def extract_claims(self, model_card_text: str) -> List[Dict[str, Any]]:
         """
         Extract structured, verifiable claims from model card text using parallel processing.
@@ -1055,12 +1682,7 @@ Remember to be exhaustive and extract EVERY factual claim that can be verified i
             claims = json_cached.get('claims', [])
             cache_metadata = json_cached.get('metadata', {})
             
-            # Validate and enrich claims
-            for idx, claim in enumerate(claims):
-                if "id" not in claim:
-                    claim["id"] = f"claim_{idx + 1}"
-                claim["verified"] = None
-                claim["evidence"] = []
+            _enrich_claims(claims)
             
             # Internal logging only (terminal, not forwarded to UI)
             self.term_logger.success(
@@ -1079,12 +1701,7 @@ Remember to be exhaustive and extract EVERY factual claim that can be verified i
             if cached_result:
                 claims = cached_result.get('claims', [])
                 
-                # Validate and enrich claims
-                for idx, claim in enumerate(claims):
-                    if "id" not in claim:
-                        claim["id"] = f"claim_{idx + 1}"
-                    claim["verified"] = None
-                    claim["evidence"] = []
+                _enrich_claims(claims)
                 
                 # User-facing message (no mention of cache)
                 self.term_logger.success(
@@ -1097,41 +1714,40 @@ Remember to be exhaustive and extract EVERY factual claim that can be verified i
                 print("[INTERNAL-CACHE] XML cache validation failed, extracting fresh...")
         
         # Step 1: Split model card into semantic chunks
-        import time
-        import sys
-        extraction_start = time.time()
+        extraction_start = time.perf_counter()
+        # Progress/statistics debug lines are only built when they will be shown
+        debug = self.term_logger.is_enabled_for(LogLevel.DEBUG)
         
-        # Log initial memory usage
-        try:
-            import psutil
-            process = psutil.Process(os.getpid())
-            initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-            self.term_logger.debug(f"Initial memory usage: {initial_memory:.1f} MB")
-            self.logger(f"[DEBUG] Initial memory: {initial_memory:.1f} MB")
-        except ImportError:
-            self.logger("[DEBUG] psutil not available, skipping memory profiling")
-            initial_memory = None
-        
-        self.term_logger.debug("Starting text splitting...")
-        self.logger("[DEBUG] Step 1: Splitting model card into semantic chunks...")
-        self.logger(f"[DEBUG] Model card size: {len(model_card_text)} chars (~{len(model_card_text)//4} tokens)")
-        
-        split_start = time.time()
+        # Memory profiling (DEBUG only): peak RSS from getrusage, no /proc reads
+        initial_memory = _peak_rss_mb() if debug else None
+        if initial_memory is not None:
+            self.term_logger.debug(f"Initial peak memory usage: {initial_memory:.1f} MB")
+            self.logger(f"[DEBUG] Initial peak memory: {initial_memory:.1f} MB")
+
+        if debug:
+            self.term_logger.debug("Starting text splitting...")
+            self.logger("[DEBUG] Step 1: Splitting model card into semantic chunks...")
+            self.logger(f"[DEBUG] Model card size: {len(model_card_text)} chars "
+                        f"(~{len(model_card_text)//4} tokens)")
+
+        split_start = time.perf_counter()
         chunks = self._smart_split_text(model_card_text, target_chunks=12)
-        split_duration = time.time() - split_start
+        split_duration = time.perf_counter() - split_start
         total_chunks = len(chunks)
         
-        # Calculate total memory used by chunks (with overlap)
-        total_chunk_size = sum(len(c) for c in chunks)
-        overlap_size = total_chunk_size - len(model_card_text)
-        
         self.term_logger.info(f"Split into {total_chunks} chunks in {split_duration:.3f}s", 
                              {"chunks": total_chunks, "duration": split_duration})
-        self.logger(f"[DEBUG] Split completed: {total_chunks} chunks in {split_duration:.3f}s")
-        self.logger(f"[DEBUG] Total chunk size: {total_chunk_size} chars (overlap: {overlap_size} chars, {overlap_size/len(model_card_text)*100:.1f}% overhead)")
+        if debug:
+            # Calculate total memory used by chunks (with overlap)
+            total_chunk_size = sum(len(c) for c in chunks)
+            overlap_size = total_chunk_size - len(model_card_text)
+            self.logger(f"[DEBUG] Split completed: {total_chunks} chunks in {split_duration:.3f}s")
+            overhead = overlap_size / len(model_card_text) * 100
+            self.logger(f"[DEBUG] Total chunk size: {total_chunk_size} chars "
+                        f"(overlap: {overlap_size} chars, {overhead:.1f}% overhead)")
         
         # Log chunk size distribution
-        chunk_sizes = [len(c) for c in chunks]
+        chunk_sizes = [len(c) for c in chunks] if debug else None
         if chunk_sizes:
             avg_size = sum(chunk_sizes) / len(chunk_sizes)
             min_size = min(chunk_sizes)
@@ -1140,156 +1756,75 @@ Remember to be exhaustive and extract EVERY factual claim that can be verified i
                                   {"min": min_size, "avg": avg_size, "max": max_size})
             self.logger(f"[DEBUG] Chunk sizes: min={min_size}, avg={avg_size:.0f}, max={max_size} chars")
         
+        # Group small adjacent chunks so fewer requests carry the fixed per-call latency
+        chunks = self._batch_chunks(chunks, self.max_batch_chars)
+        if len(chunks) < total_chunks:
+            self.term_logger.info(
+                f"Grouped {total_chunks} chunks into {len(chunks)} requests",
+                {"chunks": total_chunks, "requests": len(chunks),
+                 "max_batch_chars": self.max_batch_chars}
+            )
+            if debug:
+                self.logger(f"[DEBUG] Grouped {total_chunks} chunks into {len(chunks)} requests "
+                            f"(up to {self.max_batch_chars} chars each)")
+            total_chunks = len(chunks)
+
         # Log memory after splitting
         if initial_memory is not None:
-            try:
-                after_split_memory = process.memory_info().rss / 1024 / 1024
-                split_memory_delta = after_split_memory - initial_memory
-                self.logger(f"[DEBUG] Memory after split: {after_split_memory:.1f} MB (delta: +{split_memory_delta:.1f} MB)")
-            except:
-                pass
+            after_split_memory = _peak_rss_mb()
+            split_memory_delta = after_split_memory - initial_memory
+            self.logger(f"[DEBUG] Peak memory after split: {after_split_memory:.1f} MB "
+                        f"(delta: +{split_memory_delta:.1f} MB)")
         
         if total_chunks == 1:
             # Small model card, process directly
             self.logger("Model card is small, processing in single call...")
-            claims = self._extract_claims_from_chunk(chunks[0], 0, 1)
+            claims = run_coroutine_sync(self._extract_all_chunks_async(chunks))
         else:
-            # Step 2: Process chunks in parallel with batching to avoid memory issues
-            # Use smaller batch size to prevent OOM kills
-            max_workers = int(os.environ.get("CLAIM_EXTRACT_MAX_WORKERS", "5"))  # Default 5 workers
-            batch_size = max_workers  # Process in batches
-            
-            self.term_logger.info(f"Processing {total_chunks} chunks in batches of {batch_size} (max_workers={max_workers})", 
-                                 {"chunks": total_chunks, "batch_size": batch_size, "max_workers": max_workers})
-            self.logger(f"Processing {total_chunks} chunks in batches of {batch_size}...")
-            
-            all_claims = []
-            completed = 0
+            # Step 2: Process all chunks concurrently; a semaphore bounds in-flight requests
+            self.term_logger.info(
+                f"Processing {total_chunks} chunks concurrently "
+                f"(max_concurrency={self.max_concurrency})",
+                {"chunks": total_chunks, "max_concurrency": self.max_concurrency}
+            )
+            self.logger(f"Processing {total_chunks} chunks concurrently "
+                        f"(up to {self.max_concurrency} at a time)...")
             
             try:
-                # Process chunks in batches to avoid memory issues
-                total_batches = (total_chunks + batch_size - 1) // batch_size
-                self.term_logger.info(f"Processing {total_batches} batches with {max_workers} workers per batch")
-                self.logger(f"[DEBUG] Will process {total_batches} batches, {max_workers} workers per batch")
+                claims = run_coroutine_sync(self._extract_all_chunks_async(chunks))
+                processing_duration = time.perf_counter() - extraction_start
                 
-                batch_num = 0
-                for batch_start in range(0, total_chunks, batch_size):
-                    batch_num += 1
-                    batch_end = min(batch_start + batch_size, total_chunks)
-                    batch_chunks = chunks[batch_start:batch_end]
-                    batch_indices = list(range(batch_start, batch_end))
-                    
-                    batch_start_time = time.time()
-                    self.term_logger.info(f"Batch {batch_num}/{total_batches}: Processing chunks {batch_start+1}-{batch_end}", 
-                                         {"batch": batch_num, "chunks": f"{batch_start+1}-{batch_end}"})
-                    self.logger(f"[DEBUG] Batch {batch_num}/{total_batches}: Processing chunks {batch_start+1}-{batch_end} of {total_chunks}")
-                    
-                    batch_claims = []
-                    
-                    # Log memory before batch
-                    if initial_memory is not None:
-                        try:
-                            before_batch_memory = process.memory_info().rss / 1024 / 1024
-                            self.logger(f"[DEBUG] Memory before batch {batch_num}: {before_batch_memory:.1f} MB")
-                        except:
-                            pass
-                    
-                    with ThreadPoolExecutor(max_workers=min(len(batch_chunks), max_workers)) as executor:
-                        # Submit batch chunks for processing
-                        self.logger(f"[DEBUG] Batch {batch_num}: Submitting {len(batch_chunks)} chunks to executor...")
-                        future_to_chunk = {
-                            executor.submit(self._extract_claims_from_chunk, chunk, idx, total_chunks): idx
-                            for idx, chunk in zip(batch_indices, batch_chunks)
-                        }
-                        
-                        # Collect results as they complete
-                        batch_completed = 0
-                        for future in as_completed(future_to_chunk):
-                            chunk_idx = future_to_chunk[future]
-                            completed += 1
-                            batch_completed += 1
-                            
-                            try:
-                                chunk_claims = future.result()
-                                batch_claims.extend(chunk_claims)
-                                all_claims.extend(chunk_claims)
-                                self.term_logger.info(f"Chunk {chunk_idx + 1}/{total_chunks} completed: {len(chunk_claims)} claims", 
-                                                     {"chunk": chunk_idx + 1, "claims": len(chunk_claims)})
-                                self.logger(f"[{completed}/{total_chunks}] Chunk {chunk_idx + 1} extracted {len(chunk_claims)} claims")
-                                
-                                # Clear the future reference to help GC
-                                del future
-                            except Exception as e:
-                                import traceback
-                                error_tb = traceback.format_exc()
-                                self.term_logger.error(f"Chunk {chunk_idx + 1} failed in batch {batch_num}", 
-                                                      {"chunk": chunk_idx + 1, "batch": batch_num, "error": str(e), 
-                                                       "error_type": type(e).__name__})
-                                self.logger(f"[ERROR] Chunk {chunk_idx + 1} failed in batch {batch_num}: {type(e).__name__}: {e}")
-                                self.logger(f"[DEBUG] Chunk {chunk_idx + 1} traceback:\n{error_tb}")
-                        
-                        # Clear futures dict to help GC
-                        del future_to_chunk
-                    
-                    # Clear batch chunks reference after processing
-                    del batch_chunks
-                    del batch_indices
-                    
-                    batch_duration = time.time() - batch_start_time
-                    self.term_logger.info(f"Batch {batch_num}/{total_batches}: Completed in {batch_duration:.2f}s, {len(batch_claims)} claims", 
-                                         {"batch": batch_num, "duration": batch_duration, "claims": len(batch_claims)})
-                    self.logger(f"[DEBUG] Batch {batch_num}: Completed in {batch_duration:.2f}s, extracted {len(batch_claims)} claims")
-                    
-                    # Log memory after batch
-                    if initial_memory is not None:
-                        try:
-                            after_batch_memory = process.memory_info().rss / 1024 / 1024
-                            batch_memory_delta = after_batch_memory - (before_batch_memory if 'before_batch_memory' in locals() else initial_memory)
-                            self.logger(f"[DEBUG] Memory after batch {batch_num}: {after_batch_memory:.1f} MB (delta: {batch_memory_delta:+.1f} MB)")
-                        except:
-                            pass
-                    
-                    # Small delay between batches to avoid overwhelming the system
-                    if batch_end < total_chunks:
-                        self.logger(f"[DEBUG] Waiting 500ms before next batch...")
-                        time.sleep(0.5)  # 500ms delay between batches
-                
-                claims = all_claims
-                processing_duration = time.time() - extraction_start
-                
-                # Clear chunks reference after processing to free memory
-                del chunks
-                import gc
-                gc.collect()  # Force garbage collection
-                
-                self.term_logger.info(f"All batches completed in {processing_duration:.2f}s", {"duration": processing_duration})
-                self.logger(f"[DEBUG] All batches completed in {processing_duration:.2f}s, total claims: {len(claims)}")
+                self.term_logger.info(f"All chunks completed in {processing_duration:.2f}s",
+                                      {"duration": processing_duration})
+                if debug:
+                    self.logger(f"[DEBUG] All chunks completed in {processing_duration:.2f}s, "
+                                f"total claims: {len(claims)}")
                 
                 # Log final memory usage
                 if initial_memory is not None:
-                    try:
-                        final_memory = process.memory_info().rss / 1024 / 1024
-                        total_memory_delta = final_memory - initial_memory
-                        self.logger(f"[DEBUG] Final memory: {final_memory:.1f} MB (total delta: {total_memory_delta:+.1f} MB)")
-                        if total_memory_delta > 100:  # Warn if memory increased by more than 100MB
-                            self.term_logger.warn(f"Large memory increase detected: {total_memory_delta:.1f} MB", 
-                                                 {"memory_delta": total_memory_delta})
-                            self.logger(f"[WARN] Large memory increase: {total_memory_delta:.1f} MB - this may indicate a memory leak")
-                    except:
-                        pass
+                    final_memory = _peak_rss_mb()
+                    total_memory_delta = final_memory - initial_memory
+                    self.logger(f"[DEBUG] Final peak memory: {final_memory:.1f} MB "
+                                f"(total delta: {total_memory_delta:+.1f} MB)")
+                    if total_memory_delta > 100:  # Warn if peak memory grew by more than 100MB
+                        self.term_logger.warn(
+                            f"Large memory increase detected: {total_memory_delta:.1f} MB",
+                            {"memory_delta": total_memory_delta}
+                        )
+                        self.logger(f"[WARN] Large memory increase: {total_memory_delta:.1f} MB - "
+                                    "this may indicate a memory leak")
                 
             except Exception as e:
-                import traceback
-                error_msg = str(e)
+                error_lower = str(e).lower()
             
                 # Check for timeout-related errors
-                if "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
+                if "timeout" in error_lower or "timed out" in error_lower:
                     timeout_val = os.environ.get("CLAIM_EXTRACT_TIMEOUT_SECONDS", "300.0")
                     self.term_logger.error(f"Request timed out after {timeout_val} seconds", 
                                          {"model": self.model, "provider": self.llm_provider, "error": str(e)})
                     self.term_logger.warn("Consider using a faster model or increasing CLAIM_EXTRACT_TIMEOUT_SECONDS")
                     self.logger(f"ERROR: Request timed out after {timeout_val} seconds.")
-                elif "rate limit" in error_msg.lower():
+                elif "rate limit" in error_lower:
                     self.term_logger.error("Rate limit exceeded", {"error": str(e), "provider": self.llm_provider})
                     self.logger(f"ERROR: Rate limit exceeded. Please wait and try again.")
                 else:
@@ -1301,45 +1836,49 @@ Remember to be exhaustive and extract EVERY factual claim that can be verified i
                 return []
         
         # Step 3: Deduplicate and merge claims
-        self.logger("[DEBUG] Step 3: Deduplicating claims...")
-        dedup_start = time.time()
+        if debug:
+            self.logger("[DEBUG] Step 3: Deduplicating claims...")
+        dedup_start = time.perf_counter()
         
-        # Remove duplicate claims based on description similarity
+        # Remove duplicate claims based on description similarity, and validate and
+        # enrich each kept claim in the same pass (Step 4)
         unique_claims = []
         seen_descriptions = set()
         duplicates_count = 0
         
         for claim in claims:
-            description = claim.get("description", "").lower().strip()
-            if description and description not in seen_descriptions:
-                seen_descriptions.add(description)
-                unique_claims.append(claim)
-            elif not description:
+            # Normalized once per claim; missing or null descriptions become ""
+            description = (claim.get("description") or "").lower().strip()
+            if not description:
                 # Keep claims without description (shouldn't happen, but be safe)
                 self.logger(f"[WARN] Found claim without description: {claim.get('id', 'unknown')}")
-                unique_claims.append(claim)
+            elif description not in seen_descriptions:
+                seen_descriptions.add(description)
             else:
                 duplicates_count += 1
-                self.logger(f"[DEBUG] Duplicate claim detected: {description[:50]}...")
+                if debug:
+                    self.logger(f"[DEBUG] Duplicate claim detected: {description[:50]}...")
+                continue
+
+            unique_claims.append(claim)
+            if "id" not in claim:
+                claim["id"] = f"claim_{len(unique_claims)}"
+            claim["verified"] = None  # Will be set during verification
+            claim["evidence"] = []  # Will be populated during verification
         
-        dedup_duration = time.time() - dedup_start
+        dedup_duration = time.perf_counter() - dedup_start
         claims = unique_claims
         
         if duplicates_count > 0:
             self.term_logger.info(f"Removed {duplicates_count} duplicate claims in {dedup_duration:.3f}s", 
                                  {"duplicates": duplicates_count, "duration": dedup_duration})
-            self.logger(f"[DEBUG] Deduplication: Removed {duplicates_count} duplicates in {dedup_duration:.3f}s")
-        else:
+            if debug:
+                self.logger(f"[DEBUG] Deduplication: Removed {duplicates_count} duplicates "
+                            f"in {dedup_duration:.3f}s")
+        elif debug:
             self.logger(f"[DEBUG] Deduplication: No duplicates found in {dedup_duration:.3f}s")
         
-        # Step 4: Validate and enrich claims
-        for idx, claim in enumerate(claims):
-            if "id" not in claim:
-                claim["id"] = f"claim_{idx + 1}"
-            claim["verified"] = None  # Will be set during verification
-            claim["evidence"] = []  # Will be populated during verification
-        
-        total_duration = time.time() - extraction_start
+        total_duration = time.perf_counter() - extraction_start
         
         self.term_logger.success(f"Extracted {len(claims)} unique claims from {total_chunks} chunks in {total_duration:.2f}s", 
                                  {"count": len(claims), "chunks": total_chunks, "duration": total_duration})
@@ -1348,19 +1887,20 @@ Remember to be exhaustive and extract EVERY factual claim that can be verified i
         if len(claims) == 0:
             self.term_logger.warn("No claims extracted from model card", {"chunks": total_chunks, "duration": total_duration})
             self.logger(f"[WARN] No claims extracted from model card after {total_duration:.2f}s")
-        else:
-            # Log summary statistics
-            categories = {}
-            for claim in claims:
-                cat = claim.get("category", "unknown")
-                categories[cat] = categories.get(cat, 0) + 1
-            
-            self.term_logger.debug(f"Claim distribution by category: {categories}", {"categories": categories})
+        elif debug:
+            # Log summary statistics, most common categories first
+            category_counts = Counter(claim.get("category", "unknown") for claim in claims)
+            categories = dict(category_counts.most_common())
+            self.term_logger.debug(f"Claim distribution by category: {categories}",
+                                   {"categories": categories})
             self.logger(f"[DEBUG] Claim distribution by category: {categories}")
         
-        # Step 5: Save to cache for future use
+        # Step 5: Save to cache for future use. The writes run on a background
+        # thread so the claims are returned without waiting on disk I/O; the
+        # outcome is reported from the future's done-callback.
         self.term_logger.info("Saving extraction result to cache...")
-        self.logger("[DEBUG] Saving claims to XML and JSON cache...")
+        if debug:
+            self.logger("[DEBUG] Saving claims to XML and JSON cache...")
         
         cache_metadata = {
             'llm_provider': self.llm_provider,
@@ -1368,55 +1908,89 @@ Remember to be exhaustive and extract EVERY factual claim that can be verified i
             'chunks_processed': total_chunks,
             'extraction_duration_seconds': round(total_duration, 2),
         }
+        # Save a snapshot: callers fill in verified/evidence on the returned claims.
+        # They only set top-level fields, so a per-claim copy is enough.
+        snapshot = [dict(claim, evidence=[]) for claim in claims]
+        save_future = self._get_cache_executor().submit(
+            self._save_caches, model_card_text, snapshot, cache_metadata
+        )
+        save_future.add_done_callback(self._report_cache_save)
+
+        # Display JSON content preview
+        if self.term_logger.is_enabled_for(LogLevel.INFO):
+            self.term_logger.info("JSON Output Preview (first 3 claims):")
+            for i, claim in enumerate(claims[:3], 1):
+                description = claim.get("description") or ""
+                preview = {
+                    "id": claim.get("id"),
+                    "category": claim.get("category"),
+                    "description": (
+                        description[:100] + "..." if len(description) > 100 else description
+                    )
+                }
+                preview_json = json_utils.dumps(preview, indent=True).decode('utf-8')
+                self.logger(f"  Claim {i}: {preview_json}")
+
+            if len(claims) > 3:
+                self.logger(f"  ... and {len(claims) - 3} more claims")
+
+        return claims
+
+    def _report_cache_save(self, future: Future) -> None:
+        """
+        Done-callback for the cache-save future: report where the JSON output went.
+
+        Runs on the cache-save thread, so it only uses the terminal logger (the UI
+        stream may already have finished).
+        """
+        try:
+            json_path = future.result()
+        except Exception as e:
+            self.term_logger.warn(f"Failed to save claim caches: {e}", {"error": str(e)})
+            return
+        if json_path:
+            self.term_logger.info(f"Full JSON output saved to: {json_path}",
+                                  {"json_path": json_path})
+        else:
+            self.term_logger.warn(
+                "Full JSON output could not be saved; see the log above for details"
+            )
+
+    def _save_caches(self, model_card_text: str, claims: List[Dict[str, Any]],
+                     metadata: Dict[str, Any]) -> Optional[str]:
+        """
+        Write extracted claims to the XML and JSON caches (runs on the cache-save thread).
         
+        Returns:
+            Path of the JSON snapshot, or None if it could not be written
+        """
         # Save to XML cache (system cache directory)
         try:
             cache_key = self.xml_cache.save_cache(
                 model_card_text=model_card_text,
                 claims=claims,
-                metadata=cache_metadata
+                metadata=metadata
+            )
+            self.term_logger.success(
+                f"Saved {len(claims)} claims to XML cache (key: {cache_key[:16]}...)",
+                {"cache_key": cache_key, "cache_dir": str(self.xml_cache.cache_dir)}
             )
-            
-            self.term_logger.success(f"Saved to XML cache (key: {cache_key[:16]}...)", 
-                                    {"cache_key": cache_key, "cache_dir": str(self.xml_cache.cache_dir)})
-            self.logger(f"[SUCCESS] Saved {len(claims)} claims to XML cache (key: {cache_key[:16]}...)")
         except Exception as e:
             self.term_logger.warn(f"Failed to save XML cache: {e}", {"error": str(e)})
-            self.logger(f"[WARN] Failed to save XML cache: {e}")
         
         # Save to JSON cache (project directory for human inspection)
         try:
             json_path = self._save_json_cache(
                 model_card_text=model_card_text,
                 claims=claims,
-                metadata=cache_metadata
+                metadata=metadata
             )
-            
             self.term_logger.success(f"Saved to JSON cache", 
                                     {"json_path": json_path, "claims_count": len(claims)})
-            self.logger(f"[SUCCESS] Saved {len(claims)} claims to JSON: {json_path}")
-            
-            # Display JSON content preview
-            self.term_logger.info("JSON Output Preview (first 3 claims):")
-            for i, claim in enumerate(claims[:3], 1):
-                preview = {
-                    "id": claim.get("id"),
-                    "category": claim.get("category"),
-                    "description": claim.get("description", "")[:100] + "..." if len(claim.get("description", "")) > 100 else claim.get("description")
-                }
-                self.logger(f"  Claim {i}: {json.dumps(preview, indent=2)}")
-            
-            if len(claims) > 3:
-                self.logger(f"  ... and {len(claims) - 3} more claims")
-            
-            self.logger(f"\n[INFO] Full JSON output saved to: {json_path}")
-            self.logger(f"[INFO] You can inspect the complete claims at: {json_path}")
-            
+            return json_path
         except Exception as e:
             self.term_logger.warn(f"Failed to save JSON cache: {e}", {"error": str(e)})
-            self.logger(f"[WARN] Failed to save JSON cache: {e}")
-        
-        return claims
+            return None
 
     def categorize_claims_by_verification_method(
         self, claims: List[Dict[str, Any]]
@@ -1435,16 +2009,16 @@ Remember to be exhaustive and extract EVERY factual claim that can be verified i
         }
         
         for claim in claims:
-            verification_strategy = claim.get("verification_strategy", "").lower()
-            category = claim.get("category", "").lower()
-            claim_type = claim.get("claim_type", "").lower()
+            verification_strategy = (claim.get("verification_strategy") or "").lower()
             
             # Infer verification method from the verification strategy and category
-            if any(keyword in verification_strategy for keyword in ["import", "class definition", "function definition", "ast", "syntax"]):
+            # (one compiled scan per keyword group instead of one per keyword)
+            if _AST_STRATEGY_RE.search(verification_strategy):
                 categorized["ast_search"].append(claim)
-            elif any(keyword in verification_strategy for keyword in ["output", "metric", "score", "result", "print", "display", "executed"]):
+            elif _NOTEBOOK_STRATEGY_RE.search(verification_strategy):
                 categorized["notebook_output"].append(claim)
-            elif any(keyword in verification_strategy or keyword in category for keyword in ["file", "artifact", "saved", "pkl", "pickle", "model file", "checkpoint"]):
+            elif (_ARTIFACT_RE.search(verification_strategy)
+                  or _ARTIFACT_RE.search((claim.get("category") or "").lower())):
                 categorized["artifact_check"].append(claim)
             else:
                 # Default to text search for everything else
@@ -1,21 +1,270 @@
 """LLM-based tool for extracting metrics from notebook outputs."""
 
-import json
-from pathlib import Path
-from typing import Dict, Any, List, Optional
+import asyncio
+import hashlib
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import re
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from . import json_utils
+from .async_utils import run_coroutine_sync
+from .llm_response_cache import RESPONSE_CACHE_MAX_AGE, LLMResponseCache, SemanticResponseCache
+from .llm_retry import is_rate_limit_error, retry_on_rate_limit
+from .rate_limiter import AdaptiveConcurrencyLimiter, RateLimiter
 
 try:
     import nbformat
 except ImportError:
     nbformat = None
 
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Embedding model used by the semantic (near-duplicate) cache
+SEMANTIC_CACHE_EMBEDDING_MODEL = "text-embedding-3-small"
+
+_EXTRACTION_SYSTEM_PROMPT = (
+    "You are a precise metric extraction assistant. Always return valid JSON."
+)
+
+_METRIC_LOOK_FOR = """**Look for:**
+- Model performance metrics (AUC, ROC-AUC, accuracy, precision, recall, F1, etc.)
+- Statistical measures (KS statistic, Gini coefficient, R², RMSE, MAE, etc.)
+- Dataset information (training set size, test set size, split ratios, etc.)
+- Any other quantitative metrics related to model performance"""
+
+# Structured output schemas for metric extraction. OpenAI's strict mode needs
+# fixed keys, so metrics come back as a name/value list; Anthropic tool input
+# schemas can describe the open-ended metric object directly.
+_METRIC_VALUE_SCHEMA = {"type": ["number", "string", "null"]}
+_OPENAI_METRIC_LIST_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "value": _METRIC_VALUE_SCHEMA},
+        "required": ["name", "value"],
+        "additionalProperties": False
+    }
+}
+_OPENAI_METRICS_SCHEMA = {
+    "name": "metrics",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {"metrics": _OPENAI_METRIC_LIST_SCHEMA},
+        "required": ["metrics"],
+        "additionalProperties": False
+    }
+}
+_OPENAI_BATCH_METRICS_SCHEMA = {
+    "name": "notebook_metrics",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "notebooks": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "notebook": {"type": "string"},
+                        "metrics": _OPENAI_METRIC_LIST_SCHEMA,
+                    },
+                    "required": ["notebook", "metrics"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["notebooks"],
+        "additionalProperties": False
+    }
+}
+_ANTHROPIC_METRICS_SCHEMA = {"type": "object", "additionalProperties": _METRIC_VALUE_SCHEMA}
+_ANTHROPIC_BATCH_METRICS_SCHEMA = {
+    "type": "object",
+    "additionalProperties": _ANTHROPIC_METRICS_SCHEMA,
+}
+_EMIT_METRICS_TOOL = "emit_metrics"
+
+# Per-request timeout (seconds) for the SDK clients
+_REQUEST_TIMEOUT = 60.0
+
+# SDK-level retries are off: every API call goes through retry_on_rate_limit
+# (_create_*/_acreate_*/_call_with_retry), and stacking both multiplies attempts
+_SDK_MAX_RETRIES = 0
+
+# Response token caps: extracted metrics per notebook, search findings, claim validation
+_EXTRACT_MAX_TOKENS = 1024
+_SEARCH_MAX_TOKENS = 1024
+_VALIDATE_MAX_TOKENS = 512
+
+# Claim validation sends all notebooks in one request when their outputs fit in this many tokens
+_VALIDATE_COMBINED_TOKEN_BUDGET = 8000
+
+# Fixed sampling seed for OpenAI-compatible requests, so repeated runs return the same answers
+_OPENAI_SEED = 0
+
+# Notebook outputs sent to the LLM: per-output char cap and total token budget
+_MAX_OUTPUT_CHARS = 2048
+_OUTPUT_TOKEN_BUDGET = 2000
+
+# Concurrency limiter of the extraction run driving the current task
+# (see _extract_notebooks_async)
+_run_limiter: ContextVar[Optional[AdaptiveConcurrencyLimiter]] = ContextVar(
+    "_run_limiter", default=None
+)
+
+# Parsed notebook outputs kept per extractor, keyed by (path, mtime, size)
+_OUTPUTS_CACHE_SIZE = 256
+
+# Notebooks at least this large are streamed cell by cell (ijson) instead of parsed whole
+_STREAM_READ_MIN_BYTES = 8 * 1024 * 1024
+
+# Metric keywords and decimal numbers; used to rank output cells by signal
+_METRIC_SIGNAL_RE = re.compile(
+    r'\b(?:auc|ks|gini|accuracy|precision|recall|f1|rmse|mae|r2)\b|\d+\.\d+',
+    re.IGNORECASE
+)
+
+# "name = value" / "name: value" metric lines, e.g. "Test ROC-AUC: 0.92", "train_size = 150000".
+# The optional split qualifier is kept so train and test values don't overwrite each other.
+_METRIC_ASSIGNMENT_RE = re.compile(
+    r'\b(?:(train(?:ing)?|test(?:ing)?|val(?:idation)?|oot|holdout)[_ -]?)?'
+    r'(auc|roc[_ -]?auc|gini|ks[_ -]?statistic|accuracy|precision|recall|f1|rmse|mae|r2|'
+    r'train[_ ]size|test[_ ]size)\s*[:=]\s*([-+]?\d+(?:\.\d+)?)\b',
+    re.IGNORECASE
+)
+_METRIC_KEY_SEPARATOR_RE = re.compile(r'[-\s]+')
+
+# Body of a ```json (or plain ```) fenced block, and the outermost {...} in free text
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)```', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def _metrics_from_list(result: Any) -> Any:
+    """Convert a structured {"metrics": [{"name", "value"}]} response to a metrics dict."""
+    if (
+        isinstance(result, dict)
+        and set(result) == {"metrics"}
+        and isinstance(result["metrics"], list)
+    ):
+        return {
+            item["name"]: item.get("value")
+            for item in result["metrics"]
+            if isinstance(item, dict) and "name" in item
+        }
+    return result
+
+
+def _batch_metrics_from_list(result: Any) -> Any:
+    """Convert a structured {"notebooks": [{"notebook", "metrics"}]} response to {name: metrics}."""
+    if (
+        isinstance(result, dict)
+        and set(result) == {"notebooks"}
+        and isinstance(result["notebooks"], list)
+    ):
+        return {
+            item["notebook"]: _metrics_from_list({"metrics": item.get("metrics") or []})
+            for item in result["notebooks"]
+            if isinstance(item, dict) and "notebook" in item
+        }
+    return result
+
+
+def _tool_input(response: Any) -> Any:
+    """Return the input of the first tool_use block, falling back to JSON in the text."""
+    for block in response.content:
+        if getattr(block, "type", None) == "tool_use":
+            return block.input
+    text = next(
+        (block.text for block in response.content if getattr(block, "type", None) == "text"), ""
+    )
+    return json_utils.loads(_extract_json_text(text))
+
+
+def _join_text(value: Any) -> str:
+    """Notebook JSON stores multiline text as either a string or a list of lines."""
+    return value if isinstance(value, str) else "".join(value)
+
+
+def _outputs_digest(outputs_text: str) -> str:
+    """Content hash of a notebook's extracted outputs, used to spot duplicate notebooks."""
+    return hashlib.sha256(outputs_text.encode("utf-8")).hexdigest()
+
+
+def _normalize_metric_key(name: str) -> str:
+    """Lowercase a metric name and join words with underscores ("ROC-AUC" -> "roc_auc")."""
+    return _METRIC_KEY_SEPARATOR_RE.sub("_", name.strip().lower())
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """
+    tiktoken encoding for a model (cl100k_base for unknown models).
+
+    Returns None without tiktoken or when its BPE files cannot be loaded (they are
+    downloaded on first use, which fails offline), so callers fall back to the
+    ~4 chars/token estimate. The result is cached, so a failure is not retried.
+    """
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model.split("/")[-1])
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        print(f"Warning: tiktoken encoding unavailable ({type(e).__name__}: {e}); "
+              "estimating token counts")
+        return None
+
+
+def _extract_json_text(content: str) -> str:
+    """
+    Pull a JSON document out of a free-text response.
+
+    Uses the body of a ```json (or plain ```) fenced block if there is one, the
+    content itself if it is already a bare object or array, and otherwise the
+    outermost {...} in the text. Falls back to the content unchanged.
+    """
+    fence_match = _JSON_FENCE_RE.search(content)
+    if fence_match:
+        return fence_match.group(1).strip()
+    stripped = content.strip()
+    if stripped.startswith(("{", "[")):
+        return stripped
+    object_match = _JSON_OBJECT_RE.search(content)
+    return object_match.group(0) if object_match else content
+
 
 class LLMExtractorTool:
     """Tool that uses LLM to extract metrics from notebook outputs intelligently."""
 
-    def __init__(self, workdir: Optional[str] = None, llm_provider: str = "openai", model: str = None):
+    # Process-wide connection pool for the synchronous SDK clients, so tools
+    # created per request reuse keep-alive connections and TLS sessions
+    _shared_http_client = None
+    _shared_http_lock = threading.Lock()
+    # Synchronous SDK clients by (client class, settings digest), shared the same way
+    _shared_clients: Dict[tuple, Any] = {}
+
+    def __init__(self, workdir: Optional[str] = None, llm_provider: str = "openai",
+                 model: str = None, use_cache: bool = True,
+                 semantic_cache_threshold: Optional[float] = None):
         """
         Initialize LLM extractor tool.
         
@@ -23,18 +272,85 @@ class LLMExtractorTool:
             workdir: Working directory
             llm_provider: LLM provider to use (openai, anthropic, openrouter)
             model: Optional model override
+            use_cache: Reuse parsed responses for identical requests (stored under
+                workdir/.llm_cache for 7 days)
+            semantic_cache_threshold: If set, reuse metrics extracted from an earlier notebook
+                whose outputs embed with at least this cosine similarity (e.g. 0.95; OpenAI
+                provider only). Off by default since near-identical outputs can still differ
+                in their numbers.
         """
         self.workdir = Path(workdir) if workdir else Path.cwd()
         self.llm_provider = llm_provider
         self.model_override = model
+        self.response_cache = LLMResponseCache(
+            self.workdir / ".llm_cache", enabled=use_cache, max_age=RESPONSE_CACHE_MAX_AGE
+        )
+        # Notebook outputs already read by extraction, search or validation (most recent last)
+        self._outputs_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._outputs_cache_lock = threading.Lock()
+        # Requests/tokens per minute, learned from the provider's rate-limit headers
+        self._rate_limiter = RateLimiter()
         self._init_llm()
+        self.semantic_cache = None
+        if semantic_cache_threshold is not None and use_cache and self.client is not None:
+            if self.llm_provider != "openai":
+                print("Warning: Semantic cache needs the OpenAI embeddings API; "
+                      f"disabled for {self.llm_provider}")
+            else:
+                model_id = hashlib.sha256(self.model.encode("utf-8")).hexdigest()[:12]
+                try:
+                    self.semantic_cache = SemanticResponseCache(
+                        self.workdir / ".llm_cache" / f"semantic_{model_id}.npz",
+                        threshold=semantic_cache_threshold
+                    )
+                except ImportError:
+                    print("Warning: numpy not available, semantic cache disabled. "
+                          "Install with: pip install numpy")
+
+    @classmethod
+    def _get_shared_http_client(cls):
+        """Return the shared httpx.Client, creating it on first use."""
+        with cls._shared_http_lock:
+            if cls._shared_http_client is None:
+                import httpx
+                # Timeouts are applied per request by the SDK clients
+                cls._shared_http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_keepalive_connections=32, max_connections=64, keepalive_expiry=30
+                    )
+                )
+            return cls._shared_http_client
+
+    @classmethod
+    def _get_shared_client(cls, client_cls, client_kwargs: Dict[str, Any]):
+        """
+        Return the process-wide SDK client for these settings, creating it on first use.
+
+        Clients are keyed by a digest of their settings (API key included), so
+        tools created with the same provider and credentials share one client.
+        """
+        settings = json_utils.dumps(dict(sorted(client_kwargs.items())))
+        key = (client_cls.__module__, client_cls.__name__, hashlib.sha256(settings).hexdigest())
+        http_client = cls._get_shared_http_client()
+        with cls._shared_http_lock:
+            client = cls._shared_clients.get(key)
+            if client is None:
+                client = client_cls(**client_kwargs, http_client=http_client)
+                cls._shared_clients[key] = client
+            return client
 
     def _init_llm(self):
         """Initialize LLM client based on provider."""
         if self.llm_provider == "openai":
             try:
-                from openai import OpenAI
-                self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+                from openai import AsyncOpenAI, OpenAI
+                self._client_kwargs = {
+                    "api_key": os.getenv("OPENAI_API_KEY"),
+                    "timeout": _REQUEST_TIMEOUT,
+                    "max_retries": _SDK_MAX_RETRIES
+                }
+                self._async_client_cls = AsyncOpenAI
+                self.client = self._get_shared_client(OpenAI, self._client_kwargs)
                 self.model = self.model_override or "gpt-4o-mini"  # Fast and cheap for extraction
             except ImportError:
                 self.client = None
@@ -42,13 +358,19 @@ class LLMExtractorTool:
         
         elif self.llm_provider == "anthropic":
             try:
-                from anthropic import Anthropic
+                from anthropic import Anthropic, AsyncAnthropic
                 api_key = os.getenv("ANTHROPIC_API_KEY")
                 if not api_key:
                     self.client = None
                     print("[ERROR] ANTHROPIC_API_KEY environment variable not set!")
                 else:
-                    self.client = Anthropic(api_key=api_key)
+                    self._client_kwargs = {
+                        "api_key": api_key,
+                        "timeout": _REQUEST_TIMEOUT,
+                        "max_retries": _SDK_MAX_RETRIES
+                    }
+                    self._async_client_cls = AsyncAnthropic
+                    self.client = self._get_shared_client(Anthropic, self._client_kwargs)
                     self.model = self.model_override or "claude-3-haiku-20240307"  # Fast and cheap
                     print(f"[INFO] Anthropic client initialized successfully (model: {self.model})")
             except ImportError:
@@ -60,7 +382,7 @@ class LLMExtractorTool:
         
         elif self.llm_provider == "openrouter":
             try:
-                from openai import OpenAI
+                from openai import AsyncOpenAI, OpenAI
                 api_key = os.getenv("OPENROUTER_API_KEY")
                 if not api_key:
                     self.client = None
@@ -77,12 +399,16 @@ class LLMExtractorTool:
                     
                     client_kwargs = {
                         "api_key": api_key,
-                        "base_url": "https://openrouter.ai/api/v1"
+                        "base_url": "https://openrouter.ai/api/v1",
+                        "timeout": _REQUEST_TIMEOUT,
+                        "max_retries": _SDK_MAX_RETRIES
                     }
                     if default_headers:
                         client_kwargs["default_headers"] = default_headers
                     
-                    self.client = OpenAI(**client_kwargs)
+                    self._client_kwargs = client_kwargs
+                    self._async_client_cls = AsyncOpenAI
+                    self.client = self._get_shared_client(OpenAI, client_kwargs)
                     self.model = self.model_override or "openai/gpt-4o-mini"
             except ImportError:
                 self.client = None
@@ -92,6 +418,57 @@ class LLMExtractorTool:
             self.client = None
             print(f"Warning: Unknown LLM provider: {self.llm_provider}")
     
+    def _response_cache_key(self, system: Optional[str], prompt: str, temperature: float,
+                            max_tokens: int) -> str:
+        """Cache key for a request to the current provider/model."""
+        return LLMResponseCache.make_key(
+            f"{self.llm_provider}:{self.model}", system, prompt,
+            temperature=temperature, max_tokens=max_tokens
+        )
+
+    def _extraction_cache_key(self, prompt: str, max_tokens: int = _EXTRACT_MAX_TOKENS) -> str:
+        """Cache key for a metric-extraction request (shared by the interactive and Batch paths)."""
+        system = None if self.llm_provider == "anthropic" else _EXTRACTION_SYSTEM_PROMPT
+        return self._response_cache_key(system, prompt, 0.1, max_tokens)
+
+    def _embed_outputs(self, outputs_text: str) -> Optional[List[float]]:
+        """Embed notebook outputs for the semantic cache (None if the call fails)."""
+        try:
+            response = self._call_with_retry(
+                self.client.embeddings.create,
+                model=SEMANTIC_CACHE_EMBEDDING_MODEL,
+                input=outputs_text[:8000]
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            print(f"Warning: Embedding request failed, skipping semantic cache: {e}")
+            return None
+
+    def _log_request_preview(self, label: str, prompt: str, temperature: float,
+                             max_tokens: int) -> None:
+        """
+        Print a request preview.
+
+        Controlled by CLAIM_EXTRACT_LOG_REQUEST or LOG_REQUEST = off|truncated|full.
+        """
+        log_mode = (
+            os.environ.get("CLAIM_EXTRACT_LOG_REQUEST")
+            or os.environ.get("LOG_REQUEST")
+            or "truncated"
+        ).lower()
+        if log_mode not in ("truncated", "full"):
+            return
+        if log_mode == "truncated" and len(prompt) > 500:
+            prompt = prompt[:500] + "..."
+        req_preview = {
+            "provider": self.llm_provider,
+            "model": self.model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}]
+        }
+        print(f"[DEBUG] {label} preview: {req_preview}")
+
     def _should_skip_response_format(self) -> bool:
         """Check if current model should skip response_format parameter."""
         if self.llm_provider == "openrouter":
@@ -101,8 +478,112 @@ class LLMExtractorTool:
             return any(problem_model in model_lower for problem_model in problematic_models)
         return False
     
+    @retry_on_rate_limit()
+    def _create_chat_completion(self, **params) -> Any:
+        """Call the OpenAI-compatible chat completions API, retrying on rate limits."""
+        return self.client.chat.completions.create(**params)
+
+    @retry_on_rate_limit()
+    def _create_message(self, **params) -> Any:
+        """Call the Anthropic messages API, retrying on rate limits."""
+        return self.client.messages.create(**params)
+
+    @retry_on_rate_limit()
+    def _call_with_retry(self, func, *args, **kwargs) -> Any:
+        """Run any other SDK call (embeddings, files, batches) with the same retry policy."""
+        return func(*args, **kwargs)
+
+    @retry_on_rate_limit()
+    async def _acreate_chat_completion(self, client, **params) -> Any:
+        """Async chat completions call on ``client``, retrying on rate limits."""
+        return await self._athrottled_create(client.chat.completions, params)
+
+    @retry_on_rate_limit()
+    async def _acreate_message(self, client, **params) -> Any:
+        """Async Anthropic messages call on ``client``, retrying on rate limits."""
+        return await self._athrottled_create(client.messages, params)
+
+    async def _athrottled_create(self, resource, params: Dict[str, Any]) -> Any:
+        """
+        Send one async request within the provider's rate limits.
+
+        Waits for room in the requests/tokens-per-minute budget, then recalibrates
+        it from the response's rate-limit headers. The current run's concurrency
+        limiter (if any) is halved on a rate-limit error and grows on success.
+        """
+        prompt_chars = len(params.get("system") or "") + sum(
+            len(str(message.get("content", ""))) for message in params.get("messages", [])
+        )
+        await self._rate_limiter.acquire(prompt_chars // 4)
+        limiter = _run_limiter.get()
+        try:
+            raw_response = await resource.with_raw_response.create(**params)
+        except Exception as e:
+            if limiter is not None and is_rate_limit_error(e):
+                print(f"[WARN] Rate limited, reducing concurrency to {limiter.on_rate_limit()}")
+            raise
+        self._rate_limiter.update_from_headers(raw_response.headers)
+        if limiter is not None:
+            limiter.on_success()
+        return raw_response.parse()
+
+    def _openai_params(self, messages: List[Dict[str, Any]], temperature: float,
+                       max_tokens: Optional[int], json_format: bool,
+                       json_schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build chat completion parameters (json_schema selects strict structured outputs)."""
+        params = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "seed": _OPENAI_SEED
+        }
+        if json_format:
+            if json_schema:
+                params["response_format"] = {"type": "json_schema", "json_schema": json_schema}
+            else:
+                params["response_format"] = {"type": "json_object"}
+        if max_tokens:
+            params["max_tokens"] = max_tokens
+        return params
+
+    @staticmethod
+    def _log_cached_tokens(response: Any) -> None:
+        """Report prompt tokens served from the provider's prompt cache, if any."""
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if cached_tokens:
+            print(f"[DEBUG] Prompt cache hit: {cached_tokens}/{usage.prompt_tokens} "
+                  "prompt tokens cached")
+
+    @staticmethod
+    def _is_response_format_error(error: Exception) -> bool:
+        """Check whether an API error is the model rejecting response_format."""
+        error_str = str(error).lower()
+        return any(word in error_str for word in ("response_format", "unsupported", "invalid"))
+
+    def _api_error(self, error: Exception) -> Exception:
+        """Wrap an API error, with more detailed information for OpenRouter."""
+        error_msg = str(error)
+        if self.llm_provider == "openrouter":
+            error_lower = error_msg.lower()
+            if "401" in error_msg or "unauthorized" in error_lower:
+                return Exception("OpenRouter API authentication failed. "
+                                 f"Check your OPENROUTER_API_KEY. Error: {error_msg}")
+            elif "404" in error_msg or "not found" in error_lower:
+                return Exception(f"OpenRouter model '{self.model}' not found. Check model name "
+                                 f"format (should be 'provider/model-name'). Error: {error_msg}")
+            elif "429" in error_msg or "rate limit" in error_lower:
+                return Exception("OpenRouter rate limit exceeded. Please wait and try again. "
+                                 f"Error: {error_msg}")
+            elif "insufficient" in error_lower or "balance" in error_lower:
+                return Exception("OpenRouter account balance insufficient. Please add credits. "
+                                 f"Error: {error_msg}")
+        return Exception(f"API call failed: {error_msg}")
+
     def _call_openai_api(self, messages: List[Dict[str, Any]], temperature: float = 0.1, 
-                         max_tokens: Optional[int] = None, use_json_format: bool = False) -> str:
+                         max_tokens: Optional[int] = None, use_json_format: bool = False,
+                         json_schema: Optional[Dict[str, Any]] = None) -> str:
         """
         Make OpenAI/OpenRouter API call with proper error handling and fallback.
         
@@ -111,6 +592,7 @@ class LLMExtractorTool:
             temperature: Temperature setting
             max_tokens: Optional max tokens
             use_json_format: Whether to request JSON format (with fallback)
+            json_schema: Optional strict schema for structured outputs (with use_json_format)
             
         Returns:
             Response content string
@@ -123,81 +605,82 @@ class LLMExtractorTool:
         # Try with response_format if requested and supported
         if use_json_format and not skip_response_format:
             try:
-                params = {
-                    "model": self.model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "response_format": {"type": "json_object"}
-                }
-                if max_tokens:
-                    params["max_tokens"] = max_tokens
-                
-                response = self.client.chat.completions.create(**params)
+                params = self._openai_params(messages, temperature, max_tokens, json_format=True,
+                                             json_schema=json_schema)
+                response = self._create_chat_completion(**params)
+                self._log_cached_tokens(response)
                 return response.choices[0].message.content or ""
             except Exception as e:
-                error_str = str(e).lower()
-                # Check if it's a response_format error
-                if "response_format" in error_str or "unsupported" in error_str or "invalid" in error_str:
-                    print(f"Warning: Model {self.model} doesn't support response_format, retrying without it...")
-                    # Fall through to retry without response_format
-                else:
+                if not self._is_response_format_error(e):
                     # Re-raise if it's not a response_format issue
                     raise
+                print(f"Warning: Model {self.model} doesn't support response_format, "
+                      "retrying without it...")
         
         # Try without response_format (either skipped or as fallback)
-        params = {
-            "model": self.model,
-            "messages": messages,
-            "temperature": temperature
-        }
-        if max_tokens:
-            params["max_tokens"] = max_tokens
+        params = self._openai_params(messages, temperature, max_tokens, json_format=False)
+        try:
+            response = self._create_chat_completion(**params)
+        except Exception as e:
+            raise self._api_error(e)
+        self._log_cached_tokens(response)
+        content = response.choices[0].message.content or ""
+
+        # If JSON was requested but not supported, try to extract JSON from response
+        if use_json_format and content:
+            content = _extract_json_text(content)
+        return content
+
+    async def _acall_openai_api(self, client, messages: List[Dict[str, Any]],
+                                temperature: float = 0.1, max_tokens: Optional[int] = None,
+                                use_json_format: bool = False,
+                                json_schema: Optional[Dict[str, Any]] = None) -> str:
+        """Async version of _call_openai_api using an AsyncOpenAI client."""
+        skip_response_format = self._should_skip_response_format() if use_json_format else False
+
+        if use_json_format and not skip_response_format:
+            try:
+                params = self._openai_params(messages, temperature, max_tokens, json_format=True,
+                                             json_schema=json_schema)
+                response = await self._acreate_chat_completion(client, **params)
+                self._log_cached_tokens(response)
+                return response.choices[0].message.content or ""
+            except Exception as e:
+                if not self._is_response_format_error(e):
+                    raise
+                print(f"Warning: Model {self.model} doesn't support response_format, "
+                      "retrying without it...")
         
+        params = self._openai_params(messages, temperature, max_tokens, json_format=False)
         try:
-            response = self.client.chat.completions.create(**params)
-            content = response.choices[0].message.content or ""
-            
-            # If JSON was requested but not supported, try to extract JSON from response
-            if use_json_format and content:
-                import re
-                # Try to extract JSON from markdown code blocks
-                json_match = re.search(r'```(?:json)?\s*\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    content = json_match.group(1).strip()
-                else:
-                    # Try to find JSON object in text
-                    json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                    if json_match:
-                        content = json_match.group(0)
-            
-            return content
+            response = await self._acreate_chat_completion(client, **params)
         except Exception as e:
-            error_msg = str(e)
-            # Provide more detailed error information for OpenRouter
-            if self.llm_provider == "openrouter":
-                if "401" in error_msg or "unauthorized" in error_msg.lower():
-                    raise Exception(f"OpenRouter API authentication failed. Check your OPENROUTER_API_KEY. Error: {error_msg}")
-                elif "404" in error_msg or "not found" in error_msg.lower():
-                    raise Exception(f"OpenRouter model '{self.model}' not found. Check model name format (should be 'provider/model-name'). Error: {error_msg}")
-                elif "429" in error_msg or "rate limit" in error_msg.lower():
-                    raise Exception(f"OpenRouter rate limit exceeded. Please wait and try again. Error: {error_msg}")
-                elif "insufficient" in error_msg.lower() or "balance" in error_msg.lower():
-                    raise Exception(f"OpenRouter account balance insufficient. Please add credits. Error: {error_msg}")
-            raise Exception(f"API call failed: {error_msg}")
+            raise self._api_error(e)
+        self._log_cached_tokens(response)
+        content = response.choices[0].message.content or ""
+
+        if use_json_format and content:
+            content = _extract_json_text(content)
+        return content
 
     def extract_metrics_from_notebooks(
         self, 
         notebook_paths: List[str],
         claimed_metrics: Dict[str, Any],
-        max_workers: int = 1
+        max_workers: int = 5,
+        batch_size: int = 4
     ) -> Dict[str, Any]:
         """
         Extract metrics from notebook outputs using LLM with parallel processing.
         
+        Notebooks are read on a thread pool while earlier batches are already
+        waiting on the LLM, so disk and JSON parsing overlap with network time.
+
         Args:
             notebook_paths: List of notebook file paths
             claimed_metrics: Metrics claimed in model card (for context)
-            max_workers: Maximum number of parallel workers (default: 5)
+            max_workers: Maximum number of concurrent LLM requests (default: 5)
+            batch_size: Notebooks combined into one LLM request (1 = one request per notebook)
             
         Returns:
             Dictionary of extracted metrics with metadata
@@ -205,133 +688,593 @@ class LLMExtractorTool:
         if not self.client:
             return {"error": "LLM client not initialized"}
         
-        all_metrics = {}
+        print(f"Processing {len(notebook_paths)} notebooks "
+              f"(up to {max_workers} concurrent LLM requests)...")
+        results = run_coroutine_sync(self._extract_notebooks_async(
+            notebook_paths, claimed_metrics, max(1, max_workers), max(1, batch_size)
+        ))
+        print(f"Completed processing of {len(notebook_paths)} notebooks")
+        return self._merge_notebook_metrics(notebook_paths, results)
+
+    def _prepare_notebook(self, nb_path: str, claimed_metrics: Dict[str, Any]) -> tuple:
+        """
+        Read a notebook and try to resolve it without an LLM call.
+
+        Returns:
+            (metrics, outputs_text, embedding); metrics is None when the notebook
+            still needs an LLM request
+        """
+        outputs_text = self._read_notebook_outputs(nb_path)
+        if not outputs_text:
+            return {}, outputs_text, None
+
+        fast_metrics = self._regex_fastpath(outputs_text)
+        if self._fastpath_covers_claims(fast_metrics, claimed_metrics):
+            return fast_metrics, outputs_text, None
+
+        # Single-notebook responses (e.g. from the Batch API) are reused even when
+        # this notebook would otherwise be grouped into a multi-notebook request
+        if self.response_cache.enabled:
+            prompt = self._build_extraction_prompt(
+                outputs_text, claimed_metrics, Path(nb_path).name
+            )
+            cached = self.response_cache.get(self._extraction_cache_key(prompt))
+            if cached is not None:
+                return cached, outputs_text, None
+
+        embedding = None
+        if self.semantic_cache is not None:
+            embedding = self._embed_outputs(outputs_text)
+            if embedding is not None:
+                cached = self.semantic_cache.get(embedding)
+                if cached is not None:
+                    return cached, outputs_text, embedding
+
+        return None, outputs_text, embedding
+
+    @staticmethod
+    def _regex_fastpath(outputs_text: str) -> Dict[str, Any]:
+        """
+        Extract "name = value" / "name: value" metrics with a regex, without the LLM.
+
+        Keys are normalized to lowercase with underscores and keep any split
+        qualifier ("Test AUC" -> "test_auc"). A key printed with different values
+        is ambiguous and left out.
+        """
+        metrics: Dict[str, Any] = {}
+        conflicting = set()
+        for split, name, value in _METRIC_ASSIGNMENT_RE.findall(outputs_text):
+            key = _normalize_metric_key(f"{split} {name}" if split else name)
+            number = float(value) if "." in value else int(value)
+            if key in metrics and metrics[key] != number:
+                conflicting.add(key)
+            metrics[key] = number
+        for key in conflicting:
+            del metrics[key]
+        return metrics
+
+    @staticmethod
+    def _fastpath_covers_claims(fast_metrics: Dict[str, Any],
+                                claimed_metrics: Dict[str, Any]) -> bool:
+        """
+        Check whether the regex found every claimed metric, so the LLM call can be skipped.
+
+        Claimed metrics may be flat or grouped by model type, as in the card spec.
+        """
+        if not fast_metrics or not claimed_metrics:
+            return False
+        claimed = set()
+        for name, value in claimed_metrics.items():
+            names = value.keys() if isinstance(value, dict) else [name]
+            claimed.update(_normalize_metric_key(str(metric)) for metric in names)
+        return claimed.issubset(fast_metrics)
+
+    def _create_async_client(self, max_connections: int):
+        """
+        Create an async LLM client for one extraction run.
+
+        Async clients are bound to the event loop they are used on, so a fresh
+        client is created per run and closed when the run finishes. Its pool keeps
+        ``max_connections`` connections alive so concurrent requests reuse them.
+        """
+        import httpx
+
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            timeout=_REQUEST_TIMEOUT,
+        )
+        return self._async_client_cls(http_client=http_client, **self._client_kwargs)
+
+    async def _extract_notebooks_async(
+        self,
+        notebook_paths: List[str],
+        claimed_metrics: Dict[str, Any],
+        max_workers: int,
+        batch_size: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Read notebooks and run their extraction requests as a pipeline on one event loop.
+
+        Reads run on a thread pool; as soon as ``batch_size`` notebooks needing the
+        LLM have been read (in input order), their request is started. At most
+        ``max_workers`` requests are in flight at once; the limit is halved when the
+        provider rate-limits a request and recovers as requests succeed. Notebooks whose outputs are
+        identical to an earlier one's are not sent again; they share its result.
+        A failed read or batch is logged and yields empty metrics.
+
+        Returns:
+            Extracted metrics per notebook path
+        """
+        loop = asyncio.get_running_loop()
+        total = len(notebook_paths)
+        completed = 0
+        results: Dict[str, Dict[str, Any]] = {}
+        client = self._create_async_client(max_workers * 2)
+        limiter = AdaptiveConcurrencyLimiter(max_workers)
+        # Worker tasks inherit the limiter through their copy of this context
+        limiter_token = _run_limiter.set(limiter)
         
-        def process_notebook(nb_path: str) -> tuple[str, Dict[str, Any]]:
-            """Process a single notebook and return its metrics."""
+        async def worker(batch: List[tuple]) -> None:
+            nonlocal completed
+            async with limiter:
+                try:
+                    batch_results = await self._allm_extract_metrics_batch(
+                        client,
+                        [(nb_path, outputs_text) for nb_path, outputs_text, _ in batch],
+                        claimed_metrics
+                    )
+                except Exception as e:
+                    print(f"Error extracting from batch of {len(batch)} notebooks: {e}")
+                    batch_results = [{} for _ in batch]
+            for (nb_path, _, embedding), extracted in zip(batch, batch_results):
+                completed += 1
+                results[nb_path] = extracted
+                if embedding is not None and extracted:
+                    self.semantic_cache.set(embedding, extracted)
+                print(f"  [{completed}/{total}] Processed {Path(nb_path).name}")
+
+        tasks = []
+        # Notebooks waiting for a full batch: (path, outputs_text, embedding)
+        pending: List[tuple] = []
+        # Outputs digest -> first notebook sent with it; duplicate path -> that notebook
+        first_by_digest: Dict[str, str] = {}
+        duplicate_of: Dict[str, str] = {}
+        try:
+            with ThreadPoolExecutor(thread_name_prefix="nb-reader") as readers:
+                reads = [
+                    (nb_path, loop.run_in_executor(
+                        readers, self._prepare_notebook, nb_path, claimed_metrics
+                    ))
+                    for nb_path in notebook_paths
+                ]
+                for nb_path, read in reads:
+                    try:
+                        metrics, outputs_text, embedding = await read
+                    except Exception as e:
+                        print(f"Error extracting from {nb_path}: {e}")
+                        metrics = {}
+                    if metrics is not None:
+                        completed += 1
+                        results[nb_path] = metrics
+                        note = " (no LLM call)" if metrics else ""
+                        print(f"  [{completed}/{total}] Processed {Path(nb_path).name}{note}")
+                        continue
+                    digest = _outputs_digest(outputs_text)
+                    if digest in first_by_digest:
+                        duplicate_of[nb_path] = first_by_digest[digest]
+                        continue
+                    first_by_digest[digest] = nb_path
+                    pending.append((nb_path, outputs_text, embedding))
+                    if len(pending) >= batch_size:
+                        tasks.append(asyncio.create_task(worker(pending)))
+                        pending = []
+            if pending:
+                tasks.append(asyncio.create_task(worker(pending)))
+            await asyncio.gather(*tasks)
+        finally:
+            _run_limiter.reset(limiter_token)
+            await client.close()
+            if self.semantic_cache is not None:
+                # Entries were only added in memory; write the index once, off the loop
+                await loop.run_in_executor(None, self.semantic_cache.save)
+        for nb_path, original in duplicate_of.items():
+            completed += 1
+            results[nb_path] = results.get(original, {})
+            print(f"  [{completed}/{total}] Processed {Path(nb_path).name} "
+                  f"(same outputs as {Path(original).name})")
+        return results
+
+    def extract_metrics_from_notebooks_batch(
+        self,
+        notebook_paths: List[str],
+        claimed_metrics: Dict[str, Any],
+        poll_interval: float = 30.0,
+        max_poll_interval: float = 600.0,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract metrics using the provider's asynchronous Batch API.
+
+        Intended for non-interactive runs: requests are billed at the batch
+        discount (~50%) but may take up to 24h to complete. Supported for the
+        openai and anthropic providers. Responses are stored in the response
+        cache under the single-notebook request key, which
+        extract_metrics_from_notebooks checks for every notebook before grouping
+        notebooks into requests, so later runs reuse them at any batch_size.
+
+        Args:
+            notebook_paths: List of notebook file paths
+            claimed_metrics: Metrics claimed in model card (for context)
+            poll_interval: Initial seconds between status checks (doubles up to max_poll_interval)
+            max_poll_interval: Upper bound for the polling interval
+            timeout: Cancel the batch and return an error after this many seconds
+                (None = wait for the batch to finish)
+
+        Returns:
+            Dictionary of extracted metrics with metadata, or {"error": ...} if the
+            batch could not be submitted or did not finish in time
+        """
+        if not self.client:
+            return {"error": "LLM client not initialized"}
+        if self.llm_provider not in ("openai", "anthropic"):
+            return {"error": f"Batch API not supported for provider: {self.llm_provider}"}
+
+        results: Dict[str, Dict[str, Any]] = {}
+        # custom_id -> (notebook path, response cache key)
+        requests: Dict[str, tuple] = {}
+        batch_lines: List[Dict[str, Any]] = []
+        # Outputs digest -> first notebook with it; duplicate path -> that notebook
+        first_by_digest: Dict[str, str] = {}
+        duplicate_of: Dict[str, str] = {}
+
+        for index, nb_path in enumerate(notebook_paths):
             try:
-                # Read notebook outputs
                 outputs_text = self._read_notebook_outputs(nb_path)
-                
-                if not outputs_text:
-                    return nb_path, {}
-                
-                # Use LLM to extract metrics
-                extracted = self._llm_extract_metrics(
-                    outputs_text=outputs_text,
-                    claimed_metrics=claimed_metrics,
-                    notebook_name=Path(nb_path).name
-                )
-                
-                return nb_path, extracted
-                    
             except Exception as e:
-                print(f"Error extracting from {nb_path}: {e}")
-                return nb_path, {}
+                print(f"Error reading {nb_path}: {e}")
+                outputs_text = ""
+            if not outputs_text:
+                results[nb_path] = {}
+                continue
+            digest = _outputs_digest(outputs_text)
+            if digest in first_by_digest:
+                duplicate_of[nb_path] = first_by_digest[digest]
+                continue
+            first_by_digest[digest] = nb_path
+
+            prompt = self._build_extraction_prompt(
+                outputs_text, claimed_metrics, Path(nb_path).name
+            )
+            custom_id = f"nb-{index}"
+            # Same request parameters (and output format) as the interactive path,
+            # since both store their results under the same response cache key
+            if self.llm_provider == "openai":
+                body = self._openai_params(
+                    [
+                        {"role": "system", "content": _EXTRACTION_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.1,
+                    max_tokens=_EXTRACT_MAX_TOKENS,
+                    json_format=True,
+                    json_schema=self._openai_metrics_schema(batch=False)
+                )
+                line = {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body,
+                }
+            else:
+                line = {
+                    "custom_id": custom_id,
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": _EXTRACT_MAX_TOKENS,
+                        "temperature": 0.1,
+                        "messages": [{"role": "user", "content": prompt}],
+                        **self._anthropic_tool_params(batch=False)
+                    }
+                }
+
+            cache_key = self._extraction_cache_key(prompt)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                results[nb_path] = cached
+                continue
+            requests[custom_id] = (nb_path, cache_key)
+            batch_lines.append(line)
         
-        # Process notebooks sequentially
-        print(f"Processing {len(notebook_paths)} notebooks sequentially...")
-        completed = 0
-        total = len(notebook_paths)
-        for nb_path in notebook_paths:
-            completed += 1
+        if batch_lines:
+            print(f"Submitting {len(batch_lines)} notebooks to the {self.llm_provider} "
+                  "Batch API...")
+            if self.llm_provider == "openai":
+                run_batch = self._run_openai_batch
+            else:
+                run_batch = self._run_anthropic_batch
             try:
-                nb_path, extracted = process_notebook(nb_path)
-                for metric, value in extracted.items():
-                    if metric.startswith("_"):
-                        continue
-                    all_metrics[metric] = value
-                    all_metrics[f"_{metric}_file"] = Path(nb_path).name
-                print(f"  [{completed}/{total}] Processed {Path(nb_path).name}")
+                batch_metrics = run_batch(batch_lines, poll_interval, max_poll_interval, timeout)
+            except TimeoutError as e:
+                return {"error": str(e)}
             except Exception as e:
-                print(f"  [{completed}/{total}] Failed {Path(nb_path).name}: {e}")
+                print(f"Batch API error: {type(e).__name__}: {e}")
+                return {"error": f"Batch API request failed: {e}"}
+
+            for custom_id, (nb_path, cache_key) in requests.items():
+                metrics = batch_metrics.get(custom_id)
+                if metrics is None:
+                    print(f"Batch request failed for {nb_path}")
+                    results[nb_path] = {}
+                    continue
+                self.response_cache.set(cache_key, metrics)
+                results[nb_path] = metrics
         
-        print(f"Completed sequential processing of {len(notebook_paths)} notebooks")
+        for nb_path, original in duplicate_of.items():
+            results[nb_path] = results.get(original, {})
+        return self._merge_notebook_metrics(notebook_paths, results)
+
+    def _wait_for_batch(self, retrieve, is_done, cancel, poll_interval: float,
+                        max_poll_interval: float, timeout: Optional[float]):
+        """
+        Poll ``retrieve()`` with exponential backoff until ``is_done(batch)``.
+
+        On timeout the batch is cancelled with ``cancel()``, so unfinished requests
+        stop being billed, and TimeoutError is raised with the batch id.
+        """
+        started = time.monotonic()
+        delay = poll_interval
+        batch = retrieve()
+        while not is_done(batch):
+            if timeout is not None and time.monotonic() - started + delay > timeout:
+                try:
+                    cancel()
+                    outcome = "cancelled"
+                except Exception as e:
+                    outcome = f"cancel failed: {e}"
+                raise TimeoutError(
+                    f"Batch {batch.id} did not finish within {timeout:.0f}s ({outcome})"
+                )
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            batch = retrieve()
+        return batch
+
+    def _run_openai_batch(self, batch_lines: List[Dict[str, Any]], poll_interval: float,
+                          max_poll_interval: float, timeout: Optional[float]) -> Dict[str, Any]:
+        """Run extraction requests through the OpenAI Batch API; returns metrics per custom_id."""
+        payload = b"\n".join(json_utils.dumps(line) for line in batch_lines)
+        input_file = self._call_with_retry(
+            self.client.files.create, file=("batch.jsonl", payload), purpose="batch"
+        )
+        batch = self._call_with_retry(
+            self.client.batches.create,
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"[INFO] OpenAI batch {batch.id} created")
+        batch = self._wait_for_batch(
+            lambda: self._call_with_retry(self.client.batches.retrieve, batch.id),
+            lambda b: b.status in ("completed", "failed", "expired", "cancelled"),
+            lambda: self._call_with_retry(self.client.batches.cancel, batch.id),
+            poll_interval, max_poll_interval, timeout
+        )
+        print(f"[INFO] OpenAI batch {batch.id} finished with status: {batch.status}")
+
+        batch_metrics: Dict[str, Any] = {}
+        if not batch.output_file_id:
+            return batch_metrics
+        output = self._call_with_retry(self.client.files.content, batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json_utils.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                continue
+            content = response["body"]["choices"][0]["message"]["content"] or ""
+            try:
+                result = json_utils.loads(_extract_json_text(content))
+                batch_metrics[record["custom_id"]] = _metrics_from_list(result)
+            except ValueError as e:
+                print(f"Error parsing batch response {record['custom_id']}: {e}")
+        return batch_metrics
+
+    def _run_anthropic_batch(self, batch_lines: List[Dict[str, Any]], poll_interval: float,
+                             max_poll_interval: float, timeout: Optional[float]) -> Dict[str, Any]:
+        """Run extraction requests through Anthropic Message Batches (metrics per custom_id)."""
+        batch = self._call_with_retry(self.client.messages.batches.create, requests=batch_lines)
+        print(f"[INFO] Anthropic batch {batch.id} created")
+        batch = self._wait_for_batch(
+            lambda: self._call_with_retry(self.client.messages.batches.retrieve, batch.id),
+            lambda b: b.processing_status == "ended",
+            lambda: self._call_with_retry(self.client.messages.batches.cancel, batch.id),
+            poll_interval, max_poll_interval, timeout
+        )
+        print(f"[INFO] Anthropic batch {batch.id} ended")
+
+        batch_metrics: Dict[str, Any] = {}
+        for entry in self._call_with_retry(self.client.messages.batches.results, batch.id):
+            if entry.result.type != "succeeded":
+                continue
+            try:
+                batch_metrics[entry.custom_id] = _tool_input(entry.result.message)
+            except ValueError as e:
+                print(f"Error parsing batch response {entry.custom_id}: {e}")
+        return batch_metrics
+
+    def _merge_notebook_metrics(
+        self,
+        notebook_paths: List[str],
+        results: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Merge per-notebook metrics in input order (later notebooks take precedence)."""
+        all_metrics = {}
+        for nb_path in notebook_paths:
+            for metric, value in results.get(nb_path, {}).items():
+                if metric.startswith("_"):
+                    continue
+                all_metrics[metric] = value
+                all_metrics[f"_{metric}_file"] = Path(nb_path).name
         return all_metrics
 
     def _read_notebook_outputs(self, notebook_path: str) -> str:
         """
         Read all output cells from a notebook.
         
+        Each output's text is capped at 2048 chars. If the combined outputs exceed
+        the token budget, the cells with the most metric-like content (metric
+        keywords and decimal numbers) are kept, in notebook order. Results are
+        cached until the file's mtime or size changes, so extraction, search and
+        validation over the same notebooks parse each one once.
+
         Args:
             notebook_path: Path to notebook file
             
         Returns:
             Combined text of all outputs
         """
-        if nbformat is None:
-            raise ImportError("nbformat is required")
-        
-        nb_path_obj = Path(notebook_path)
-        if not nb_path_obj.exists():
+        try:
+            stat = os.stat(notebook_path)
+        except FileNotFoundError:
             return ""
+        key = (os.path.abspath(notebook_path), stat.st_mtime_ns, stat.st_size)
+        with self._outputs_cache_lock:
+            outputs_text = self._outputs_cache.get(key)
+            if outputs_text is not None:
+                self._outputs_cache.move_to_end(key)
+                return outputs_text
         
-        nb = nbformat.read(str(nb_path_obj), as_version=4)
+        outputs_text = self._parse_notebook_outputs(Path(notebook_path))
+        with self._outputs_cache_lock:
+            self._outputs_cache[key] = outputs_text
+            if len(self._outputs_cache) > _OUTPUTS_CACHE_SIZE:
+                self._outputs_cache.popitem(last=False)
+        return outputs_text
+
+    def _parse_notebook_outputs(self, nb_path_obj: Path) -> str:
+        """Extract and trim the output text of a notebook (uncached; see _read_notebook_outputs)."""
+        cells = self._load_notebook_cells(nb_path_obj)
         
-        # Early cap combined outputs to avoid building huge strings
-        max_chars = 8000
-        total_len = 0
-        chunks: List[str] = []
+        max_chars = _MAX_OUTPUT_CHARS
+        blocks: List[str] = []
         
-        for cell_idx, cell in enumerate(nb.cells):
-            if total_len >= max_chars:
-                break
-            if cell.cell_type != "code" or not cell.outputs:
+        for cell_idx, cell in enumerate(cells):
+            outputs = cell.get("outputs")
+            if cell.get("cell_type") != "code" or not outputs:
                 continue
             
             cell_chunks: List[str] = []
-            for output in cell.outputs:
-                if total_len >= max_chars:
-                    break
+            for output in outputs:
+                output_type = output.get("output_type")
                 # Stream output (print statements)
-                if output.output_type == "stream":
-                    text = output.text if isinstance(output.text, str) else "".join(output.text)
+                if output_type == "stream":
+                    text = _join_text(output.get("text", ""))
                     if text:
-                        remaining = max_chars - total_len
-                        snippet = text[:remaining]
-                        cell_chunks.append(snippet)
-                        total_len += len(snippet)
+                        cell_chunks.append(text[:max_chars])
                 
                 # Execute result (returned values)
-                elif output.output_type == "execute_result":
+                elif output_type == "execute_result":
                     data = output.get("data", {})
-                    if "text/plain" in data and total_len < max_chars:
-                        text = data["text/plain"]
-                        remaining = max_chars - total_len
-                        snippet = text[:remaining]
-                        cell_chunks.append(snippet)
-                        total_len += len(snippet)
-                    if "text/html" in data and total_len < max_chars:
+                    if "text/plain" in data:
+                        cell_chunks.append(_join_text(data["text/plain"])[:max_chars])
+                    if "text/html" in data:
                         # Include small teaser for HTML
-                        html_snip = f"[HTML Output]: {data['text/html'][:200]}"
-                        remaining = max_chars - total_len
-                        snippet = html_snip[:remaining]
-                        cell_chunks.append(snippet)
-                        total_len += len(snippet)
+                        cell_chunks.append(f"[HTML Output]: {_join_text(data['text/html'])[:200]}")
                 
-                # Display data
-                elif output.output_type == "display_data":
+                # Display data (image-only outputs have no text/plain and are skipped)
+                elif output_type == "display_data":
                     data = output.get("data", {})
-                    if "text/plain" in data and total_len < max_chars:
-                        text = data["text/plain"]
-                        remaining = max_chars - total_len
-                        snippet = text[:remaining]
-                        cell_chunks.append(snippet)
-                        total_len += len(snippet)
+                    if "text/plain" in data:
+                        cell_chunks.append(_join_text(data["text/plain"])[:max_chars])
             
-            if cell_chunks and total_len < max_chars:
-                header = f"--- Cell {cell_idx} Output ---\n"
-                remaining = max_chars - total_len
-                header_snip = header[:remaining]
-                chunks.append(header_snip)
-                total_len += len(header_snip)
-                body = "\n".join(cell_chunks)
-                remaining = max_chars - total_len
-                body_snip = body[:remaining]
-                chunks.append(body_snip)
-                total_len += len(body_snip)
-        
-        return "\n\n".join(chunks)
+            if cell_chunks:
+                blocks.append(f"--- Cell {cell_idx} Output ---\n" + "\n".join(cell_chunks))
+
+        return self._select_output_blocks(blocks)
+
+    def _load_notebook_cells(self, nb_path: Path) -> Iterable[Dict[str, Any]]:
+        """
+        Load a notebook's cells as plain dicts.
+
+        Outputs are only read, so the raw JSON is parsed without nbformat's schema
+        validation. Notebooks of at least _STREAM_READ_MIN_BYTES are streamed one
+        cell at a time with ijson (when installed), so large embedded images never
+        sit in memory all at once. nbformat is the fallback for malformed or pre-v4
+        notebooks.
+        """
+        if ijson is not None and nb_path.stat().st_size >= _STREAM_READ_MIN_BYTES:
+            return self._stream_notebook_cells(nb_path)
+        try:
+            return json_utils.loads(nb_path.read_bytes())["cells"]
+        except (ValueError, KeyError, TypeError):
+            return self._read_cells_with_nbformat(nb_path)
+
+    def _stream_notebook_cells(self, nb_path: Path) -> Iterator[Dict[str, Any]]:
+        """Yield cells one at a time with ijson; stops at the first parse error."""
+        streamed = 0
+        try:
+            with open(nb_path, 'rb') as f:
+                for cell in ijson.items(f, 'cells.item', use_float=True):
+                    streamed += 1
+                    yield cell
+        except ijson.JSONError as e:
+            print(f"Warning: Stopped reading {nb_path.name} after {streamed} cells: {e}")
+            return
+        if streamed == 0:
+            # No top-level cells list (pre-v4 notebook)
+            yield from self._read_cells_with_nbformat(nb_path)
+
+    @staticmethod
+    def _read_cells_with_nbformat(nb_path: Path) -> List[Dict[str, Any]]:
+        if nbformat is None:
+            raise ImportError("nbformat is required")
+        return nbformat.read(str(nb_path), as_version=4).cells
+
+    def _select_output_blocks(self, blocks: List[str],
+                              max_tokens: int = _OUTPUT_TOKEN_BUDGET) -> str:
+        """Join cell output blocks, keeping the highest-signal ones when over the token budget."""
+        token_counts = [self._count_tokens(block) for block in blocks]
+        if sum(token_counts) <= max_tokens:
+            return "\n\n".join(blocks)
+
+        # Most metric mentions first; on ties prefer later cells (final values)
+        ranked = sorted(
+            range(len(blocks)),
+            key=lambda i: (len(_METRIC_SIGNAL_RE.findall(blocks[i])), i),
+            reverse=True
+        )
+        keep = set()
+        used = 0
+        for i in ranked:
+            if used + token_counts[i] <= max_tokens:
+                keep.add(i)
+                used += token_counts[i]
+        if not keep:
+            return self._trim_to_tokens(blocks[ranked[0]], max_tokens)
+        return "\n\n".join(blocks[i] for i in sorted(keep))
+
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens with tiktoken, or estimate (~4 chars per token) when unavailable."""
+        encoding = _get_encoding(self.model)
+        if encoding is None:
+            return len(text) // 4 + 1
+        return len(encoding.encode(text, disallowed_special=()))
+
+    def _trim_to_tokens(self, text: str, max_tokens: int = _OUTPUT_TOKEN_BUDGET) -> str:
+        """Truncate text to at most ``max_tokens`` tokens."""
+        encoding = _get_encoding(self.model)
+        if encoding is None:
+            max_chars = max_tokens * 4
+            if len(text) <= max_chars:
+                return text
+            return text[:max_chars] + "\n... [truncated]"
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return encoding.decode(tokens[:max_tokens]) + "\n... [truncated]"
 
     def _llm_extract_metrics(
         self,
@@ -361,44 +1304,111 @@ class LLMExtractorTool:
         else:
             return {}
 
+    async def _allm_extract_metrics_batch(
+        self,
+        client,
+        items: List[tuple],
+        claimed_metrics: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Use one LLM request to extract metrics from one or more notebooks.
+
+        Args:
+            client: Async LLM client for this run
+            items: (notebook_path, outputs_text) pairs
+            claimed_metrics: Metrics claimed in model card
+
+        Returns:
+            Extracted metrics dictionary per item, in the same order
+        """
+        if len(items) == 1:
+            nb_path, outputs_text = items[0]
+            prompt = self._build_extraction_prompt(
+                outputs_text, claimed_metrics, Path(nb_path).name
+            )
+            return [await self._aextract(client, prompt, batch=False)]
+
+        labels = [Path(nb_path).name for nb_path, _ in items]
+        if len(set(labels)) != len(labels):
+            # Same file name in different directories; label by full path instead
+            labels = [str(nb_path) for nb_path, _ in items]
+
+        prompt = self._build_batch_extraction_prompt(
+            [(label, outputs_text) for label, (_, outputs_text) in zip(labels, items)],
+            claimed_metrics
+        )
+        # Leave room for each notebook's metrics in the response
+        response = await self._aextract(
+            client, prompt, batch=True, max_tokens=_EXTRACT_MAX_TOKENS * len(items)
+        )
+
+        results = []
+        for label in labels:
+            metrics = response.get(label) if isinstance(response, dict) else None
+            results.append(metrics if isinstance(metrics, dict) else {})
+        return results
+
+    async def _aextract(self, client, prompt: str, batch: bool,
+                        max_tokens: int = _EXTRACT_MAX_TOKENS) -> Dict[str, Any]:
+        """Run an extraction prompt (single or batched notebooks) on the configured provider."""
+        if self.llm_provider in ["openai", "openrouter"]:
+            return await self._aextract_with_openai(
+                client, prompt, max_tokens=max_tokens, batch=batch
+            )
+        elif self.llm_provider == "anthropic":
+            return await self._aextract_with_anthropic(
+                client, prompt, max_tokens=max_tokens, batch=batch
+            )
+        return {}
+
+    def _openai_metrics_schema(self, batch: bool) -> Optional[Dict[str, Any]]:
+        """Strict structured-output schema for extraction (OpenAI only; OpenRouter models vary)."""
+        if self.llm_provider != "openai":
+            return None
+        return _OPENAI_BATCH_METRICS_SCHEMA if batch else _OPENAI_METRICS_SCHEMA
+
+    @staticmethod
+    def _anthropic_tool_params(batch: bool) -> Dict[str, Any]:
+        """Force Anthropic to answer through a tool call whose input is the metrics object."""
+        return {
+            "tools": [{
+                "name": _EMIT_METRICS_TOOL,
+                "description": "Report the metrics extracted from the notebook outputs.",
+                "input_schema": (
+                    _ANTHROPIC_BATCH_METRICS_SCHEMA if batch else _ANTHROPIC_METRICS_SCHEMA
+                ),
+            }],
+            "tool_choice": {"type": "tool", "name": _EMIT_METRICS_TOOL}
+        }
+
     def _build_extraction_prompt(
         self,
         outputs_text: str,
         claimed_metrics: Dict[str, Any],
         notebook_name: str
     ) -> str:
-        """Build prompt for metric extraction."""
+        """
+        Build prompt for metric extraction.
+
+        Instructions and claimed metrics come first and the notebook last, so every
+        notebook in a run shares the same prompt prefix (reused by provider prompt caching).
+        """
         
         # Format claimed metrics for context
-        claimed_str = json.dumps(claimed_metrics, indent=2) if claimed_metrics else "None"
+        claimed_str = "None"
+        if claimed_metrics:
+            claimed_str = json_utils.dumps(claimed_metrics, indent=True).decode("utf-8")
         
         # Truncate outputs if too long
-        max_length = 8000
-        if len(outputs_text) > max_length:
-            outputs_text = outputs_text[:max_length] + "\n... [truncated]"
+        outputs_text = self._trim_to_tokens(outputs_text)
         
         prompt = f"""You are analyzing output cells from a Jupyter notebook to extract machine learning metrics.
 
-**Notebook:** {notebook_name}
-
-**Claimed Metrics (from model card):**
-```json
-{claimed_str}
-```
-
-**Notebook Output Cells:**
-```
-{outputs_text}
-```
-
 **Task:**
-Extract all machine learning metrics and performance indicators from the notebook outputs.
+Extract all machine learning metrics and performance indicators from the notebook outputs
+given at the end.
 
-**Look for:**
-- Model performance metrics (AUC, ROC-AUC, accuracy, precision, recall, F1, etc.)
-- Statistical measures (KS statistic, Gini coefficient, R², RMSE, MAE, etc.)
-- Dataset information (training set size, test set size, split ratios, etc.)
-- Any other quantitative metrics related to model performance
+{_METRIC_LOOK_FOR}
 
 **Output Format:**
 Return ONLY a valid JSON object with extracted metrics. Use lowercase keys with underscores.
@@ -420,25 +1430,107 @@ Example:
 If a metric appears multiple times, use the most recent or final value.
 If no metrics are found, return an empty object: {{}}.
 
+**Claimed Metrics (from model card):**
+```json
+{claimed_str}
+```
+
+**Notebook:** {notebook_name}
+
+**Notebook Output Cells:**
+```
+{outputs_text}
+```
+
 Extract the metrics now:"""
 
         return prompt
 
-    def _extract_with_openai(self, prompt: str) -> Dict[str, Any]:
+    def _build_batch_extraction_prompt(
+        self,
+        notebooks: List[tuple],
+        claimed_metrics: Dict[str, Any]
+    ) -> str:
+        """
+        Build prompt for metric extraction from several (notebook_name, outputs_text) pairs.
+
+        Laid out like _build_extraction_prompt: shared instructions first, notebooks last.
+        """
+
+        claimed_str = "None"
+        if claimed_metrics:
+            claimed_str = json_utils.dumps(claimed_metrics, indent=True).decode("utf-8")
+
+        sections = []
+        for notebook_name, outputs_text in notebooks:
+            outputs_text = self._trim_to_tokens(outputs_text)
+            sections.append(f"### Notebook: {notebook_name}\n```\n{outputs_text}\n```\n---\n")
+        notebook_sections = "\n".join(sections)
+        names = [notebook_name for notebook_name, _ in notebooks]
+        names_str = json_utils.dumps(names).decode("utf-8")
+
+        prompt = f"""You are analyzing output cells from several Jupyter notebooks to extract
+machine learning metrics.
+
+**Task:**
+Extract all machine learning metrics and performance indicators from each notebook's outputs
+(given at the end), keeping each notebook's metrics separate.
+
+{_METRIC_LOOK_FOR}
+
+**Output Format:**
+Return ONLY a valid JSON object with one key per notebook, using exactly the notebook names
+listed at the end. Each value is an object of that notebook's extracted metrics, using
+lowercase keys with underscores.
+
+Example:
+```json
+{{
+  "train.ipynb": {{"auc": 0.8542, "ks_statistic": 0.45, "train_size": 150000}},
+  "evaluate.ipynb": {{"accuracy": 0.89, "precision": 0.87, "recall": 0.82}}
+}}
+```
+
+If a metric appears multiple times in a notebook, use the most recent or final value.
+If no metrics are found in a notebook, use an empty object for it: {{}}.
+
+**Claimed Metrics (from model card):**
+```json
+{claimed_str}
+```
+
+**Notebook names:** {names_str}
+
+**Notebook Output Cells:**
+
+{notebook_sections}
+Extract the metrics now:"""
+
+        return prompt
+
+    def _extract_with_openai(self, prompt: str,
+                             max_tokens: int = _EXTRACT_MAX_TOKENS) -> Dict[str, Any]:
         """Extract metrics using OpenAI/OpenRouter."""
+        cache_key = self._extraction_cache_key(prompt, max_tokens)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             content = self._call_openai_api(
                 messages=[
-                    {"role": "system", "content": "You are a precise metric extraction assistant. Always return valid JSON."},
+                    {"role": "system", "content": _EXTRACTION_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.1,
-                max_tokens=1500,
-                use_json_format=True
+                max_tokens=max_tokens,
+                use_json_format=True,
+                json_schema=self._openai_metrics_schema(batch=False)
             )
             
             # Parse JSON
-            metrics = json.loads(content)
+            metrics = _metrics_from_list(json_utils.loads(content))
+            self.response_cache.set(cache_key, metrics)
             return metrics
             
         except Exception as e:
@@ -447,78 +1539,130 @@ Extract the metrics now:"""
             # Log more details for OpenRouter errors
             if self.llm_provider == "openrouter":
                 print(f"OpenRouter API error details - Model: {self.model}, Error: {error_msg}")
-            import traceback
             print(f"Traceback: {traceback.format_exc()}")
             return {}
 
-    def _extract_with_anthropic(self, prompt: str) -> Dict[str, Any]:
+    async def _aextract_with_openai(self, client, prompt: str,
+                                    max_tokens: int = _EXTRACT_MAX_TOKENS,
+                                    batch: bool = False) -> Dict[str, Any]:
+        """Async version of _extract_with_openai."""
+        cache_key = self._extraction_cache_key(prompt, max_tokens)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            content = await self._acall_openai_api(
+                client,
+                messages=[
+                    {"role": "system", "content": _EXTRACTION_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.1,
+                max_tokens=max_tokens,
+                use_json_format=True,
+                json_schema=self._openai_metrics_schema(batch)
+            )
+            result = json_utils.loads(content)
+            metrics = _batch_metrics_from_list(result) if batch else _metrics_from_list(result)
+            self.response_cache.set(cache_key, metrics)
+            return metrics
+
+        except Exception as e:
+            error_msg = str(e)
+            print(f"OpenAI/OpenRouter extraction error: {error_msg}")
+            if self.llm_provider == "openrouter":
+                print(f"OpenRouter API error details - Model: {self.model}, Error: {error_msg}")
+            print(f"Traceback: {traceback.format_exc()}")
+            return {}
+
+    async def _aextract_with_anthropic(self, client, prompt: str,
+                                       max_tokens: int = _EXTRACT_MAX_TOKENS,
+                                       batch: bool = False) -> Dict[str, Any]:
+        """Async version of _extract_with_anthropic."""
+        cache_key = self._extraction_cache_key(prompt, max_tokens)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            print(f"[DEBUG] Using cached Anthropic response ({len(cached)} keys)")
+            return cached
+
+        try:
+            print(f"[DEBUG] Making Anthropic API call (model: {self.model})...")
+            self._log_request_preview("Anthropic request", prompt, 0.1, max_tokens)
+            response = await self._acreate_message(
+                client,
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=0.1,
+                messages=[{"role": "user", "content": prompt}],
+                **self._anthropic_tool_params(batch)
+            )
+            print(f"[DEBUG] Anthropic API call successful. Response ID: {response.id}")
+
+            metrics = _tool_input(response)
+            print(f"[DEBUG] Successfully parsed JSON response with {len(metrics)} keys")
+            self.response_cache.set(cache_key, metrics)
+            return metrics
+
+        except Exception as e:
+            print(f"[ERROR] Anthropic extraction error: {type(e).__name__}: {e}")
+            print(f"[ERROR] Traceback: {traceback.format_exc()}")
+            return {}
+
+    def _extract_with_anthropic(self, prompt: str,
+                                max_tokens: int = _EXTRACT_MAX_TOKENS) -> Dict[str, Any]:
         """Extract metrics using Anthropic."""
         if not self.client:
             print("[ERROR] Anthropic client not initialized!")
             return {}
         
+        cache_key = self._extraction_cache_key(prompt, max_tokens)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            print(f"[DEBUG] Using cached Anthropic response ({len(cached)} keys)")
+            return cached
+
         try:
             print(f"[DEBUG] Making Anthropic API call (model: {self.model})...")
-            # Request preview logging (env: CLAIM_EXTRACT_LOG_REQUEST or LOG_REQUEST = off|truncated|full)
-            import os as _os
-            log_mode = (_os.environ.get("CLAIM_EXTRACT_LOG_REQUEST") or _os.environ.get("LOG_REQUEST") or "truncated").lower()
-            if log_mode in ("truncated", "full"):
-                def _trim(text: str) -> str:
-                    return text if log_mode == "full" else (text[:500] + ("..." if len(text) > 500 else ""))
-                req_preview = {
-                    "provider": self.llm_provider,
-                    "model": self.model,
-                    "temperature": 0.1,
-                    "max_tokens": 8000,
-                    "messages": [{"role": "user", "content": _trim(prompt)}]
-                }
-                print(f"[DEBUG] Anthropic request preview: {req_preview}")
-            response = self.client.messages.create(
+            self._log_request_preview("Anthropic request", prompt, 0.1, max_tokens)
+            response = self._create_message(
                 model=self.model,
-                max_tokens=8000,
+                max_tokens=max_tokens,
                 temperature=0.1,
                 messages=[
                     {"role": "user", "content": prompt}
-                ]
+                ],
+                **self._anthropic_tool_params(batch=False)
             )
             
             print(f"[DEBUG] Anthropic API call successful. Response ID: {response.id}")
-            content = response.content[0].text
-            print(f"[DEBUG] Response length: {len(content)} chars")
             
-            # Extract JSON from response
-            # Anthropic might wrap it in markdown
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            elif "```" in content:
-                start = content.find("```") + 3
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            
-            # Parse JSON
-            metrics = json.loads(content)
+            # Metrics arrive as the forced tool call's input
+            metrics = _tool_input(response)
             print(f"[DEBUG] Successfully parsed JSON response with {len(metrics)} keys")
+            self.response_cache.set(cache_key, metrics)
             return metrics
             
         except Exception as e:
             print(f"[ERROR] Anthropic extraction error: {type(e).__name__}: {e}")
-            import traceback
             print(f"[ERROR] Traceback: {traceback.format_exc()}")
             return {}
 
     def search_in_outputs(
         self,
         notebook_paths: List[str],
-        search_query: str
+        search_query: str,
+        max_workers: int = 5
     ) -> List[Dict[str, Any]]:
         """
         Full-text search in notebook outputs using LLM for context-aware results.
         
+        Notebooks are searched concurrently; findings are returned in notebook order.
+
         Args:
             notebook_paths: List of notebook file paths
             search_query: Natural language search query
+            max_workers: Maximum number of concurrent LLM requests (default: 5)
             
         Returns:
             List of relevant findings with context
@@ -526,28 +1670,31 @@ Extract the metrics now:"""
         if not self.client:
             return [{"error": "LLM client not initialized"}]
         
-        results = []
+        def search_notebook(nb_path: str) -> List[Dict[str, Any]]:
+            outputs_text = self._read_notebook_outputs(nb_path)
+            if not outputs_text:
+                return []
+            # Use LLM for semantic search
+            return self._llm_search(
+                outputs_text=outputs_text,
+                query=search_query,
+                notebook_name=Path(nb_path).name
+            )
         
-        for nb_path in notebook_paths:
-            try:
-                outputs_text = self._read_notebook_outputs(nb_path)
-                
-                if not outputs_text:
+        results = []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            # Submit everything first so all requests are in flight before waiting on any
+            futures = [
+                (nb_path, executor.submit(search_notebook, nb_path)) for nb_path in notebook_paths
+            ]
+            for nb_path, future in futures:
+                try:
+                    findings = future.result()
+                except Exception as e:
+                    print(f"Error searching {nb_path}: {e}")
                     continue
-                
-                # Use LLM for semantic search
-                findings = self._llm_search(
-                    outputs_text=outputs_text,
-                    query=search_query,
-                    notebook_name=Path(nb_path).name
-                )
-                
                 if findings:
                     results.extend(findings)
-                    
-            except Exception as e:
-                print(f"Error searching {nb_path}: {e}")
-                continue
         
         return results
 
@@ -560,9 +1707,7 @@ Extract the metrics now:"""
         """Use LLM for semantic search in outputs."""
         
         # Truncate if too long
-        max_length = 8000
-        if len(outputs_text) > max_length:
-            outputs_text = outputs_text[:max_length] + "\n... [truncated]"
+        outputs_text = self._trim_to_tokens(outputs_text)
         
         prompt = f"""You are searching through Jupyter notebook outputs for specific information.
 
@@ -596,16 +1741,21 @@ Search now:"""
 
         try:
             if self.llm_provider in ["openai", "openrouter"]:
-                content = self._call_openai_api(
-                    messages=[
-                    {"role": "system", "content": "You are a search assistant. Return valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=1500,
-                use_json_format=True
-            )
-                result = json.loads(content)
+                system = "You are a search assistant. Return valid JSON."
+                cache_key = self._response_cache_key(system, prompt, 0.3, _SEARCH_MAX_TOKENS)
+                result = self.response_cache.get(cache_key)
+                if result is None:
+                    content = self._call_openai_api(
+                        messages=[
+                            {"role": "system", "content": system},
+                            {"role": "user", "content": prompt}
+                        ],
+                        temperature=0.3,
+                        max_tokens=_SEARCH_MAX_TOKENS,
+                        use_json_format=True
+                    )
+                    result = json_utils.loads(content)
+                    self.response_cache.set(cache_key, result)
                 
                 # Handle if wrapped in object
                 if isinstance(result, dict) and "results" in result:
@@ -616,24 +1766,17 @@ Search now:"""
                     return []
                     
             elif self.llm_provider == "anthropic":
+                cache_key = self._response_cache_key(None, prompt, 0.3, _SEARCH_MAX_TOKENS)
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    return cached
                 print(f"[DEBUG] Making Anthropic search API call (model: {self.model})...")
-                # Request preview logging (env: CLAIM_EXTRACT_LOG_REQUEST or LOG_REQUEST = off|truncated|full)
-                import os as _os
-                log_mode = (_os.environ.get("CLAIM_EXTRACT_LOG_REQUEST") or _os.environ.get("LOG_REQUEST") or "truncated").lower()
-                if log_mode in ("truncated", "full"):
-                    def _trim(text: str) -> str:
-                        return text if log_mode == "full" else (text[:500] + ("..." if len(text) > 500 else ""))
-                    req_preview = {
-                        "provider": self.llm_provider,
-                        "model": self.model,
-                        "temperature": 0.3,
-                        "max_tokens": 8000,
-                        "messages": [{"role": "user", "content": _trim(prompt)}]
-                    }
-                    print(f"[DEBUG] Anthropic search request preview: {req_preview}")
-                response = self.client.messages.create(
+                self._log_request_preview(
+                    "Anthropic search request", prompt, 0.3, _SEARCH_MAX_TOKENS
+                )
+                response = self._create_message(
                     model=self.model,
-                    max_tokens=2000,
+                    max_tokens=_SEARCH_MAX_TOKENS,
                     temperature=0.3,
                     messages=[{"role": "user", "content": prompt}]
                 )
@@ -641,17 +1784,9 @@ Search now:"""
                 content = response.content[0].text
                 print(f"[DEBUG] Search response length: {len(content)} chars")
                 
-                # Extract JSON
-                if "```json" in content:
-                    start = content.find("```json") + 7
-                    end = content.find("```", start)
-                    content = content[start:end].strip()
-                elif "```" in content:
-                    start = content.find("```") + 3
-                    end = content.find("```", start)
-                    content = content[start:end].strip()
-                
-                return json.loads(content)
+                findings = json_utils.loads(_extract_json_text(content))
+                self.response_cache.set(cache_key, findings)
+                return findings
                 
         except Exception as e:
             error_msg = str(e)
@@ -659,14 +1794,14 @@ Search now:"""
             # Log more details for OpenRouter errors
             if self.llm_provider == "openrouter":
                 print(f"OpenRouter API error details - Model: {self.model}, Error: {error_msg}")
-            import traceback
             print(f"Traceback: {traceback.format_exc()}")
             return []
 
     def validate_claim_with_outputs(
         self,
         claim: str,
-        notebook_paths: List[str]
+        notebook_paths: List[str],
+        max_workers: int = 5
     ) -> Dict[str, Any]:
         """
         Validate a specific claim against notebook outputs using LLM.
@@ -674,6 +1809,8 @@ Search now:"""
         Args:
             claim: Claim from model card to validate
             notebook_paths: Notebooks to check
+            max_workers: Maximum number of concurrent LLM requests when notebooks
+                are validated one per request (default: 5)
             
         Returns:
             Validation result with evidence
@@ -681,31 +1818,86 @@ Search now:"""
         if not self.client:
             return {"error": "LLM client not initialized"}
         
-        evidence = []
-        
+        notebooks = []
         for nb_path in notebook_paths:
             try:
                 outputs_text = self._read_notebook_outputs(nb_path)
-                
-                if not outputs_text:
+            except Exception as e:
+                print(f"Error reading {nb_path}: {e}")
+                continue
+            if outputs_text:
+                notebooks.append((Path(nb_path).name, self._trim_to_tokens(outputs_text)))
+
+        # One request for all notebooks when they fit together, otherwise one per notebook
+        combined_tokens = sum(self._count_tokens(outputs_text) for _, outputs_text in notebooks)
+        if len(notebooks) > 1 and combined_tokens <= _VALIDATE_COMBINED_TOKEN_BUDGET:
+            groups = [notebooks]
+        else:
+            groups = [[notebook] for notebook in notebooks]
+
+        evidence = []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                (group, executor.submit(self._llm_validate_claim, claim, group))
+                for group in groups
+            ]
+            for group, future in futures:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    error_msg = str(e)
+                    names = ", ".join(name for name, _ in group)
+                    print(f"Error validating against {names}: {error_msg}")
+                    # Log more details for OpenRouter errors
+                    if self.llm_provider == "openrouter":
+                        print(f"OpenRouter API error details - Model: {self.model}, "
+                              f"Error: {error_msg}")
+                        print(f"Traceback: {traceback.format_exc()}")
                     continue
-                
-                # Truncate
-                max_length = 8000
-                if len(outputs_text) > max_length:
-                    outputs_text = outputs_text[:max_length] + "\n... [truncated]"
-                
-                prompt = f"""Validate a claim from a model card against notebook outputs.
+                if result is None:
+                    continue
+                if len(group) == 1:
+                    result["notebook"] = group[0][0]
+                evidence.append(result)
+
+        # Aggregate results
+        if not evidence:
+            return {"status": "unverifiable", "confidence": 0.0, "evidence": []}
+
+        # Return strongest evidence
+        evidence.sort(key=lambda x: x.get("confidence", 0), reverse=True)
+        return {
+            "claim": claim,
+            "validation": evidence[0],
+            "all_evidence": evidence
+        }
+
+    def _llm_validate_claim(self, claim: str, notebooks: List[tuple]) -> Optional[Dict[str, Any]]:
+        """
+        Ask the LLM whether a claim is supported by one or more notebooks' outputs.
+
+        Args:
+            claim: Claim from model card to validate
+            notebooks: (notebook name, trimmed outputs text) pairs
+
+        Returns:
+            Parsed verdict, or None if the provider is not supported
+        """
+        if self.llm_provider not in ["openai", "openrouter"]:
+            return None
+
+        sections = "\n".join(
+            f"### Notebook: {name}\n```\n{outputs_text}\n```\n" for name, outputs_text in notebooks
+        )
+        prompt = f"""Validate a claim from a model card against notebook outputs.
 
 **Claim:** {claim}
 
 **Notebook Outputs:**
-```
-{outputs_text}
-```
-
+{sections}
 **Task:**
 Determine if the claim is supported, contradicted, or unverifiable from the outputs.
+If several notebooks are given, report the single strongest piece of evidence.
 
 **Output Format:**
 ```json
@@ -713,45 +1905,27 @@ Determine if the claim is supported, contradicted, or unverifiable from the outp
   "status": "supported|contradicted|unverifiable",
   "confidence": 0.0-1.0,
   "evidence": "Quote from outputs that supports or contradicts",
+  "notebook": "Name of the notebook the evidence comes from",
   "explanation": "Brief explanation of reasoning"
 }}
 ```
 
 Validate now:"""
-
-                if self.llm_provider in ["openai", "openrouter"]:
-                    content = self._call_openai_api(
-                        messages=[
-                            {"role": "system", "content": "You are a fact-checking assistant. Return valid JSON."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.2,
-                        max_tokens=1200,
-                        use_json_format=True
-                    )
-                    result = json.loads(content)
-                    result["notebook"] = Path(nb_path).name
-                    evidence.append(result)
-                    
-            except Exception as e:
-                error_msg = str(e)
-                print(f"Error validating against {nb_path}: {error_msg}")
-                # Log more details for OpenRouter errors
-                if self.llm_provider == "openrouter":
-                    print(f"OpenRouter API error details - Model: {self.model}, Error: {error_msg}")
-                import traceback
-                print(f"Traceback: {traceback.format_exc()}")
-                continue
         
-        # Aggregate results
-        if not evidence:
-            return {"status": "unverifiable", "confidence": 0.0, "evidence": []}
-        
-        # Return strongest evidence
-        evidence.sort(key=lambda x: x.get("confidence", 0), reverse=True)
-        return {
-            "claim": claim,
-            "validation": evidence[0],
-            "all_evidence": evidence
-        }
+        system = "You are a fact-checking assistant. Return valid JSON."
+        cache_key = self._response_cache_key(system, prompt, 0.2, _VALIDATE_MAX_TOKENS)
+        result = self.response_cache.get(cache_key)
+        if result is None:
+            content = self._call_openai_api(
+                messages=[
+                    {"role": "system", "content": system},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.2,
+                max_tokens=_VALIDATE_MAX_TOKENS,
+                use_json_format=True
+            )
+            result = json_utils.loads(content)
+            self.response_cache.set(cache_key, result)
+        return result
 
@@ -0,0 +1,196 @@
+"""On-disk caches for parsed LLM responses (exact-match and embedding-similarity)."""
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+from . import json_utils
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Default lifetime (seconds) of cached LLM responses: 7 days, after which a model
+# updated behind the same name is asked again
+RESPONSE_CACHE_MAX_AGE = 7 * 24 * 3600
+
+
+class LLMResponseCache:
+    """
+    Cache of parsed LLM responses keyed by the full request (model, prompts, sampling).
+
+    Entries are stored as one JSON file per key under ``directory``. Extraction
+    calls run at low temperature, so a repeated request (e.g. re-validating the
+    same notebooks) can reuse the earlier answer instead of another round trip.
+    Entries older than ``max_age`` are treated as misses and overwritten, so a
+    model updated behind the same name is eventually asked again.
+    """
+
+    def __init__(self, directory: Path, enabled: bool = True, max_age: Optional[float] = None):
+        """
+        Args:
+            directory: Directory holding the cache files (created on first write)
+            enabled: When False, every lookup misses and nothing is written
+            max_age: Seconds an entry stays valid (None = never expires)
+        """
+        self.directory = Path(directory)
+        self.enabled = enabled
+        self.max_age = max_age
+
+    @staticmethod
+    def make_key(model: str, system: Optional[str], prompt: str, **params: Any) -> str:
+        """Build a cache key from everything that determines the response."""
+        request = {"model": model, "system": system, "prompt": prompt, **params}
+        payload = json_utils.dumps(dict(sorted(request.items())))
+        return hashlib.sha256(payload).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for ``key``, or None on a miss."""
+        if not self.enabled:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                if self.max_age is not None:
+                    age = time.time() - os.fstat(f.fileno()).st_mtime
+                    if age > self.max_age:
+                        return None
+                return json_utils.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[WARN] Ignoring unreadable LLM cache entry {key[:16]}: {e}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a parsed response (atomic write via os.replace)."""
+        if not self.enabled:
+            return
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".json.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(json_utils.dumps(value))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARN] Failed to write LLM cache entry {key[:16]}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+class SemanticResponseCache:
+    """
+    Near-duplicate cache: reuses a response when the input's embedding is close enough.
+
+    Embeddings are stored L2-normalized in a numpy matrix (persisted with
+    ``numpy.savez``), so a lookup is one matrix-vector product. Responses are
+    kept alongside as JSON strings. ``set`` only records entries in memory;
+    ``save`` writes the whole index once (e.g. at the end of a run). Requires numpy.
+    """
+
+    def __init__(self, path: Path, threshold: float = 0.95):
+        """
+        Args:
+            path: ``.npz`` file backing the index (loaded lazily, written by save())
+            threshold: Minimum cosine similarity for a hit
+        """
+        if np is None:
+            raise ImportError("numpy is required for the semantic cache")
+        self.path = Path(path)
+        self.threshold = threshold
+        self._embeddings = None
+        # Rows added since the last lookup, stacked into _embeddings lazily
+        self._pending: List[Any] = []
+        self._values: List[str] = []
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        if self._embeddings is not None:
+            return
+        try:
+            with np.load(self.path) as data:
+                self._embeddings = data["embeddings"]
+                self._values = [str(v) for v in data["values"]]
+        except FileNotFoundError:
+            self._embeddings = np.empty((0, 0), dtype=np.float32)
+        except Exception as e:
+            print(f"[WARN] Ignoring unreadable semantic cache {self.path}: {e}")
+            self._embeddings = np.empty((0, 0), dtype=np.float32)
+
+    def _stack_pending(self) -> None:
+        """Append pending rows to the embedding matrix in one copy (lock held)."""
+        if not self._pending:
+            return
+        rows = self._embeddings
+        if not rows.shape[0]:
+            rows = np.empty((0, self._pending[0].shape[0]), dtype=np.float32)
+        self._embeddings = np.vstack([rows, *self._pending])
+        self._pending = []
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]):
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, embedding: Sequence[float]) -> Optional[Any]:
+        """Return the response stored for the most similar embedding, if above threshold."""
+        query = self._normalize(embedding)
+        with self._lock:
+            self._load()
+            self._stack_pending()
+            if not self._values or self._embeddings.shape[1] != query.shape[0]:
+                return None
+            similarities = self._embeddings @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            value = self._values[best]
+        return json_utils.loads(value)
+
+    def set(self, embedding: Sequence[float], value: Any) -> None:
+        """Add an entry in memory; it is written to disk by the next save()."""
+        vector = self._normalize(embedding)
+        with self._lock:
+            self._load()
+            if self._pending:
+                dimension = self._pending[0].shape[0]
+            else:
+                dimension = self._embeddings.shape[1] if self._embeddings.shape[0] else None
+            if dimension is not None and dimension != vector.shape[0]:
+                # Embedding model changed; start a fresh index
+                self._embeddings = np.empty((0, vector.shape[0]), dtype=np.float32)
+                self._pending = []
+                self._values = []
+            self._pending.append(vector)
+            self._values.append(json_utils.dumps(value).decode("utf-8"))
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the index if entries were added (atomic write via os.replace)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._stack_pending()
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, 'wb') as f:
+                    np.savez(f, embeddings=self._embeddings, values=np.array(self._values))
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                print(f"[WARN] Failed to write semantic cache {self.path}: {e}")
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
@@ -0,0 +1,147 @@
+"""Retry helpers for transient LLM API failures (rate limits, timeouts, server errors)."""
+
+import asyncio
+import inspect
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import wraps
+from typing import Any, Callable, Optional
+
+# SDK exception class names that are safe to retry. Matched by name (including
+# base classes) so this module does not need to import openai/anthropic, which
+# are optional and imported lazily by the tools. APIConnectionError is the base
+# of APITimeoutError in both SDKs; InternalServerError covers their 5xx errors.
+# The SDKs retry these themselves too, so clients wrapped by retry_on_rate_limit
+# must be built with max_retries=0 to keep a single retry layer.
+RETRYABLE_ERROR_NAMES = {
+    "RateLimitError",
+    "APITimeoutError",
+    "APIConnectionError",
+    "InternalServerError",
+}
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """Get the HTTP status code attached to an SDK exception, if any."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Check whether an exception is a transient error worth retrying (429, 5xx, connection)."""
+    if any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(error).__mro__):
+        return True
+    status = _status_code(error)
+    return status is not None and (status == 429 or status >= 500)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an exception is a rate-limit (HTTP 429) response."""
+    if any(cls.__name__ == "RateLimitError" for cls in type(error).__mro__):
+        return True
+    return _status_code(error) == 429
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """
+    Read the server-requested delay (seconds) from a rate-limit response.
+
+    Supports ``retry-after-ms`` and ``retry-after`` (seconds or HTTP date).
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, initial: float = 1.0, maximum: float = 30.0) -> float:
+    """Exponential backoff with jitter for the given (0-based) attempt."""
+    return min(maximum, initial * (2 ** attempt) + random.uniform(0, 1))
+
+
+def retry_on_rate_limit(
+    max_attempts: int = 5,
+    initial: float = 1.0,
+    maximum: float = 30.0,
+    max_elapsed: Optional[float] = 120.0,
+    log: Callable[[str], None] = print,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator that retries an LLM API call on rate-limit, timeout, connection
+    and 5xx server errors.
+
+    Sleeps for the server's ``retry-after`` when provided (capped at ``maximum``),
+    otherwise uses exponential backoff with jitter. Non-retryable errors are raised
+    immediately, and the last error is raised once another wait would exceed
+    ``max_elapsed``. Works on both regular and ``async def`` functions (the latter
+    sleep without blocking the event loop).
+
+    Args:
+        max_attempts: Total attempts including the first call
+        initial: Initial backoff in seconds
+        maximum: Maximum backoff in seconds (also caps the server's retry-after)
+        max_elapsed: Overall time budget in seconds for one call, including its
+            attempts and waits (None = bounded only by max_attempts)
+        log: Function used to report retries
+    """
+    def retry_delay(error: Exception, attempt: int, started: float) -> float:
+        """Delay before the next attempt; re-raises when the error should not be retried."""
+        if attempt + 1 >= max_attempts or not is_retryable_error(error):
+            raise error
+        delay = get_retry_after(error)
+        if delay is None:
+            delay = backoff_delay(attempt, initial, maximum)
+        else:
+            # A huge or bogus retry-after must not park the caller for minutes
+            delay = min(delay, maximum)
+        if max_elapsed is not None and time.monotonic() - started + delay > max_elapsed:
+            raise error
+        log(f"[WARN] {type(error).__name__} from LLM API, retrying in {delay:.1f}s "
+            f"(attempt {attempt + 1}/{max_attempts})")
+        return delay
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started = time.monotonic()
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        await asyncio.sleep(retry_delay(e, attempt, started))
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.monotonic()
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    time.sleep(retry_delay(e, attempt, started))
+        return wrapper
+    return decorator
@@ -0,0 +1,172 @@
+"""Client-side request/token throttling for concurrent LLM calls."""
+
+import asyncio
+import threading
+import time
+from typing import Mapping, Optional
+
+# Rate-limit headers, as (remaining, limit) pairs, for OpenAI-compatible APIs
+# and Anthropic. Both providers report per-minute windows.
+_REQUEST_HEADERS = (
+    ("x-ratelimit-remaining-requests", "x-ratelimit-limit-requests"),
+    ("anthropic-ratelimit-requests-remaining", "anthropic-ratelimit-requests-limit"),
+)
+_TOKEN_HEADERS = (
+    ("x-ratelimit-remaining-tokens", "x-ratelimit-limit-tokens"),
+    ("anthropic-ratelimit-input-tokens-remaining", "anthropic-ratelimit-input-tokens-limit"),
+    ("anthropic-ratelimit-tokens-remaining", "anthropic-ratelimit-tokens-limit"),
+)
+# RateLimiter bucket attribute -> headers that calibrate it
+_BUCKET_HEADERS = (("_requests", _REQUEST_HEADERS), ("_tokens", _TOKEN_HEADERS))
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    """Read an integer header value, or None if missing or malformed."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+class _Bucket:
+    """Token bucket holding up to ``per_minute`` units, refilled continuously."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.capacity / 60.0)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` units are available (0 if available now)."""
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) * 60.0 / self.capacity
+
+    def sync(self, remaining: Optional[int], limit: Optional[int]) -> None:
+        """Adopt the server's view of the window (remaining can only lower the level)."""
+        if limit:
+            self.capacity = float(limit)
+        if remaining is not None:
+            self.level = min(self.level, float(remaining))
+
+
+class RateLimiter:
+    """
+    Proactive requests-per-minute / tokens-per-minute throttle.
+
+    Each call reserves one request and its estimated tokens before being sent,
+    waiting only when a bucket is empty. Limits can be given up front, and are
+    otherwise learned (and kept in sync) from the provider's rate-limit response
+    headers; a bucket with no known limit never blocks.
+    """
+
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0):
+        """
+        Args:
+            requests_per_minute: Request budget per minute (0 = learn from headers)
+            tokens_per_minute: Token budget per minute (0 = learn from headers)
+        """
+        self._requests = _Bucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = _Bucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        # Guards bucket state; reservations never await while holding it
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        """Take one request and ``tokens`` if available; otherwise return the wait in seconds."""
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            for bucket, amount in ((self._requests, 1), (self._tokens, tokens)):
+                if bucket is not None:
+                    bucket.refill(now)
+                    wait = max(wait, bucket.wait_time(amount))
+            if wait > 0:
+                return wait
+            if self._requests is not None:
+                self._requests.level -= 1
+            if self._tokens is not None:
+                self._tokens.level -= min(tokens, self._tokens.capacity)
+            return 0.0
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """
+        Wait until a request of ``tokens`` estimated tokens fits in the budget.
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def update_from_headers(self, headers: Optional[Mapping[str, str]]) -> None:
+        """Recalibrate the buckets from a response's rate-limit headers."""
+        if not headers:
+            return
+        with self._lock:
+            now = time.monotonic()
+            for attr, header_pairs in _BUCKET_HEADERS:
+                for remaining_name, limit_name in header_pairs:
+                    remaining = _header_int(headers, remaining_name)
+                    limit = _header_int(headers, limit_name)
+                    if remaining is None and limit is None:
+                        continue
+                    bucket = getattr(self, attr)
+                    if bucket is None:
+                        if not limit:
+                            break
+                        bucket = _Bucket(limit)
+                        setattr(self, attr, bucket)
+                    bucket.refill(now)
+                    bucket.sync(remaining, limit)
+                    break
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Async concurrency limit tuned by AIMD (additive increase, multiplicative decrease).
+
+    Used as ``async with limiter:`` around each request. The limit starts at
+    ``maximum``, is halved whenever the provider rate-limits a request, and grows
+    back by one per successful request. Create one per event loop (e.g. per
+    extraction run).
+    """
+
+    def __init__(self, maximum: int, minimum: int = 1):
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.limit = self.maximum
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self) -> None:
+        """Additive increase after a request went through."""
+        self.limit = min(self.maximum, self.limit + 1)
+
+    def on_rate_limit(self) -> int:
+        """Multiplicative decrease after a rate-limit response; returns the new limit."""
+        self.limit = max(self.minimum, self.limit // 2)
+        return self.limit
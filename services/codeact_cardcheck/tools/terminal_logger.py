@@ -2,8 +2,8 @@
 
 import sys
 from datetime import datetime
-from typing import Optional, Dict, Any
 from enum import Enum
+from typing import Any, Dict, Optional
 
 
 class LogLevel(Enum):
@@ -65,6 +65,10 @@ class TerminalLogger:
         """Check if message should be logged based on min_level."""
         return self._level_order.get(level, 1) >= self._level_order.get(self.min_level, 1)
     
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check whether messages at this level are displayed (to skip building them)."""
+        return self._should_log(level)
+
     def _format_message(self, level: LogLevel, message: str, data: Optional[Dict[str, Any]] = None) -> str:
         """Format log message with colors and structure."""
         if not self._should_log(level):
@@ -2,10 +2,32 @@
 
 import hashlib
 import json
-from pathlib import Path
-from typing import Dict, Any, Optional, List
 import xml.etree.ElementTree as ET
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Characters encoded per hashlib update; bounds the temporary UTF-8 buffer
+_HASH_BLOCK_CHARS = 1 << 20
+
+
+@lru_cache(maxsize=4)
+def sha256_text(content: str) -> str:
+    """
+    Compute the SHA256 hex digest of a string's UTF-8 encoding.
+
+    Memoized because one extraction run looks up and saves the same model card
+    in several caches; each lookup would otherwise re-encode and re-hash the text.
+    The text is encoded in fixed-size blocks so hashing a multi-MB card never
+    materializes a full second copy of it as bytes.
+    """
+    if len(content) <= _HASH_BLOCK_CHARS:
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    digest = hashlib.sha256()
+    for start in range(0, len(content), _HASH_BLOCK_CHARS):
+        digest.update(content[start:start + _HASH_BLOCK_CHARS].encode('utf-8'))
+    return digest.hexdigest()
 
 
 class XMLCache:
@@ -32,12 +54,17 @@ class XMLCache:
             home = Path.home()
             self.cache_dir = home / ".cache" / "cardcheck" / "xml"
         
-        # Create cache directory if it doesn't exist
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create metadata directory for tracking cache entries
+        # Metadata directory for tracking cache entries
         self.metadata_dir = self.cache_dir / "metadata"
-        self.metadata_dir.mkdir(exist_ok=True)
+
+        # Directories are created on first write, so constructing a cache is free
+        self._dirs_ready = False
+
+    def _ensure_dirs(self) -> None:
+        """Create the cache and metadata directories if they don't exist yet."""
+        if not self._dirs_ready:
+            self.metadata_dir.mkdir(parents=True, exist_ok=True)
+            self._dirs_ready = True
     
     def _compute_hash(self, content: str) -> str:
         """
@@ -49,7 +76,7 @@ class XMLCache:
         Returns:
             Hex digest of hash
         """
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return sha256_text(content)
     
     def _get_cache_path(self, cache_key: str) -> Path:
         """Get path to cache file for given key."""
@@ -147,6 +174,7 @@ class XMLCache:
         """
         cache_key = self._compute_hash(model_card_text)
         cache_path = self._get_cache_path(cache_key)
+        self._ensure_dirs()
         
         # Convert claims to XML
         xml_str = self._dict_to_xml(claims)
@@ -304,9 +332,8 @@ class XMLCache:
         else:
             # Clear entire cache
             import shutil
-            shutil.rmtree(self.cache_dir)
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-            self.metadata_dir.mkdir(exist_ok=True)
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self._dirs_ready = False
     
     def list_cached_entries(self) -> List[Dict[str, Any]]:
         """